@@ -0,0 +1,40 @@
+"""Add llm_cache_entries table
+
+Revision ID: 3b8e51c0a7d2
+Revises: 208ec29c043f
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e51c0a7d2'
+down_revision: Union[str, None] = '208ec29c043f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Durable fallback store for cached Claude responses
+    op.create_table('llm_cache_entries',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('stage', sa.String(length=50), nullable=True),
+    sa.Column('response', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_accessed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_llm_cache_entries_last_accessed_at', 'llm_cache_entries', ['last_accessed_at'])
+    op.create_index('ix_llm_cache_entries_expires_at', 'llm_cache_entries', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_llm_cache_entries_expires_at', table_name='llm_cache_entries')
+    op.drop_index('ix_llm_cache_entries_last_accessed_at', table_name='llm_cache_entries')
+    op.drop_table('llm_cache_entries')
@@ -0,0 +1,33 @@
+"""Add failed_stage and error_message to analyses
+
+Revision ID: 9c41d2e7f5ab
+Revises: 3b8e51c0a7d2
+Create Date: 2026-10-17 11:02:17.604931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41d2e7f5ab'
+down_revision: Union[str, None] = '3b8e51c0a7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Record which pipeline step failed and why
+    op.add_column('video_analyses', sa.Column('failed_stage', sa.String(length=50), nullable=True))
+    op.add_column('video_analyses', sa.Column('error_message', sa.Text(), nullable=True))
+    op.add_column('project_analyses', sa.Column('failed_stage', sa.String(length=50), nullable=True))
+    op.add_column('project_analyses', sa.Column('error_message', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('project_analyses', 'error_message')
+    op.drop_column('project_analyses', 'failed_stage')
+    op.drop_column('video_analyses', 'error_message')
+    op.drop_column('video_analyses', 'failed_stage')
@@ -0,0 +1,32 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: a5d2e8c4f917
+Revises: f3c9a1d7e846
+Create Date: 2026-10-17 19:11:52.083416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d2e8c4f917'
+down_revision: Union[str, None] = 'f3c9a1d7e846'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pages ordered by (created_at, id) / (uploaded_at, id) DESC become index range scans
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'])
+    op.create_index('ix_videos_project_id_uploaded_at_id', 'videos', ['project_id', 'uploaded_at', 'id'])
+    # Covered by the composite index's leading column
+    op.drop_index('ix_videos_project_id', table_name='videos')
+
+
+def downgrade() -> None:
+    op.create_index('ix_videos_project_id', 'videos', ['project_id'])
+    op.drop_index('ix_videos_project_id_uploaded_at_id', table_name='videos')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
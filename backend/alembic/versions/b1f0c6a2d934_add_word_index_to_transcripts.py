@@ -0,0 +1,28 @@
+"""Add word_index to transcripts
+
+Revision ID: b1f0c6a2d934
+Revises: 9c41d2e7f5ab
+Create Date: 2026-10-17 14:20:41.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1f0c6a2d934'
+down_revision: Union[str, None] = '9c41d2e7f5ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Inverted index for local word search (backfilled lazily on first search)
+    op.add_column('transcripts', sa.Column('word_index', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('transcripts', 'word_index')
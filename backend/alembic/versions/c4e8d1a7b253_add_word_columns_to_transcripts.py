@@ -0,0 +1,30 @@
+"""Add columnar word encodings to transcripts
+
+Revision ID: c4e8d1a7b253
+Revises: b1f0c6a2d934
+Create Date: 2026-10-17 15:03:12.884730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8d1a7b253'
+down_revision: Union[str, None] = 'b1f0c6a2d934'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Precomputed word timing for the words endpoint (backfilled lazily on first request)
+    op.add_column('transcripts', sa.Column('word_columns', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('transcripts', sa.Column('word_columns_packed', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('transcripts', 'word_columns_packed')
+    op.drop_column('transcripts', 'word_columns')
@@ -0,0 +1,27 @@
+"""Add word_starts to transcripts
+
+Revision ID: d7a3f9e2c418
+Revises: c4e8d1a7b253
+Create Date: 2026-10-17 15:41:55.201649
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f9e2c418'
+down_revision: Union[str, None] = 'c4e8d1a7b253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Packed word start times for time-window queries (backfilled lazily on first request)
+    op.add_column('transcripts', sa.Column('word_starts', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('transcripts', 'word_starts')
@@ -0,0 +1,31 @@
+"""Add updated_at to videos, transcripts and analyses
+
+Revision ID: e2b6c8f1a093
+Revises: d7a3f9e2c418
+Create Date: 2026-10-17 16:25:08.947126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6c8f1a093'
+down_revision: Union[str, None] = 'd7a3f9e2c418'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['videos', 'transcripts', 'video_analyses', 'project_analyses']
+
+
+def upgrade() -> None:
+    # Row version used to build ETags for conditional GETs
+    for table in TABLES:
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
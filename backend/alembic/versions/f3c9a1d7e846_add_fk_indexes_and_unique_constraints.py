@@ -0,0 +1,69 @@
+"""Add foreign key indexes and one-per-parent unique constraints
+
+Revision ID: f3c9a1d7e846
+Revises: e2b6c8f1a093
+Create Date: 2026-10-17 18:02:37.514920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a1d7e846'
+down_revision: Union[str, None] = 'e2b6c8f1a093'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _delete_duplicates(table: str, partition_by: str, keep_order: str) -> None:
+    """Delete all but the first row (by keep_order) of each partition_by group."""
+    op.execute(f"""
+        DELETE FROM {table}
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (PARTITION BY {partition_by} ORDER BY {keep_order}) AS position
+                FROM {table}
+            ) ranked
+            WHERE position > 1
+        )
+    """)
+
+
+def upgrade() -> None:
+    # "Get or create" code paths assume one row per parent; remove duplicates
+    # created by past races before enforcing it, keeping the most useful row
+    _delete_duplicates(
+        'transcripts', 'video_id',
+        "(status = 'completed') DESC, (raw_transcript IS NOT NULL) DESC, created_at DESC NULLS LAST, id"
+    )
+    _delete_duplicates(
+        'video_analyses', 'video_id',
+        "(status = 'completed') DESC, completed_at DESC NULLS LAST, started_at DESC NULLS LAST, id"
+    )
+    _delete_duplicates(
+        'speaker_labels', 'transcript_id, speaker_label',
+        "(assigned_name IS NOT NULL) DESC, (role IS NOT NULL) DESC, id"
+    )
+
+    op.create_unique_constraint('uq_transcripts_video_id', 'transcripts', ['video_id'])
+    op.create_unique_constraint('uq_video_analyses_video_id', 'video_analyses', ['video_id'])
+    # Also serves lookups by transcript_id alone (leading column)
+    op.create_unique_constraint(
+        'uq_speaker_labels_transcript_id_speaker_label', 'speaker_labels', ['transcript_id', 'speaker_label']
+    )
+    op.create_index('ix_videos_project_id', 'videos', ['project_id'])
+    # Latest analysis per project: WHERE project_id = ? ORDER BY started_at DESC
+    op.create_index(
+        'ix_project_analyses_project_id_started_at', 'project_analyses', ['project_id', 'started_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_analyses_project_id_started_at', table_name='project_analyses')
+    op.drop_index('ix_videos_project_id', table_name='videos')
+    op.drop_constraint('uq_speaker_labels_transcript_id_speaker_label', 'speaker_labels', type_='unique')
+    op.drop_constraint('uq_video_analyses_video_id', 'video_analyses', type_='unique')
+    op.drop_constraint('uq_transcripts_video_id', 'transcripts', type_='unique')
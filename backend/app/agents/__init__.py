@@ -6,7 +6,12 @@ from app.agents.graph import (
     create_video_analysis_graph,
     create_project_analysis_graph,
 )
-from app.agents.states import VideoAnalysisState, ProjectAnalysisState
+from app.agents.states import (
+    VideoAnalysisState,
+    ProjectAnalysisState,
+    VIDEO_ANALYSIS_STAGES,
+    first_incomplete_stage,
+)
 
 __all__ = [
     "video_analysis_graph",
@@ -15,4 +20,6 @@ __all__ = [
     "create_project_analysis_graph",
     "VideoAnalysisState",
     "ProjectAnalysisState",
+    "VIDEO_ANALYSIS_STAGES",
+    "first_incomplete_stage",
 ]
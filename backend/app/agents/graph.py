@@ -3,7 +3,12 @@
 from langgraph.graph import StateGraph, END
 import logging
 
-from app.agents.states import VideoAnalysisState, ProjectAnalysisState
+from app.agents.states import (
+    VideoAnalysisState,
+    ProjectAnalysisState,
+    VIDEO_ANALYSIS_STAGES,
+    first_incomplete_stage,
+)
 from app.agents.nodes import (
     chunk_node,
     infer_node,
@@ -18,12 +23,38 @@ from app.agents.nodes import (
 logger = logging.getLogger(__name__)
 
 
+def route_on_error(next_node: str):
+    """
+    Build a router that continues to next_node, or ends the run on error.
+
+    Nodes catch their own exceptions and set "error"; without this every
+    later node would still run and fail with "No X available".
+    """
+    def route(state) -> str:
+        if state.get("error"):
+            logger.warning(f"Stopping graph after failed step: {state.get('current_step')}")
+            return END
+        return next_node
+
+    return route
+
+
+def route_video_entry(state: VideoAnalysisState) -> str:
+    """Start at the first stage without output, so resumed runs skip finished stages."""
+    return first_incomplete_stage(state) or END
+
+
 def create_video_analysis_graph() -> StateGraph:
     """
     Create the video analysis workflow graph.
 
     Flow: START -> chunk -> infer -> relate -> explain -> activate -> END
 
+    A step that sets "error" routes straight to END.
+
+    The entry point is the first stage whose output is still missing from
+    the initial state, which lets a failed run resume where it stopped.
+
     Returns:
         Compiled StateGraph for video analysis
     """
@@ -39,13 +70,15 @@ def create_video_analysis_graph() -> StateGraph:
     workflow.add_node("explain", explain_node)
     workflow.add_node("activate", activate_node)
 
-    # Define linear flow
-    workflow.set_entry_point("chunk")
-    workflow.add_edge("chunk", "infer")
-    workflow.add_edge("infer", "relate")
-    workflow.add_edge("relate", "explain")
-    workflow.add_edge("explain", "activate")
-    workflow.add_edge("activate", END)
+    # Enter at the first stage without output, then go stage by stage, ending early on error
+    workflow.set_conditional_entry_point(
+        route_video_entry,
+        {**{stage: stage for stage in VIDEO_ANALYSIS_STAGES}, END: END},
+    )
+    stages = list(VIDEO_ANALYSIS_STAGES)
+    for stage, next_stage in zip(stages, stages[1:]):
+        workflow.add_conditional_edges(stage, route_on_error(next_stage), {next_stage: next_stage, END: END})
+    workflow.add_edge(stages[-1], END)
 
     # Compile graph
     return workflow.compile()
@@ -57,6 +90,8 @@ def create_project_analysis_graph() -> StateGraph:
 
     Flow: START -> cross_relate -> cross_explain -> cross_activate -> END
 
+    A step that sets "error" routes straight to END.
+
     Returns:
         Compiled StateGraph for project analysis
     """
@@ -70,10 +105,14 @@ def create_project_analysis_graph() -> StateGraph:
     workflow.add_node("cross_explain", cross_explain_node)
     workflow.add_node("cross_activate", cross_activate_node)
 
-    # Define linear flow
+    # Go stage by stage, ending early on error
     workflow.set_entry_point("cross_relate")
-    workflow.add_edge("cross_relate", "cross_explain")
-    workflow.add_edge("cross_explain", "cross_activate")
+    workflow.add_conditional_edges(
+        "cross_relate", route_on_error("cross_explain"), {"cross_explain": "cross_explain", END: END}
+    )
+    workflow.add_conditional_edges(
+        "cross_explain", route_on_error("cross_activate"), {"cross_activate": "cross_activate", END: END}
+    )
     workflow.add_edge("cross_activate", END)
 
     # Compile graph
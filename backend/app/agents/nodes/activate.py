@@ -51,6 +51,8 @@ For each insight, create one or more design principles that provide strategic di
             system_prompt=ACTIVATE_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=8192,
+            stage="activate",
+            use_cache=state.get("use_cache", True),
         )
 
         # Validate response
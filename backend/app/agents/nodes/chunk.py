@@ -1,14 +1,189 @@
 """CHUNK node - Break transcript into discrete pieces."""
 
 import logging
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Optional, Set
 
 from app.agents.states import VideoAnalysisState
 from app.agents.prompts import CHUNK_SYSTEM_PROMPT
+from app.config import settings
+from app.services.async_claude_service import async_claude_service
 from app.services.claude_service import claude_service
 
 logger = logging.getLogger(__name__)
 
+CHUNK_MAX_TOKENS = 16384  # Increased for long transcripts
+
+
+def _format_transcript(utterances: List[Dict[str, Any]], speaker_labels: Dict[str, str]) -> str:
+    """Format utterances as "[start_ms] Speaker: text" lines for Claude."""
+    formatted_segments = []
+    for utterance in utterances:
+        speaker_id = utterance["speaker"]
+        speaker_name = speaker_labels.get(speaker_id, speaker_id)
+        timestamp = utterance["start"]
+        text = utterance["text"]
+
+        formatted_segments.append(
+            f"[{timestamp}] {speaker_name}: {text}"
+        )
+
+    return "\n\n".join(formatted_segments)
+
+
+def _build_user_message(transcript_text: str, speaker_labels: Dict[str, str]) -> str:
+    """Build the CHUNK user message for a (possibly partial) transcript."""
+    # Include speaker mapping in the message
+    speaker_mapping_text = "SPEAKER MAPPING:\n"
+    for speaker_id, speaker_name in speaker_labels.items():
+        speaker_mapping_text += f"- {speaker_id} = {speaker_name}\n"
+
+    return f"""Please analyze the following interview transcript and break it down into chunks.
+
+{speaker_mapping_text}
+
+TRANSCRIPT:
+{transcript_text}
+
+Remember:
+- Each chunk should be a single, discrete piece of information that cannot be broken down further without losing meaning.
+- Use the actual speaker names (not A, B, C) as shown in the transcript."""
+
+
+def _split_into_windows(
+    utterances: List[Dict[str, Any]],
+    window_ms: int,
+    overlap_ms: int,
+) -> List[Dict[str, Any]]:
+    """
+    Split utterances into consecutive time windows with overlapping context.
+
+    Each window owns a "core" time range; utterances within overlap_ms of the
+    core on either side are included as context so ideas that straddle a
+    boundary are seen whole by at least one window.
+
+    Returns:
+        List of {"core_start", "core_end", "utterances"} dicts in time order
+    """
+    if not utterances:
+        return []
+
+    last_end = max(utterance["end"] for utterance in utterances)
+    window_count = max(1, -(-last_end // window_ms))  # Ceiling division
+
+    windows = []
+    for index in range(window_count):
+        core_start = index * window_ms
+        core_end = (index + 1) * window_ms if index < window_count - 1 else float("inf")
+        windows.append({
+            "core_start": core_start,
+            "core_end": core_end,
+            "utterances": [
+                utterance for utterance in utterances
+                if utterance["end"] > core_start - overlap_ms and utterance["start"] < core_end + overlap_ms
+            ],
+        })
+
+    return [window for window in windows if window["utterances"]]
+
+
+def _parse_timestamp_ms(value: Any) -> Optional[int]:
+    """Parse a chunk timestamp ("123450", 123450 or "00:02:03") into milliseconds."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if not isinstance(value, str):
+        return None
+
+    value = value.strip().strip("[]")
+    if value.isdigit():
+        return int(value)
+
+    match = re.fullmatch(r"(?:(\d+):)?(\d{1,2}):(\d{1,2})(?:\.\d+)?", value)
+    if match:
+        hours, minutes, seconds = (int(part or 0) for part in match.groups())
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000
+    return None
+
+
+def _merge_window_chunks(
+    windows: List[Dict[str, Any]],
+    window_chunks: List[List[Dict[str, Any]]],
+    overlap_ms: int,
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-window chunks into one globally ordered list.
+
+    Chunks whose timestamp falls in the overlap margin of a neighbouring
+    window are left to that window. A chunk near the start of its window
+    (or without a parseable timestamp) is dropped only if the previous
+    window produced the same text near their shared boundary, so repeated
+    answers elsewhere in the interview are kept. chunk_ids are reassigned
+    sequentially.
+    """
+    merged = []
+    previous_edge: Set[str] = set()  # Texts the previous window produced near its core_end
+
+    for window, chunks in zip(windows, window_chunks):
+        current_edge: Set[str] = set()
+        for chunk in chunks:
+            timestamp = _parse_timestamp_ms(chunk.get("timestamp"))
+            if timestamp is None:
+                near_start = near_end = True
+            else:
+                in_previous_margin = window["core_start"] - overlap_ms <= timestamp < window["core_start"]
+                in_next_margin = window["core_end"] <= timestamp < window["core_end"] + overlap_ms
+                if in_previous_margin or in_next_margin:
+                    continue
+                near_start = timestamp < window["core_start"] + overlap_ms
+                near_end = timestamp >= window["core_end"] - overlap_ms
+
+            key = " ".join(str(chunk.get("text", "")).lower().split())
+            if near_start and key in previous_edge:
+                continue
+            if near_end:
+                current_edge.add(key)
+            merged.append(chunk)
+        previous_edge = current_edge
+
+    width = max(3, len(str(len(merged))))
+    for index, chunk in enumerate(merged, start=1):
+        chunk["chunk_id"] = f"C{index:0{width}d}"
+
+    return merged
+
+
+def _chunk_windowed(
+    utterances: List[Dict[str, Any]],
+    speaker_labels: Dict[str, str],
+    use_cache: bool,
+) -> List[Dict[str, Any]]:
+    """Chunk a long transcript window by window, running the windows concurrently."""
+    window_ms = settings.CHUNK_WINDOW_SECONDS * 1000
+    overlap_ms = settings.CHUNK_WINDOW_OVERLAP_SECONDS * 1000
+    windows = _split_into_windows(utterances, window_ms, overlap_ms)
+
+    logger.info(f"[CHUNK] Chunking {len(windows)} windows of {settings.CHUNK_WINDOW_SECONDS}s concurrently")
+
+    window_chunks = async_claude_service.run_all(
+        async_claude_service.call_with_json_response(
+            system_prompt=CHUNK_SYSTEM_PROMPT,
+            user_message=_build_user_message(
+                _format_transcript(window["utterances"], speaker_labels),
+                speaker_labels,
+            ),
+            max_tokens=CHUNK_MAX_TOKENS,
+            stage="chunk",
+            use_cache=use_cache,
+        )
+        for window in windows
+    )
+
+    for chunks in window_chunks:
+        if not isinstance(chunks, list):
+            raise ValueError("Expected list of chunks from Claude")
+
+    return _merge_window_chunks(windows, window_chunks, overlap_ms)
+
 
 def chunk_node(state: VideoAnalysisState) -> Dict[str, Any]:
     """
@@ -26,47 +201,27 @@ def chunk_node(state: VideoAnalysisState) -> Dict[str, Any]:
     logger.info(f"[CHUNK] Starting chunk analysis for video {state['video_id']}")
 
     try:
-        # Build user message with transcript data
         transcript = state["transcript"]
         speaker_labels = state.get("speaker_labels", {})
+        utterances = transcript.get("utterances", [])
+        use_cache = state.get("use_cache", True)
 
-        # Format transcript segments for Claude
-        formatted_segments = []
-        for utterance in transcript.get("utterances", []):
-            speaker_id = utterance["speaker"]
-            speaker_name = speaker_labels.get(speaker_id, speaker_id)
-            timestamp = utterance["start"]
-            text = utterance["text"]
-
-            formatted_segments.append(
-                f"[{timestamp}] {speaker_name}: {text}"
+        duration_ms = max((utterance["end"] for utterance in utterances), default=0)
+        if settings.CHUNK_WINDOWED and duration_ms > settings.CHUNK_WINDOW_SECONDS * 1000:
+            chunks = _chunk_windowed(utterances, speaker_labels, use_cache)
+        else:
+            # Call Claude with retry logic
+            chunks = claude_service.call_with_json_response(
+                system_prompt=CHUNK_SYSTEM_PROMPT,
+                user_message=_build_user_message(
+                    _format_transcript(utterances, speaker_labels),
+                    speaker_labels,
+                ),
+                max_tokens=CHUNK_MAX_TOKENS,
+                stage="chunk",
+                use_cache=use_cache,
             )
 
-        transcript_text = "\n\n".join(formatted_segments)
-
-        # Include speaker mapping in the message
-        speaker_mapping_text = "SPEAKER MAPPING:\n"
-        for speaker_id, speaker_name in speaker_labels.items():
-            speaker_mapping_text += f"- {speaker_id} = {speaker_name}\n"
-
-        user_message = f"""Please analyze the following interview transcript and break it down into chunks.
-
-{speaker_mapping_text}
-
-TRANSCRIPT:
-{transcript_text}
-
-Remember:
-- Each chunk should be a single, discrete piece of information that cannot be broken down further without losing meaning.
-- Use the actual speaker names (not A, B, C) as shown in the transcript."""
-
-        # Call Claude with retry logic
-        chunks = claude_service.call_with_json_response(
-            system_prompt=CHUNK_SYSTEM_PROMPT,
-            user_message=user_message,
-            max_tokens=16384,  # Increased for long transcripts
-        )
-
         # Validate response
         if not isinstance(chunks, list):
             raise ValueError("Expected list of chunks from Claude")
@@ -52,6 +52,8 @@ Create design principles that provide strategic direction for the entire system.
             system_prompt=CROSS_ACTIVATE_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=8192,
+            stage="cross_activate",
+            use_cache=state.get("use_cache", True),
         )
 
         # Validate response
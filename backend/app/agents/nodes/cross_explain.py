@@ -58,6 +58,8 @@ Generate insights that reveal truths about the system as a whole, not just indiv
             system_prompt=CROSS_EXPLAIN_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=8192,
+            stage="cross_explain",
+            use_cache=state.get("use_cache", True),
         )
 
         # Validate response
@@ -2,21 +2,202 @@
 
 import logging
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Set
 
 from app.agents.states import ProjectAnalysisState
-from app.agents.prompts import CROSS_RELATE_SYSTEM_PROMPT
+from app.agents.prompts import CROSS_RELATE_SYSTEM_PROMPT, CROSS_RELATE_REDUCE_SYSTEM_PROMPT
+from app.config import settings
+from app.services.async_claude_service import async_claude_service
 from app.services.claude_service import claude_service
 
 logger = logging.getLogger(__name__)
 
+CROSS_RELATE_MAX_TOKENS = 8192
+
+
+def _build_user_message(video_patterns: List[Dict[str, Any]], partial: bool = False) -> str:
+    """Build the CROSS_RELATE user message for a set of video patterns."""
+    # Format patterns from all videos for Claude
+    patterns_json = json.dumps(video_patterns, indent=2)
+
+    # A theme seen once in a group may recur in another group, so keep it for the reduce step
+    scope = (
+        "These videos are one group of a larger project: also keep themes seen in a single video here."
+        if partial else
+        "Find patterns that transcend individual videos and reveal system-level themes."
+    )
+
+    return f"""Please analyze patterns from multiple videos and identify meta-patterns.
+
+CROSS-VIDEO RULES:
+1. Look for patterns appearing in 2+ videos
+2. Identify higher-order themes
+3. Note variations by context
+4. Explain the significance of each meta-pattern
+5. Each pattern carries the video_id it came from; list those ids in appears_in_videos
+
+VIDEO PATTERNS:
+{patterns_json}
+
+{scope}"""
+
+
+def _build_reduce_message(meta_patterns: List[Dict[str, Any]], final: bool = False) -> str:
+    """Build the user message merging meta-patterns from several groups."""
+    meta_patterns_json = json.dumps(meta_patterns, indent=2)
+
+    # Earlier levels keep single-video themes: they may still recur in another branch
+    scope = (
+        "This is the final merge: drop any theme that appears in only one video in total."
+        if final else
+        "Other groups are merged separately: also keep themes seen in a single video here."
+    )
+
+    return f"""Please merge these meta-patterns, each found in a different group of videos, into one set.
+
+META-PATTERNS:
+{meta_patterns_json}
+
+Find the themes that recur across groups and reveal system-level themes.
+{scope}"""
+
+
+def _validate(meta_patterns: Any) -> List[Dict[str, Any]]:
+    """Check Claude returned a list of meta-patterns."""
+    if not isinstance(meta_patterns, list):
+        raise ValueError("Expected list of meta-patterns from Claude")
+    return [meta_pattern for meta_pattern in meta_patterns if isinstance(meta_pattern, dict)]
+
+
+def _chunk_videos(video_patterns: List[Dict[str, Any]], group_size: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split patterns into consecutive groups of up to group_size videos.
+
+    This is plain chunking in the order videos were collected (upload
+    order), not clustering; all patterns of a video land in the same group.
+    """
+    by_video: Dict[str, List[Dict[str, Any]]] = {}
+    for pattern in video_patterns:
+        by_video.setdefault(str(pattern.get("video_id", "unknown")), []).append(pattern)
+
+    video_ids = list(by_video)
+    return [
+        [pattern for video_id in video_ids[start:start + group_size] for pattern in by_video[video_id]]
+        for start in range(0, len(video_ids), group_size)
+    ]
+
+
+def _video_ids(meta_pattern: Dict[str, Any], known: Set[str]) -> List[str]:
+    """appears_in_videos of a meta-pattern, limited to video ids that were in its input."""
+    return [video_id for video_id in meta_pattern.get("appears_in_videos") or [] if str(video_id) in known]
+
+
+def _merge_provenance(
+    merged: List[Dict[str, Any]],
+    inputs: Sequence[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Set appears_in_videos of reduced meta-patterns from the inputs they merged.
+
+    The union is taken over the input meta-patterns named in related_patterns,
+    so provenance does not depend on Claude copying every video id forward.
+    """
+    by_id = {meta_pattern["meta_pattern_id"]: meta_pattern for meta_pattern in inputs}
+    known = {str(video_id) for meta_pattern in inputs for video_id in meta_pattern["appears_in_videos"]}
+
+    for meta_pattern in merged:
+        sources = [by_id[ref] for ref in meta_pattern.get("related_patterns") or [] if ref in by_id]
+        video_ids = [video_id for source in sources for video_id in source["appears_in_videos"]]
+        video_ids.extend(_video_ids(meta_pattern, known))
+        meta_pattern["appears_in_videos"] = list(dict.fromkeys(video_ids))
+    return merged
+
+
+async def _relate_group(patterns: List[Dict[str, Any]], use_cache: bool) -> List[Dict[str, Any]]:
+    """Map step: meta-patterns of one group of videos."""
+    meta_patterns = _validate(await async_claude_service.call_with_json_response(
+        system_prompt=CROSS_RELATE_SYSTEM_PROMPT,
+        user_message=_build_user_message(patterns, partial=True),
+        max_tokens=CROSS_RELATE_MAX_TOKENS,
+        stage="cross_relate",
+        use_cache=use_cache,
+    ))
+
+    known = {str(pattern.get("video_id", "unknown")) for pattern in patterns}
+    for meta_pattern in meta_patterns:
+        meta_pattern["appears_in_videos"] = _video_ids(meta_pattern, known)
+    return meta_patterns
+
+
+async def _reduce_groups(
+    group_results: List[List[Dict[str, Any]]],
+    final: bool,
+    use_cache: bool,
+) -> List[Dict[str, Any]]:
+    """Reduce step: merge the meta-patterns of several groups."""
+    if len(group_results) == 1:
+        return group_results[0]
+
+    # Prefix ids with their group so related_patterns can point back at the inputs
+    inputs = [
+        {**meta_pattern, "meta_pattern_id": f"G{group}-{meta_pattern.get('meta_pattern_id', index)}"}
+        for group, meta_patterns in enumerate(group_results, start=1)
+        for index, meta_pattern in enumerate(meta_patterns, start=1)
+    ]
+
+    merged = _validate(await async_claude_service.call_with_json_response(
+        system_prompt=CROSS_RELATE_REDUCE_SYSTEM_PROMPT,
+        user_message=_build_reduce_message(inputs, final),
+        max_tokens=CROSS_RELATE_MAX_TOKENS,
+        stage="cross_relate",
+        use_cache=use_cache,
+    ))
+    return _merge_provenance(merged, inputs)
+
+
+def _relate_hierarchical(
+    video_patterns: List[Dict[str, Any]],
+    group_size: int,
+    use_cache: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Find meta-patterns with a map-reduce over groups of videos.
+
+    Groups are related concurrently, then their results are merged
+    group_size at a time, level by level, until one set remains; themes
+    still seen in a single video are dropped at the end. Each level
+    costs one round of concurrent requests with a bounded prompt, so latency
+    grows with the number of levels (log of the video count), not videos.
+    """
+    groups = _chunk_videos(video_patterns, group_size)
+    logger.info(f"[CROSS_RELATE] Relating {len(groups)} groups of up to {group_size} videos concurrently")
+
+    results = async_claude_service.run_all(_relate_group(group, use_cache) for group in groups)
+
+    level = 1
+    while len(results) > 1:
+        batches = [results[start:start + group_size] for start in range(0, len(results), group_size)]
+        logger.info(f"[CROSS_RELATE] Reduce level {level}: merging {len(results)} groups in {len(batches)} requests")
+        final = len(batches) == 1
+        results = async_claude_service.run_all(_reduce_groups(batch, final, use_cache) for batch in batches)
+        level += 1
+
+    # Same bar as the single-request path: a meta-pattern spans 2+ videos
+    meta_patterns = [
+        meta_pattern for meta_pattern in results[0] if len(meta_pattern["appears_in_videos"]) >= 2
+    ]
+    for index, meta_pattern in enumerate(meta_patterns, start=1):
+        meta_pattern["meta_pattern_id"] = f"MP{index:03d}"
+    return meta_patterns
+
 
 def cross_relate_node(state: ProjectAnalysisState) -> Dict[str, Any]:
     """
     Step 6: Find meta-patterns across multiple videos.
 
     Takes patterns from all videos and identifies higher-order themes
-    that appear across multiple contexts.
+    that appear across multiple contexts. Projects with more videos than
+    CROSS_RELATE_GROUP_SIZE are related hierarchically (see _relate_hierarchical).
 
     Args:
         state: Current project analysis state
@@ -31,32 +212,21 @@ def cross_relate_node(state: ProjectAnalysisState) -> Dict[str, Any]:
         if not video_patterns:
             raise ValueError("No video patterns available for cross-video analysis")
 
-        # Format patterns from all videos for Claude
-        patterns_json = json.dumps(video_patterns, indent=2)
-
-        user_message = f"""Please analyze patterns from multiple videos and identify meta-patterns.
-
-CROSS-VIDEO RULES:
-1. Look for patterns appearing in 2+ videos
-2. Identify higher-order themes
-3. Note variations by context
-4. Explain the significance of each meta-pattern
-
-VIDEO PATTERNS:
-{patterns_json}
-
-Find patterns that transcend individual videos and reveal system-level themes."""
-
-        # Call Claude with retry logic
-        cross_patterns = claude_service.call_with_json_response(
-            system_prompt=CROSS_RELATE_SYSTEM_PROMPT,
-            user_message=user_message,
-            max_tokens=8192,
-        )
-
-        # Validate response
-        if not isinstance(cross_patterns, list):
-            raise ValueError("Expected list of meta-patterns from Claude")
+        use_cache = state.get("use_cache", True)
+        group_size = max(settings.CROSS_RELATE_GROUP_SIZE, 2)
+        video_count = len({str(pattern.get("video_id", "unknown")) for pattern in video_patterns})
+
+        if settings.CROSS_RELATE_HIERARCHICAL and video_count > group_size:
+            cross_patterns = _relate_hierarchical(video_patterns, group_size, use_cache)
+        else:
+            # Call Claude with retry logic
+            cross_patterns = _validate(claude_service.call_with_json_response(
+                system_prompt=CROSS_RELATE_SYSTEM_PROMPT,
+                user_message=_build_user_message(video_patterns),
+                max_tokens=CROSS_RELATE_MAX_TOKENS,
+                stage="cross_relate",
+                use_cache=use_cache,
+            ))
 
         logger.info(f"[CROSS_RELATE] Identified {len(cross_patterns)} meta-patterns across videos")
 
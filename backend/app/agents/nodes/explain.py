@@ -59,6 +59,8 @@ Generate non-consensus insights that challenge assumptions and reveal fundamenta
             system_prompt=EXPLAIN_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=16384,  # Increased for many patterns
+            stage="explain",
+            use_cache=state.get("use_cache", True),
         )
 
         # Validate response
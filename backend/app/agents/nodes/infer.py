@@ -1,22 +1,141 @@
 """INFER node - Interpret meaning from each chunk."""
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from app.agents.states import VideoAnalysisState
 from app.agents.prompts import INFER_SYSTEM_PROMPT
+from app.config import settings
+from app.services.async_claude_service import async_claude_service
 from app.services.claude_service import claude_service
+from app.services.llm_cache_service import llm_cache_service
 
 logger = logging.getLogger(__name__)
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def _batch_chunks(chunks: List[Dict[str, Any]], token_budget: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split chunks into consecutive batches that fit the token budget.
+
+    A single chunk larger than the budget still gets a batch of its own.
+    """
+    batches = []
+    current = []
+    current_tokens = 0
+
+    for chunk in chunks:
+        chunk_tokens = _estimate_tokens(json.dumps(chunk, indent=2))
+        if current and current_tokens + chunk_tokens > token_budget:
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(chunk)
+        current_tokens += chunk_tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _build_user_message(chunks: List[Dict[str, Any]]) -> str:
+    """Build the INFER user message for a batch of chunks."""
+    # Format chunks for Claude
+    chunks_json = json.dumps(chunks, indent=2)
+
+    return f"""Please analyze the following chunks and infer meaning from each one.
+
+For each chunk, ask:
+- What does this mean?
+- Why is this important?
+- What is this telling us?
+
+CHUNKS:
+{chunks_json}
+
+Generate multiple inferences per chunk if appropriate."""
+
+
+async def _infer_batch(
+    batch: List[Dict[str, Any]],
+    batch_number: int,
+    use_cache: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Run INFER for one batch, retrying just this batch on an unusable response.
+
+    Only validation failures (invalid JSON or not a list) are retried here,
+    up to INFER_BATCH_MAX_ATTEMPTS requests; API errors are already retried
+    by the Claude service and are raised as is.
+    """
+    user_message = _build_user_message(batch)
+    max_tokens = settings.INFER_BATCH_MAX_TOKENS
+    max_attempts = settings.INFER_BATCH_MAX_ATTEMPTS
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            inferences = await async_claude_service.call_with_json_response(
+                system_prompt=INFER_SYSTEM_PROMPT,
+                user_message=user_message,
+                max_tokens=max_tokens,
+                stage="infer",
+                use_cache=use_cache,
+            )
+
+            # Validate response
+            if not isinstance(inferences, list):
+                # Drop the cached response, or the retry would be served the same one
+                if use_cache and llm_cache_service.enabled:
+                    await asyncio.to_thread(
+                        llm_cache_service.delete,
+                        claude_service.build_cache_key(INFER_SYSTEM_PROMPT, user_message, max_tokens, None),
+                    )
+                raise ValueError("Expected list of inferences from Claude")
+            return inferences
+
+        except ValueError as e:
+            if attempt == max_attempts:
+                raise ValueError(f"Batch {batch_number} failed after {max_attempts} attempts: {e}")
+            logger.warning(f"[INFER] Batch {batch_number} attempt {attempt} failed, retrying: {e}")
+
+
+def _reassemble(chunks: List[Dict[str, Any]], batch_results: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Combine batch results in chunk_id order and number inference_ids globally.
+
+    Each batch numbers its inferences from I001, so ids are reassigned to stay
+    unique across the whole video.
+    """
+    chunk_order = {chunk.get("chunk_id"): index for index, chunk in enumerate(chunks)}
+    results = [item for batch in batch_results for item in batch]
+    results.sort(key=lambda item: chunk_order.get(item.get("chunk_id"), len(chunk_order)))
+
+    all_inferences = [
+        inference
+        for item in results
+        for inference in item.get("inferences", [])
+        if isinstance(inference, dict)
+    ]
+    width = max(3, len(str(len(all_inferences))))
+    for index, inference in enumerate(all_inferences, start=1):
+        inference["inference_id"] = f"I{index:0{width}d}"
+
+    return results
+
+
 def infer_node(state: VideoAnalysisState) -> Dict[str, Any]:
     """
     Step 2: Infer meaning from each chunk.
 
     Takes chunks and generates inferences about what each chunk means,
-    why it's important, and what it reveals.
+    why it's important, and what it reveals. Chunks are split into
+    token-budgeted batches that are sent to Claude concurrently.
 
     Args:
         state: Current video analysis state
@@ -31,31 +150,16 @@ def infer_node(state: VideoAnalysisState) -> Dict[str, Any]:
         if not chunks:
             raise ValueError("No chunks available for inference")
 
-        # Format chunks for Claude
-        chunks_json = json.dumps(chunks, indent=2)
-
-        user_message = f"""Please analyze the following chunks and infer meaning from each one.
-
-For each chunk, ask:
-- What does this mean?
-- Why is this important?
-- What is this telling us?
-
-CHUNKS:
-{chunks_json}
-
-Generate multiple inferences per chunk if appropriate."""
+        batches = _batch_chunks(chunks, settings.INFER_BATCH_TOKEN_BUDGET)
+        logger.info(f"[INFER] Inferring {len(chunks)} chunks in {len(batches)} concurrent batches")
 
-        # Call Claude with retry logic
-        inferences = claude_service.call_with_json_response(
-            system_prompt=INFER_SYSTEM_PROMPT,
-            user_message=user_message,
-            max_tokens=32768,  # Increased for many chunks
+        # Call Claude with retry logic (each batch retries independently)
+        batch_results = async_claude_service.run_all(
+            _infer_batch(batch, batch_number, state.get("use_cache", True))
+            for batch_number, batch in enumerate(batches, start=1)
         )
 
-        # Validate response
-        if not isinstance(inferences, list):
-            raise ValueError("Expected list of inferences from Claude")
+        inferences = _reassemble(chunks, batch_results)
 
         logger.info(f"[INFER] Generated inferences for {len(inferences)} chunks")
 
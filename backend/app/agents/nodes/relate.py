@@ -51,6 +51,8 @@ Group related inferences into patterns and explain what each pattern represents.
             system_prompt=RELATE_SYSTEM_PROMPT,
             user_message=user_message,
             max_tokens=16384,  # Increased for many inferences
+            stage="relate",
+            use_cache=state.get("use_cache", True),
         )
 
         # Validate response
@@ -171,6 +171,33 @@ OUTPUT FORMAT - Return ONLY this JSON structure:
 CRITICAL: Return ONLY valid JSON, no other text."""
 
 
+CROSS_RELATE_REDUCE_SYSTEM_PROMPT = """You are a qualitative research expert specializing in design analysis.
+
+Your task is to MERGE meta-patterns found in separate groups of videos into one set of META-PATTERNS.
+
+MERGE RULES:
+1. Combine meta-patterns that describe the same higher-order theme
+2. Keep distinct themes separate
+3. Note variations by context between the merged meta-patterns
+
+OUTPUT FORMAT - Return ONLY this JSON structure:
+[
+  {
+    "meta_pattern_id": "MP001",
+    "pattern_name": "Clear name",
+    "description": "What this represents",
+    "appears_in_videos": ["video_id_1", "video_id_2"],
+    "related_patterns": ["G1-MP001", "G2-MP003"],
+    "consistency": "consistent",
+    "significance": "Why this matters"
+  }
+]
+
+related_patterns must list the meta_pattern_id of every input meta-pattern that was merged.
+
+CRITICAL: Return ONLY valid JSON, no other text."""
+
+
 CROSS_EXPLAIN_SYSTEM_PROMPT = """You are a qualitative research expert specializing in design analysis.
 
 Your task is to generate CROSS-VIDEO INSIGHTS from meta-patterns.
@@ -2,6 +2,38 @@
 
 from typing import TypedDict, List, Dict, Any, Optional
 
+# Video pipeline stages in execution order, mapped to the state key each produces
+VIDEO_ANALYSIS_STAGES: Dict[str, str] = {
+    "chunk": "chunks",
+    "infer": "inferences",
+    "relate": "patterns",
+    "explain": "insights",
+    "activate": "design_principles",
+}
+
+# Project pipeline stages in execution order, mapped to the state key each produces
+PROJECT_ANALYSIS_STAGES: Dict[str, str] = {
+    "cross_relate": "cross_video_patterns",
+    "cross_explain": "cross_video_insights",
+    "cross_activate": "cross_video_principles",
+}
+
+
+def first_incomplete_stage(outputs: Dict[str, Any]) -> Optional[str]:
+    """
+    Find the first video pipeline stage whose output is missing.
+
+    Args:
+        outputs: Mapping containing stage output keys (a state or column values)
+
+    Returns:
+        Stage name, or None if every stage has output
+    """
+    for stage, output_key in VIDEO_ANALYSIS_STAGES.items():
+        if outputs.get(output_key) is None:
+            return stage
+    return None
+
 
 class VideoAnalysisState(TypedDict):
     """
@@ -32,6 +64,7 @@ class VideoAnalysisState(TypedDict):
     # Metadata
     current_step: str  # Track progress: "chunk", "infer", "relate", "explain", "activate"
     error: Optional[str]  # Store any errors that occur
+    use_cache: bool  # False forces fresh Claude calls (bypasses the response cache)
 
 
 class ProjectAnalysisState(TypedDict):
@@ -61,3 +94,4 @@ class ProjectAnalysisState(TypedDict):
     # Metadata
     current_step: str  # Track progress: "cross_relate", "cross_explain", "cross_activate"
     error: Optional[str]  # Store any errors that occur
+    use_cache: bool  # False forces fresh Claude calls (bypasses the response cache)
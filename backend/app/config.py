@@ -44,18 +44,61 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str
     ASSEMBLYAI_API_KEY: str
 
+    # Transcription Settings
+    ASSEMBLYAI_WEBHOOK_URL: str = ""  # Public URL of /api/transcripts/webhooks/assemblyai (empty = no webhook)
+    ASSEMBLYAI_WEBHOOK_SECRET: str = ""  # Sent back by AssemblyAI in the X-Webhook-Secret header
+    TRANSCRIPTION_RECHECK_SECONDS: int = 60  # First fallback status check if the webhook never arrives (backs off after)
+    TRANSCRIPTION_MAX_WAIT_SECONDS: int = 3600
+    WORD_INDEX_CACHE_SIZE: int = 64  # Loaded transcript word indexes kept in memory per API process
+
     # Claude Settings
     CLAUDE_MODEL: str = "claude-sonnet-4-20250514"
     CLAUDE_MAX_TOKENS: int = 4096
     CLAUDE_TEMPERATURE: float = 0.7
+    CLAUDE_MAX_CONCURRENCY: int = 8  # Max in-flight requests per process (async service)
+    CLAUDE_MAX_CONNECTIONS: int = 20  # HTTP connection pool size (async service)
+    CLAUDE_RATE_LIMIT_ENABLED: bool = True  # Shared Redis token buckets across all workers
+    CLAUDE_REQUESTS_PER_MINUTE: int = 50  # Initial limits; replaced by the API's rate-limit headers
+    CLAUDE_INPUT_TOKENS_PER_MINUTE: int = 30000
+    CLAUDE_OUTPUT_TOKENS_PER_MINUTE: int = 8000
+
+    # Analysis Pipeline Settings
+    CHUNK_WINDOWED: bool = True  # Chunk long transcripts in overlapping time windows
+    CHUNK_WINDOW_SECONDS: int = 600
+    CHUNK_WINDOW_OVERLAP_SECONDS: int = 30
+    INFER_BATCH_TOKEN_BUDGET: int = 6000  # Estimated input tokens of chunks per INFER request
+    INFER_BATCH_MAX_TOKENS: int = 16384  # Output token limit per INFER request
+    INFER_BATCH_MAX_ATTEMPTS: int = 3  # Requests per batch on invalid responses before INFER fails
+    CROSS_RELATE_HIERARCHICAL: bool = True  # Map-reduce CROSS_RELATE for projects with many videos
+    CROSS_RELATE_GROUP_SIZE: int = 8  # Videos per group request, and group results per reduce request
+
+    # LLM Response Cache Settings
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # Cached responses expire after 7 days
+    LLM_CACHE_MAX_ENTRIES: int = 5000  # Oldest entries are evicted past this size
+    LLM_CACHE_TOUCH_SECONDS: int = 3600  # Min interval between Postgres last-access updates on Redis hits
+
+    # Response Settings
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 4096  # Large JSON reads are gzip/Brotli-compressed above this size
+    GZIP_COMPRESSION_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5  # Used only if the optional brotli package is installed
+
+    # Progress Events Settings
+    PROGRESS_HEARTBEAT_SECONDS: int = 15  # Keep-alive interval for SSE progress streams
 
     # File Upload Settings
     MAX_FILE_SIZE_MB: int = 500
     ALLOWED_VIDEO_EXTENSIONS: List[str] = [".mp4", ".mov", ".webm", ".avi"]
+    MULTIPART_PART_SIZE_MB: int = 16  # Part size for direct-to-S3 uploads (S3 minimum is 5MB)
+    MULTIPART_URL_EXPIRATION_SECONDS: int = 3600
 
     # Celery Settings
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
+    CELERY_TRANSCRIPTION_CONCURRENCY: int = 8  # Short, I/O-bound submit/save tasks
+    CELERY_VIDEO_ANALYSIS_CONCURRENCY: int = 2  # Long LLM pipelines (bounded by Claude rate limits)
+    CELERY_PROJECT_ANALYSIS_CONCURRENCY: int = 1  # Longest, largest-context jobs
+    CELERY_DEFAULT_CONCURRENCY: int = 2
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1,9 +1,11 @@
 """Database connection and session management."""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.config import settings
 
@@ -16,9 +18,37 @@ engine = create_engine(
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
-# Create session factory
+# Create session factory (Celery tasks and other synchronous code)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_database_url(url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver."""
+    async_url = make_url(url).set(drivername="postgresql+asyncpg")
+    # asyncpg takes "ssl" rather than libpq's "sslmode"
+    sslmode = async_url.query.get("sslmode")
+    if sslmode:
+        async_url = async_url.difference_update_query(["sslmode"]).update_query_dict({"ssl": sslmode})
+    return async_url.render_as_string(hide_password=False)
+
+
+# Async engine for FastAPI routes, so queries don't block the event loop
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    echo=settings.DEBUG,
+)
+
+# Objects stay usable after commit (no implicit lazy refresh under asyncio)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -37,3 +67,17 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for FastAPI routes to get an async database session.
+
+    Usage:
+        @app.get("/items/")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
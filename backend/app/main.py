@@ -2,10 +2,12 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, async_engine, Base
+from app.services.progress_service import progress_service
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +22,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     debug=settings.DEBUG,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -29,6 +32,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 
@@ -49,6 +53,8 @@ async def startup_event():
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
+    await progress_service.close()
+    await async_engine.dispose()
 
 
 @app.get("/")
@@ -7,6 +7,7 @@ from app.models.database_models import (
     SpeakerLabel,
     VideoAnalysis,
     ProjectAnalysis,
+    LLMCacheEntry,
 )
 
 from app.models.schemas import (
@@ -34,6 +35,7 @@ __all__ = [
     "SpeakerLabel",
     "VideoAnalysis",
     "ProjectAnalysis",
+    "LLMCacheEntry",
     # Schemas
     "ProjectCreate",
     "ProjectUpdate",
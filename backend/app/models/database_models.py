@@ -1,8 +1,8 @@
 """SQLAlchemy database models."""
 
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, ARRAY, LargeBinary, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 
@@ -13,6 +13,9 @@ class Project(Base):
     """Research project containing multiple videos."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_at_id", "created_at", "id"),  # Keyset pages of projects
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
@@ -31,6 +34,9 @@ class Video(Base):
     """Uploaded video file."""
 
     __tablename__ = "videos"
+    __table_args__ = (
+        Index("ix_videos_project_id_uploaded_at_id", "project_id", "uploaded_at", "id"),  # Keyset pages per project
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -42,6 +48,7 @@ class Video(Base):
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(String(50), default="uploaded")  # uploaded, transcribing, transcribed, analyzing, analyzed, error
     error_message = Column(Text)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # Row version for ETags
 
     # Relationships
     project = relationship("Project", back_populates="videos")
@@ -53,14 +60,22 @@ class Transcript(Base):
     """Transcription from AssemblyAI."""
 
     __tablename__ = "transcripts"
+    __table_args__ = (
+        UniqueConstraint("video_id", name="uq_transcripts_video_id"),  # One transcript per video
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False)
     assemblyai_id = Column(String(255), unique=True)
     raw_transcript = Column(JSONB)  # Full response from AssemblyAI
     processed_transcript = Column(JSONB)  # Cleaned/formatted transcript
+    word_index = deferred(Column(JSONB))  # Inverted index for local word search (loaded only when searching)
+    word_columns = deferred(Column(JSONB))  # Column-wise word timing for the words endpoint
+    word_columns_packed = deferred(Column(LargeBinary))  # Same, as a packed binary payload
+    word_starts = deferred(Column(LargeBinary))  # Word start times (int32 array) for time-window queries
     status = Column(String(50), default="pending")  # pending, processing, completed, error
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # Row version for ETags
 
     # Relationships
     video = relationship("Video", back_populates="transcript")
@@ -71,6 +86,9 @@ class SpeakerLabel(Base):
     """User-assigned speaker names and roles."""
 
     __tablename__ = "speaker_labels"
+    __table_args__ = (
+        UniqueConstraint("transcript_id", "speaker_label", name="uq_speaker_labels_transcript_id_speaker_label"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     transcript_id = Column(UUID(as_uuid=True), ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=False)
@@ -86,6 +104,9 @@ class VideoAnalysis(Base):
     """Analysis results for a single video (5-step process)."""
 
     __tablename__ = "video_analyses"
+    __table_args__ = (
+        UniqueConstraint("video_id", name="uq_video_analyses_video_id"),  # One analysis per video
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False)
@@ -95,8 +116,11 @@ class VideoAnalysis(Base):
     insights = Column(JSONB)  # Step 4: List of insights
     design_principles = Column(JSONB)  # Step 5: List of design principles
     status = Column(String(50), default="pending")  # pending, processing, completed, error
+    failed_stage = Column(String(50))  # Pipeline step that failed (chunk, infer, ...)
+    error_message = Column(Text)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # Row version for ETags
 
     # Relationships
     video = relationship("Video", back_populates="video_analysis")
@@ -106,6 +130,9 @@ class ProjectAnalysis(Base):
     """Cross-video analysis synthesizing multiple videos."""
 
     __tablename__ = "project_analyses"
+    __table_args__ = (
+        Index("ix_project_analyses_project_id_started_at", "project_id", "started_at"),  # Latest analysis per project
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -114,8 +141,25 @@ class ProjectAnalysis(Base):
     cross_video_insights = Column(JSONB)  # Cross-video insights
     cross_video_principles = Column(JSONB)  # System-level design principles
     status = Column(String(50), default="pending")  # pending, processing, completed, error
+    failed_stage = Column(String(50))  # Pipeline step that failed (cross_relate, ...)
+    error_message = Column(Text)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # Row version for ETags
 
     # Relationships
     project = relationship("Project", back_populates="project_analyses")
+
+
+class LLMCacheEntry(Base):
+    """Durable copy of a cached Claude response (fallback for Redis)."""
+
+    __tablename__ = "llm_cache_entries"
+
+    cache_key = Column(String(64), primary_key=True)  # SHA-256 of model + prompts + params
+    model = Column(String(100), nullable=False)
+    stage = Column(String(50))  # Pipeline stage that produced the entry (chunk, infer, ...)
+    response = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -38,6 +38,22 @@ class ProjectResponse(ProjectBase):
     updated_at: datetime
 
 
+class ProjectSummaryResponse(ProjectResponse):
+    """Schema for a project with dashboard counts."""
+    video_count: int
+    videos_by_status: Dict[str, int]  # Video status -> count (uploaded, transcribing, ...)
+    transcripts_completed: int
+    analyses_completed: int
+    analysis_status: Optional[str] = None  # Latest project (cross-video) analysis status
+    last_activity_at: Optional[datetime] = None  # Latest change to the project, its videos or their results
+
+
+class ProjectSummaryPage(BaseModel):
+    """Schema for one page of project summaries."""
+    items: List[ProjectSummaryResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page (None on the last page)
+
+
 # ========== Video Schemas ==========
 
 class VideoBase(BaseModel):
@@ -76,6 +92,43 @@ class VideoResponse(VideoBase):
     error_message: Optional[str] = None
 
 
+class MultipartUploadCreate(BaseModel):
+    """Schema for starting a direct-to-S3 multipart upload."""
+    filename: str
+    file_size_bytes: int
+
+
+class MultipartUploadPartURL(BaseModel):
+    """Presigned URL for uploading one part."""
+    part_number: int
+    url: str
+
+
+class UploadedPart(BaseModel):
+    """A part that has been uploaded to S3."""
+    part_number: int
+    etag: str
+    size: Optional[int] = None
+
+
+class MultipartUploadResponse(BaseModel):
+    """Schema for a multipart upload and the part URLs still to upload."""
+    upload_id: str
+    s3_key: str
+    part_size_bytes: int
+    part_count: int
+    parts: List[MultipartUploadPartURL]
+    uploaded_parts: List[UploadedPart] = []
+
+
+class MultipartUploadComplete(BaseModel):
+    """Schema for completing a multipart upload."""
+    s3_key: str
+    filename: str
+    parts: Optional[List[UploadedPart]] = None  # Listed from S3 if omitted
+    duration_seconds: Optional[int] = None  # Read by the browser from the file's metadata
+
+
 # ========== Transcript Schemas ==========
 
 class TranscriptResponse(BaseModel):
@@ -131,6 +184,8 @@ class VideoAnalysisResponse(BaseModel):
     insights: Optional[List[Dict[str, Any]]] = None
     design_principles: Optional[List[Dict[str, Any]]] = None
     status: str
+    failed_stage: Optional[str] = None
+    error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
@@ -153,10 +208,24 @@ class ProjectAnalysisResponse(BaseModel):
     cross_video_insights: Optional[List[Dict[str, Any]]] = None
     cross_video_principles: Optional[List[Dict[str, Any]]] = None
     status: str
+    failed_stage: Optional[str] = None
+    error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
 
+class AnalysisStageResponse(BaseModel):
+    """Schema for one page of a single analysis stage's output."""
+    analysis_id: UUID
+    stage: str
+    status: str
+    items: List[Dict[str, Any]]
+    offset: int
+    limit: int
+    total: int  # Items in the stage (0 if it has no output yet)
+    next_offset: Optional[int] = None  # None on the last page
+
+
 # ========== Task Status Schemas ==========
 
 class TaskStatus(BaseModel):
@@ -0,0 +1,79 @@
+"""Pagination helpers shared by the API routes."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def jsonb_array_page(column: ColumnElement, offset: int, limit: int) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    SQL expressions for one page of a JSONB array column.
+
+    The slice is taken in the database, so only the requested items are read
+    out of the column and sent over the wire. Out-of-range bounds are clipped
+    (lax jsonpath), and both expressions are NULL if the column holds no array.
+
+    Args:
+        column: JSONB column holding an array
+        offset: Index of the first item
+        limit: Maximum number of items
+
+    Returns:
+        Tuple of (array length expression, page items expression)
+    """
+    # Cleared outputs can hold a JSON null rather than SQL NULL; treat both as empty
+    is_array = func.jsonb_typeof(column) == "array"
+    total = case((is_array, func.jsonb_array_length(column)))
+    items = case((is_array, func.jsonb_path_query_array(
+        column,
+        literal_column("'$[$lo to $hi]'::jsonpath"),
+        func.jsonb_build_object("lo", offset, "hi", offset + limit - 1),
+        type_=JSONB,
+    )))
+    return total, items
+
+
+def next_offset(offset: int, count: int, total: int) -> Optional[int]:
+    """Offset of the following page, or None on the last page."""
+    return offset + count if offset + count < total else None
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Opaque keyset cursor for the row a page ended on."""
+    payload = json.dumps([timestamp.isoformat(), str(row_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_before(timestamp_column: ColumnElement, id_column: ColumnElement, cursor: str) -> ColumnElement:
+    """
+    Condition for rows after a cursor in (timestamp DESC, id DESC) order.
+
+    Backed by a (timestamp, id) index, each page is an index range scan that
+    costs the same however deep it is.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    timestamp, row_id = decode_cursor(cursor)
+    return tuple_(timestamp_column, id_column) < tuple_(timestamp, row_id)
@@ -0,0 +1,211 @@
+"""HTTP response helpers (conditional GET, fast JSON, Server-Sent Events)."""
+
+import gzip
+import hashlib
+import json
+from typing import Any, AsyncIterator, Collection, Dict, Optional, Set, Type
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Text, cast, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.progress_service import ProgressSubscription
+
+try:
+    import brotli
+except ImportError:  # Optional: responses fall back to gzip without it
+    brotli = None
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that identify a representation.
+
+    Args:
+        parts: Row id, version (updated_at), status, query variant, ...
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach an ETag; no-cache makes clients revalidate on every poll."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
+
+
+def accepted_encodings(request: Request) -> Set[str]:
+    """Content codings the client accepts (ignoring ones refused with q=0)."""
+    encodings = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = item.partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name.strip():
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+def negotiate_encoding(request: Request) -> Optional[str]:
+    """Pick "br" (if Brotli is installed) or "gzip", or None for identity."""
+    encodings = accepted_encodings(request)
+    if brotli is not None and "br" in encodings:
+        return "br"
+    if "gzip" in encodings:
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with a negotiated content coding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_COMPRESSION_LEVEL)
+
+
+def raw_json_object(values: Dict[str, Any], raw_keys: Collection[str]) -> bytes:
+    """
+    Encode a JSON object whose raw_keys values are already JSON text.
+
+    Raw values (JSONB read as text) are spliced in as-is instead of being
+    parsed, validated and re-encoded.
+
+    Args:
+        values: Field name -> value (JSON text for raw keys, None = null)
+        raw_keys: Fields holding JSON text
+
+    Returns:
+        UTF-8 JSON object
+    """
+    members = []
+    for key, value in values.items():
+        if key in raw_keys:
+            encoded = value.encode("utf-8") if value is not None else b"null"
+        else:
+            encoded = orjson.dumps(value)
+        members.append(orjson.dumps(key) + b":" + encoded)
+    return b"{" + b",".join(members) + b"}"
+
+
+async def load_json_row(db: AsyncSession, model: Any, row_id: Any, schema: Type[BaseModel]) -> bytes:
+    """
+    Serialize one row with a response schema's fields, straight from the database.
+
+    JSONB columns are selected as text and spliced into the output, so large
+    stored documents skip decoding, response_model validation and encoding.
+
+    Args:
+        db: Database session
+        model: ORM model (must have an id column)
+        row_id: Row primary key
+        schema: Response schema listing the fields to include
+
+    Returns:
+        UTF-8 JSON object
+    """
+    names = list(schema.model_fields)
+    raw_keys = {name for name in names if isinstance(model.__table__.columns[name].type, JSONB)}
+    columns = [
+        cast(getattr(model, name), Text) if name in raw_keys else getattr(model, name)
+        for name in names
+    ]
+    result = await db.execute(select(*columns).where(model.id == row_id))
+    return raw_json_object(dict(zip(names, result.one())), raw_keys)
+
+
+async def json_bytes_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """
+    Send a pre-encoded JSON body, compressed if the client accepts it.
+
+    Args:
+        request: Incoming request (for Accept-Encoding)
+        body: UTF-8 JSON
+        etag: ETag to attach (see set_etag)
+
+    Returns:
+        Response with Content-Encoding negotiated
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = negotiate_encoding(request) if len(body) >= settings.RESPONSE_COMPRESSION_MIN_BYTES else None
+    if encoding:
+        # Compressing a multi-MB body takes long enough to stall the event loop
+        body = await run_in_threadpool(compress_body, body, encoding)
+        headers["Content-Encoding"] = encoding
+
+    response = Response(content=body, media_type="application/json", headers=headers)
+    if etag:
+        set_etag(response, etag)
+    return response
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """Encode one Server-Sent Events message (data is sent as JSON)."""
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data, default=str)}\n\n"
+
+
+def sse_response(messages: AsyncIterator[str]) -> StreamingResponse:
+    """Stream pre-formatted SSE messages without proxy buffering or caching."""
+    return StreamingResponse(
+        messages,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def progress_messages(
+    request: Request,
+    snapshot: Dict[str, Any],
+    events: ProgressSubscription,
+) -> AsyncIterator[str]:
+    """
+    SSE messages for a progress stream: the current state, then each event.
+
+    Args:
+        request: Incoming request (to stop when the client disconnects)
+        snapshot: Current state from the database, sent first
+        events: Subscription from ProgressService.subscribe, made before the
+            snapshot was read (None = heartbeat)
+
+    Yields:
+        Formatted SSE messages
+    """
+    try:
+        yield format_sse(snapshot, event="snapshot")
+        async for progress_event in events:
+            if await request.is_disconnected():
+                break
+            if progress_event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield format_sse(progress_event, event=progress_event.get("type"))
+    finally:
+        # Unsubscribe now rather than when the generator is garbage collected
+        await events.aclose()
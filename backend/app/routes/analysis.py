@@ -1,18 +1,49 @@
 """Analysis-related API routes.
 
-This module is reserved for future expansion of analysis-related endpoints.
-Currently, analysis functionality is split between:
+Analysis functionality is split between:
 - Video analysis: /api/videos/{id}/analyze and /api/videos/{id}/analysis
 - Project analysis: /api/projects/{id}/analyze and /api/projects/{id}/analysis
+
+This module holds endpoints that span both pipelines.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
 import logging
 
+from app.services.llm_cache_service import llm_cache_service
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+@router.get("/cache/stats")
+async def get_llm_cache_stats():
+    """
+    Get Claude response cache hit/miss counters per pipeline stage.
+
+    Returns:
+        {
+            "enabled": true,
+            "stages": {
+                "chunk": {"hits": 3, "misses": 1},
+                ...
+            }
+        }
+    """
+    try:
+        return {
+            "enabled": llm_cache_service.enabled,
+            "stages": llm_cache_service.get_stats(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting LLM cache stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get LLM cache stats: {str(e)}"
+        )
+
 # Future endpoints might include:
 # - Comparison endpoints for multiple videos
 # - Export/download analysis results
@@ -1,19 +1,36 @@
 """Project management API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from typing import List, Literal, Optional
 from uuid import UUID
 import logging
-
-from app.database import get_db
-from app.models.database_models import Project, Video, VideoAnalysis, ProjectAnalysis
+import time
+
+from app.database import get_async_db
+from app.pagination import encode_cursor, jsonb_array_page, keyset_before, next_offset
+from app.responses import (
+    etag_matches,
+    json_bytes_response,
+    load_json_row,
+    make_etag,
+    not_modified,
+    progress_messages,
+    set_etag,
+    sse_response,
+)
+from app.services.progress_service import progress_service
+from app.models.database_models import Project, Video, Transcript, VideoAnalysis, ProjectAnalysis
 from app.models.schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectSummaryPage,
     VideoResponse,
     ProjectAnalysisResponse,
+    AnalysisStageResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,7 +41,7 @@ router = APIRouter()
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new research project.
@@ -44,15 +61,15 @@ async def create_project(
         )
 
         db.add(project)
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
 
         logger.info(f"Created project: {project.id} - {project.name}")
         return project
 
     except Exception as e:
         logger.error(f"Error creating project: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create project: {str(e)}"
@@ -61,31 +78,46 @@ async def create_project(
 
 @router.get("/", response_model=List[ProjectResponse])
 async def list_projects(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    List all research projects.
+    List research projects, newest first.
+
+    Keyset-paginated on (created_at, id): when there are more projects, the
+    X-Next-Cursor response header holds the cursor for the next page.
 
     Args:
-        skip: Number of projects to skip (for pagination)
-        limit: Maximum number of projects to return
+        response: Outgoing response (for the X-Next-Cursor header)
+        cursor: X-Next-Cursor from the previous page (omit for the first page)
+        limit: Maximum number of projects to return (up to 500)
         db: Database session
 
     Returns:
         List of projects
     """
     try:
-        projects = db.query(Project)\
-            .order_by(Project.created_at.desc())\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+        query = select(Project).order_by(Project.created_at.desc(), Project.id.desc()).limit(limit + 1)
+        if cursor:
+            try:
+                query = query.where(keyset_before(Project.created_at, Project.id, cursor))
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        result = await db.execute(query)
+        projects = result.scalars().all()
+
+        if len(projects) > limit:
+            projects = projects[:limit]
+            response.headers["X-Next-Cursor"] = encode_cursor(projects[-1].created_at, projects[-1].id)
 
         logger.info(f"Retrieved {len(projects)} projects")
         return projects
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
         raise HTTPException(
@@ -94,10 +126,124 @@ async def list_projects(
         )
 
 
+# Video statuses counted separately in project summaries
+VIDEO_STATUSES = ("uploaded", "transcribing", "transcribed", "analyzing", "analyzed", "error")
+
+
+# Must be registered before /{project_id}
+@router.get("/summary", response_model=ProjectSummaryPage)
+async def list_project_summaries(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    List projects with dashboard counts, newest first.
+
+    Each project comes with its video count by status, completed
+    transcripts and analyses, latest project analysis status and last
+    activity, all from one grouped query over the requested page.
+
+    Args:
+        cursor: next_cursor from the previous page (omit for the first page)
+        limit: Maximum number of projects (up to 200)
+        db: Database session
+
+    Returns:
+        {"items": [project summaries], "next_cursor": str or None}
+    """
+    try:
+        # Page the projects first so the joins only touch this page's videos
+        page_query = select(Project).order_by(Project.created_at.desc(), Project.id.desc()).limit(limit + 1)
+        if cursor:
+            try:
+                page_query = page_query.where(keyset_before(Project.created_at, Project.id, cursor))
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        project = aliased(Project, page_query.subquery("page"))
+
+        latest_analysis_status = (
+            select(ProjectAnalysis.status)
+            .where(ProjectAnalysis.project_id == project.id)
+            .order_by(ProjectAnalysis.started_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        project_columns = [
+            project.id,
+            project.name,
+            project.description,
+            project.status,
+            project.error_message,
+            project.created_at,
+            project.updated_at,
+        ]
+
+        result = await db.execute(
+            select(
+                *project_columns,
+                func.count(Video.id).label("video_count"),
+                *[
+                    func.count(Video.id).filter(Video.status == video_status).label(f"videos_{video_status}")
+                    for video_status in VIDEO_STATUSES
+                ],
+                func.count(Transcript.id).filter(Transcript.status == "completed").label("transcripts_completed"),
+                func.count(VideoAnalysis.id).filter(VideoAnalysis.status == "completed").label("analyses_completed"),
+                func.greatest(
+                    project.updated_at,
+                    func.max(Video.uploaded_at),
+                    func.max(Video.updated_at),
+                    func.max(Transcript.updated_at),
+                    func.max(VideoAnalysis.updated_at),
+                ).label("last_activity_at"),
+                latest_analysis_status.label("analysis_status"),
+            )
+            .select_from(project)
+            .outerjoin(Video, Video.project_id == project.id)
+            .outerjoin(Transcript, Transcript.video_id == Video.id)
+            .outerjoin(VideoAnalysis, VideoAnalysis.video_id == Video.id)
+            .group_by(*project_columns)
+            .order_by(project.created_at.desc(), project.id.desc())
+        )
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        items = [
+            {
+                **{column.key: getattr(row, column.key) for column in project_columns},
+                "video_count": row.video_count,
+                "videos_by_status": {
+                    video_status: getattr(row, f"videos_{video_status}") for video_status in VIDEO_STATUSES
+                },
+                "transcripts_completed": row.transcripts_completed,
+                "analyses_completed": row.analyses_completed,
+                "analysis_status": row.analysis_status,
+                "last_activity_at": row.last_activity_at,
+            }
+            for row in rows
+        ]
+
+        logger.info(f"Retrieved summaries for {len(items)} projects")
+        return {"items": items, "next_cursor": next_cursor}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error listing project summaries: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list project summaries: {str(e)}"
+        )
+
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific project by ID.
@@ -110,7 +256,7 @@ async def get_project(
         Project details
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
 
         if not project:
             raise HTTPException(
@@ -135,7 +281,7 @@ async def get_project(
 async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a project.
@@ -149,7 +295,7 @@ async def update_project(
         Updated project
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
 
         if not project:
             raise HTTPException(
@@ -165,8 +311,8 @@ async def update_project(
         if project_data.status is not None:
             project.status = project_data.status
 
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
 
         logger.info(f"Updated project: {project_id}")
         return project
@@ -175,7 +321,7 @@ async def update_project(
         raise
     except Exception as e:
         logger.error(f"Error updating project: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update project: {str(e)}"
@@ -185,7 +331,7 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a project and all associated data.
@@ -198,7 +344,7 @@ async def delete_project(
         No content
     """
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
 
         if not project:
             raise HTTPException(
@@ -206,8 +352,8 @@ async def delete_project(
                 detail=f"Project {project_id} not found"
             )
 
-        db.delete(project)
-        db.commit()
+        await db.delete(project)
+        await db.commit()
 
         logger.info(f"Deleted project: {project_id}")
         return None
@@ -216,7 +362,7 @@ async def delete_project(
         raise
     except Exception as e:
         logger.error(f"Error deleting project: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete project: {str(e)}"
@@ -226,13 +372,25 @@ async def delete_project(
 @router.get("/{project_id}/videos", response_model=List[VideoResponse])
 async def list_project_videos(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    List all videos for a specific project.
+    List videos for a specific project, newest first.
+
+    Keyset-paginated on (uploaded_at, id): when there are more videos, the
+    X-Next-Cursor response header holds the cursor for the next page.
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag.
 
     Args:
         project_id: Project UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag and X-Next-Cursor headers)
+        cursor: X-Next-Cursor from the previous page (omit for the first page)
+        limit: Maximum number of videos to return (up to 500)
         db: Database session
 
     Returns:
@@ -240,18 +398,41 @@ async def list_project_videos(
     """
     try:
         # Check if project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project {project_id} not found"
             )
 
-        # Get all videos for this project
-        videos = db.query(Video)\
-            .filter(Video.project_id == project_id)\
-            .order_by(Video.uploaded_at.desc())\
-            .all()
+        query = (
+            select(Video)
+            .where(Video.project_id == project_id)
+            .order_by(Video.uploaded_at.desc(), Video.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor:
+            try:
+                query = query.where(keyset_before(Video.uploaded_at, Video.id, cursor))
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        # Any added, removed or updated video changes the count or latest version
+        result = await db.execute(
+            select(func.count(Video.id), func.max(Video.updated_at), func.max(Video.uploaded_at))
+            .where(Video.project_id == project_id)
+        )
+        etag = make_etag("project_videos", project_id, *result.one(), cursor, limit)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+        result = await db.execute(query)
+        videos = result.scalars().all()
+
+        if len(videos) > limit:
+            videos = videos[:limit]
+            response.headers["X-Next-Cursor"] = encode_cursor(videos[-1].uploaded_at, videos[-1].id)
 
         logger.info(f"Retrieved {len(videos)} videos for project {project_id}")
         return videos
@@ -266,10 +447,90 @@ async def list_project_videos(
         )
 
 
+@router.get("/{project_id}/events")
+async def stream_project_progress(
+    project_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream progress for a project and all its videos as Server-Sent Events.
+
+    Sends a "snapshot" event with the current state, then "transcription",
+    "video_analysis" and "project_analysis" events on every state change.
+
+    Args:
+        project_id: Project UUID
+        request: Incoming request (to detect disconnects)
+        db: Database session
+
+    Returns:
+        text/event-stream response
+    """
+    events = None
+    try:
+        # Subscribe before reading the snapshot so no change falls in between
+        events = await progress_service.subscribe(progress_service.project_channel(project_id))
+        snapshot_at = time.time()
+
+        result = await db.execute(
+            select(Project.status).where(Project.id == project_id)
+        )
+        project_status = result.scalar()
+        if project_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project {project_id} not found"
+            )
+
+        result = await db.execute(
+            select(Video.id, Video.status)
+            .where(Video.project_id == project_id)
+            .order_by(Video.uploaded_at.desc())
+        )
+        videos = result.all()
+
+        result = await db.execute(
+            select(ProjectAnalysis.status, ProjectAnalysis.failed_stage)
+            .where(ProjectAnalysis.project_id == project_id)
+            .order_by(ProjectAnalysis.started_at.desc())
+        )
+        analysis = result.first()
+
+        snapshot = {
+            "project_id": str(project_id),
+            "status": project_status,
+            "videos": [{"id": str(video.id), "status": video.status} for video in videos],
+            "analysis_status": analysis.status if analysis else None,
+            "failed_stage": analysis.failed_stage if analysis else None,
+        }
+
+        events.drop_stale(snapshot_at)
+
+        # Release the connection; the stream can stay open for a long time
+        await db.close()
+
+        return sse_response(progress_messages(request, snapshot, events))
+
+    except HTTPException:
+        if events is not None:
+            await events.aclose()
+        raise
+    except Exception as e:
+        if events is not None:
+            await events.aclose()
+        logger.error(f"Error streaming project progress: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream project progress: {str(e)}"
+        )
+
+
 @router.post("/{project_id}/analyze", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_project_analysis(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    use_cache: bool = True,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Trigger cross-video analysis for a project.
@@ -279,6 +540,7 @@ async def trigger_project_analysis(
 
     Args:
         project_id: Project UUID
+        use_cache: Set False to force fresh Claude calls instead of cached responses
         db: Database session
 
     Returns:
@@ -286,7 +548,7 @@ async def trigger_project_analysis(
     """
     try:
         # Check if project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -294,26 +556,28 @@ async def trigger_project_analysis(
             )
 
         # Get all analyzed videos for this project
-        analyzed_videos = db.query(Video)\
-            .join(VideoAnalysis)\
-            .filter(
+        result = await db.execute(
+            select(Video.id)
+            .join(VideoAnalysis)
+            .where(
                 Video.project_id == project_id,
                 VideoAnalysis.status == "completed"
-            )\
-            .all()
+            )
+        )
+        video_ids = result.scalars().all()
 
-        if len(analyzed_videos) < 1:
+        if len(video_ids) < 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="At least one video must be analyzed before running project analysis"
             )
 
-        video_ids = [video.id for video in analyzed_videos]
-
         # Create or get existing project analysis
-        project_analysis = db.query(ProjectAnalysis)\
-            .filter(ProjectAnalysis.project_id == project_id)\
-            .first()
+        result = await db.execute(
+            select(ProjectAnalysis)
+            .where(ProjectAnalysis.project_id == project_id)
+        )
+        project_analysis = result.scalars().first()
 
         if not project_analysis:
             project_analysis = ProjectAnalysis(
@@ -322,12 +586,13 @@ async def trigger_project_analysis(
                 status="pending"
             )
             db.add(project_analysis)
-            db.commit()
-            db.refresh(project_analysis)
+            await db.commit()
+            await db.refresh(project_analysis)
 
         # Trigger Celery task
         from app.tasks.analysis_tasks import analyze_project_task
-        task = analyze_project_task.delay(str(project_id))
+        await progress_service.publish_async("project_analysis", "queued", "pending", project_id=project_id)
+        task = analyze_project_task.delay(str(project_id), use_cache=use_cache)
 
         logger.info(f"Project analysis task started for project {project_id}, task_id: {task.id}")
         return {
@@ -343,7 +608,7 @@ async def trigger_project_analysis(
         raise
     except Exception as e:
         logger.error(f"Error triggering project analysis: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to trigger project analysis: {str(e)}"
@@ -353,47 +618,157 @@ async def trigger_project_analysis(
 @router.get("/{project_id}/analysis", response_model=ProjectAnalysisResponse)
 async def get_project_analysis(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get cross-video analysis results for a project.
 
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag,
+    without loading the analysis JSONB.
+
     Args:
         project_id: Project UUID
+        request: Incoming request (for If-None-Match and Accept-Encoding)
         db: Database session
 
     Returns:
         Project analysis results
     """
     try:
-        # Check if project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        # Check the version first so unchanged polls skip the JSONB columns
+        result = await db.execute(
+            select(
+                ProjectAnalysis.id,
+                ProjectAnalysis.status,
+                ProjectAnalysis.completed_at,
+                ProjectAnalysis.updated_at,
+            )
+            .where(ProjectAnalysis.project_id == project_id)
+            .order_by(ProjectAnalysis.started_at.desc())
+        )
+        version = result.first()
+
+        if not version:
+            # Check if project exists
+            project = await db.get(Project, project_id)
+            if not project:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project {project_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project {project_id} not found"
+                detail=f"No analysis found for project {project_id}"
             )
 
-        # Get project analysis
-        project_analysis = db.query(ProjectAnalysis)\
-            .filter(ProjectAnalysis.project_id == project_id)\
-            .order_by(ProjectAnalysis.started_at.desc())\
-            .first()
+        etag = make_etag(
+            "project_analysis", version.id, version.updated_at, version.completed_at, version.status
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-        if not project_analysis:
+        # Stored JSONB is sent as-is: no decode, response_model validation or re-encode
+        body = await load_json_row(db, ProjectAnalysis, version.id, ProjectAnalysisResponse)
+
+        logger.info(f"Retrieved project analysis for project {project_id}")
+        return await json_bytes_response(request, body, etag)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting project analysis: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get project analysis: {str(e)}"
+        )
+
+
+@router.get("/{project_id}/analysis/{stage}", response_model=AnalysisStageResponse)
+async def get_project_analysis_stage(
+    project_id: UUID,
+    stage: Literal["cross_video_patterns", "cross_video_insights", "cross_video_principles"],
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get one page of a single cross-video analysis stage's output.
+
+    Only the requested slice of the stage's JSONB column is read. Supports
+    conditional GET like /analysis.
+
+    Args:
+        project_id: Project UUID
+        stage: Stage output (cross_video_patterns, cross_video_insights, cross_video_principles)
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
+        offset: Index of the first item
+        limit: Maximum number of items (up to 500)
+        db: Database session
+
+    Returns:
+        Page of stage items with total and next_offset
+    """
+    try:
+        result = await db.execute(
+            select(
+                ProjectAnalysis.id,
+                ProjectAnalysis.status,
+                ProjectAnalysis.completed_at,
+                ProjectAnalysis.updated_at,
+            )
+            .where(ProjectAnalysis.project_id == project_id)
+            .order_by(ProjectAnalysis.started_at.desc())
+        )
+        version = result.first()
+
+        if not version:
+            project = await db.get(Project, project_id)
+            if not project:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project {project_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No analysis found for project {project_id}"
             )
 
-        logger.info(f"Retrieved project analysis for project {project_id}")
-        return project_analysis
+        etag = make_etag(
+            "project_analysis", version.id, version.updated_at, version.completed_at, version.status,
+            stage, offset, limit
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        total_column, items_column = jsonb_array_page(getattr(ProjectAnalysis, stage), offset, limit)
+        result = await db.execute(
+            select(total_column, items_column).where(ProjectAnalysis.id == version.id)
+        )
+        total, items = result.one()
+        items = items or []
+        set_etag(response, etag)
+
+        logger.info(f"Retrieved {len(items)} {stage} from offset {offset} for project {project_id}")
+        return {
+            "analysis_id": version.id,
+            "stage": stage,
+            "status": version.status,
+            "items": items,
+            "offset": offset,
+            "limit": limit,
+            "total": total or 0,
+            "next_offset": next_offset(offset, len(items), total or 0),
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting project analysis: {e}")
+        logger.error(f"Error getting project analysis stage: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get project analysis: {str(e)}"
+            detail=f"Failed to get project analysis stage: {str(e)}"
         )
@@ -1,12 +1,16 @@
 """Transcription and speaker labeling API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 import logging
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_async_db
+from app.responses import etag_matches, json_bytes_response, load_json_row, make_etag, not_modified
+from app.services.speaker_label_service import speaker_label_service
 from app.models.database_models import Transcript, SpeakerLabel, Video
 from app.models.schemas import (
     TranscriptResponse,
@@ -23,29 +27,45 @@ router = APIRouter()
 @router.get("/{transcript_id}", response_model=TranscriptResponse)
 async def get_transcript(
     transcript_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific transcript by ID.
 
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag,
+    without loading the transcript JSONB.
+
     Args:
         transcript_id: Transcript UUID
+        request: Incoming request (for If-None-Match and Accept-Encoding)
         db: Database session
 
     Returns:
         Transcript details including raw and processed transcript data
     """
     try:
-        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
+        result = await db.execute(
+            select(Transcript.status, Transcript.updated_at)
+            .where(Transcript.id == transcript_id)
+        )
+        version = result.first()
 
-        if not transcript:
+        if not version:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Transcript {transcript_id} not found"
             )
 
+        etag = make_etag("transcript", transcript_id, version.updated_at, version.status)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # Stored JSONB is sent as-is: no decode, response_model validation or re-encode
+        body = await load_json_row(db, Transcript, transcript_id, TranscriptResponse)
+
         logger.info(f"Retrieved transcript: {transcript_id}")
-        return transcript
+        return await json_bytes_response(request, body, etag)
 
     except HTTPException:
         raise
@@ -60,7 +80,7 @@ async def get_transcript(
 @router.get("/{transcript_id}/speakers", response_model=List[SpeakerLabelResponse])
 async def get_speaker_labels(
     transcript_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all speaker labels for a transcript.
@@ -74,7 +94,7 @@ async def get_speaker_labels(
     """
     try:
         # Check if transcript exists
-        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
+        transcript = await db.get(Transcript, transcript_id)
         if not transcript:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -82,10 +102,12 @@ async def get_speaker_labels(
             )
 
         # Get all speaker labels
-        speaker_labels = db.query(SpeakerLabel)\
-            .filter(SpeakerLabel.transcript_id == transcript_id)\
-            .order_by(SpeakerLabel.speaker_label)\
-            .all()
+        result = await db.execute(
+            select(SpeakerLabel)
+            .where(SpeakerLabel.transcript_id == transcript_id)
+            .order_by(SpeakerLabel.speaker_label)
+        )
+        speaker_labels = result.scalars().all()
 
         logger.info(f"Retrieved {len(speaker_labels)} speaker labels for transcript {transcript_id}")
         return speaker_labels
@@ -104,7 +126,7 @@ async def get_speaker_labels(
 async def save_speaker_labels(
     transcript_id: UUID,
     speaker_labels: List[SpeakerLabelCreate],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Save or update speaker labels for a transcript.
@@ -121,53 +143,30 @@ async def save_speaker_labels(
         List of saved speaker labels
     """
     try:
-        # Check if transcript exists
-        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
-        if not transcript:
+        # Check if transcript exists (status only, not the transcript JSONB)
+        result = await db.execute(
+            select(Transcript.status).where(Transcript.id == transcript_id)
+        )
+        transcript_status = result.scalar()
+        if transcript_status is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Transcript {transcript_id} not found"
             )
 
         # Check if transcript is completed
-        if transcript.status != "completed":
+        if transcript_status != "completed":
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot assign speaker labels to incomplete transcript"
             )
 
-        saved_labels = []
-
-        for label_data in speaker_labels:
-            # Check if speaker label already exists
-            existing_label = db.query(SpeakerLabel).filter(
-                SpeakerLabel.transcript_id == transcript_id,
-                SpeakerLabel.speaker_label == label_data.speaker_label
-            ).first()
-
-            if existing_label:
-                # Update existing label
-                if label_data.assigned_name is not None:
-                    existing_label.assigned_name = label_data.assigned_name
-                if label_data.role is not None:
-                    existing_label.role = label_data.role
-                saved_labels.append(existing_label)
-            else:
-                # Create new label
-                new_label = SpeakerLabel(
-                    transcript_id=transcript_id,
-                    speaker_label=label_data.speaker_label,
-                    assigned_name=label_data.assigned_name,
-                    role=label_data.role
-                )
-                db.add(new_label)
-                saved_labels.append(new_label)
-
-        db.commit()
-
-        # Refresh all labels to get updated data
-        for label in saved_labels:
-            db.refresh(label)
+        # One INSERT ... ON CONFLICT DO UPDATE ... RETURNING for all labels
+        statement = speaker_label_service.upsert_statement(
+            transcript_id, [label_data.model_dump() for label_data in speaker_labels]
+        )
+        saved_labels = (await db.scalars(statement)).all() if statement is not None else []
+        await db.commit()
 
         logger.info(f"Saved {len(saved_labels)} speaker labels for transcript {transcript_id}")
         return saved_labels
@@ -176,7 +175,7 @@ async def save_speaker_labels(
         raise
     except Exception as e:
         logger.error(f"Error saving speaker labels: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save speaker labels: {str(e)}"
@@ -188,7 +187,7 @@ async def update_speaker_label(
     transcript_id: UUID,
     speaker_label_id: UUID,
     update_data: SpeakerLabelUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a specific speaker label.
@@ -204,7 +203,7 @@ async def update_speaker_label(
     """
     try:
         # Check if transcript exists
-        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
+        transcript = await db.get(Transcript, transcript_id)
         if not transcript:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -212,10 +211,13 @@ async def update_speaker_label(
             )
 
         # Get speaker label
-        speaker_label = db.query(SpeakerLabel).filter(
-            SpeakerLabel.id == speaker_label_id,
-            SpeakerLabel.transcript_id == transcript_id
-        ).first()
+        result = await db.execute(
+            select(SpeakerLabel).where(
+                SpeakerLabel.id == speaker_label_id,
+                SpeakerLabel.transcript_id == transcript_id
+            )
+        )
+        speaker_label = result.scalars().first()
 
         if not speaker_label:
             raise HTTPException(
@@ -229,8 +231,8 @@ async def update_speaker_label(
         if update_data.role is not None:
             speaker_label.role = update_data.role
 
-        db.commit()
-        db.refresh(speaker_label)
+        await db.commit()
+        await db.refresh(speaker_label)
 
         logger.info(f"Updated speaker label: {speaker_label_id}")
         return speaker_label
@@ -239,7 +241,7 @@ async def update_speaker_label(
         raise
     except Exception as e:
         logger.error(f"Error updating speaker label: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update speaker label: {str(e)}"
@@ -250,7 +252,7 @@ async def update_speaker_label(
 async def delete_speaker_label(
     transcript_id: UUID,
     speaker_label_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a speaker label.
@@ -265,10 +267,13 @@ async def delete_speaker_label(
     """
     try:
         # Get speaker label
-        speaker_label = db.query(SpeakerLabel).filter(
-            SpeakerLabel.id == speaker_label_id,
-            SpeakerLabel.transcript_id == transcript_id
-        ).first()
+        result = await db.execute(
+            select(SpeakerLabel).where(
+                SpeakerLabel.id == speaker_label_id,
+                SpeakerLabel.transcript_id == transcript_id
+            )
+        )
+        speaker_label = result.scalars().first()
 
         if not speaker_label:
             raise HTTPException(
@@ -276,8 +281,8 @@ async def delete_speaker_label(
                 detail=f"Speaker label {speaker_label_id} not found"
             )
 
-        db.delete(speaker_label)
-        db.commit()
+        await db.delete(speaker_label)
+        await db.commit()
 
         logger.info(f"Deleted speaker label: {speaker_label_id}")
         return None
@@ -286,8 +291,72 @@ async def delete_speaker_label(
         raise
     except Exception as e:
         logger.error(f"Error deleting speaker label: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete speaker label: {str(e)}"
         )
+
+
+@router.post("/webhooks/assemblyai")
+async def assemblyai_webhook(
+    payload: Dict[str, Any],
+    x_webhook_secret: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Receive AssemblyAI's transcript completion webhook.
+
+    AssemblyAI posts {"transcript_id": "...", "status": "completed" | "error"}
+    when a job finishes. The transcript is fetched and saved by a Celery
+    task so this endpoint returns immediately.
+
+    Args:
+        payload: Webhook body from AssemblyAI
+        x_webhook_secret: Shared secret configured via ASSEMBLYAI_WEBHOOK_SECRET
+        db: Database session
+
+    Returns:
+        Acknowledgement
+    """
+    try:
+        if settings.ASSEMBLYAI_WEBHOOK_SECRET and x_webhook_secret != settings.ASSEMBLYAI_WEBHOOK_SECRET:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook secret"
+            )
+
+        assemblyai_id = payload.get("transcript_id")
+        transcript_status = payload.get("status")
+
+        result = await db.execute(
+            select(Transcript)
+            .where(Transcript.assemblyai_id == assemblyai_id)
+        )
+        transcript = result.scalars().first()
+
+        if not transcript:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Transcript {assemblyai_id} not found"
+            )
+
+        if transcript_status not in ("completed", "error"):
+            logger.info(f"Ignoring AssemblyAI webhook for {assemblyai_id} with status {transcript_status}")
+            return {"received": True}
+
+        # Fetch and save outside the request (also records errors)
+        from app.tasks.transcription_tasks import complete_transcription_task
+        task = complete_transcription_task.delay(str(transcript.video_id))
+
+        logger.info(f"AssemblyAI webhook for {assemblyai_id} ({transcript_status}), task_id: {task.id}")
+        return {"received": True, "task_id": task.id}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error handling AssemblyAI webhook: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to handle AssemblyAI webhook: {str(e)}"
+        )
@@ -1,16 +1,46 @@
 """Video management and analysis API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from sqlalchemy import func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from uuid import UUID
 from pathlib import Path
 import logging
-
-from app.database import get_db
-from app.models.database_models import Project, Video, Transcript, VideoAnalysis
-from app.models.schemas import VideoUploadResponse, VideoResponse, VideoAnalysisResponse, TranscriptResponse
+import time
+import math
+import orjson
+
+from app.database import get_async_db
+from app.models.database_models import Project, Video, Transcript, VideoAnalysis, SpeakerLabel
+from app.models.schemas import (
+    VideoUploadResponse,
+    VideoResponse,
+    VideoAnalysisResponse,
+    AnalysisStageResponse,
+    TranscriptResponse,
+    MultipartUploadCreate,
+    MultipartUploadComplete,
+    MultipartUploadResponse,
+)
+from app.pagination import jsonb_array_page, next_offset
+from app.responses import (
+    etag_matches,
+    json_bytes_response,
+    load_json_row,
+    make_etag,
+    not_modified,
+    progress_messages,
+    set_etag,
+    sse_response,
+)
+from app.services.progress_service import progress_service
 from app.services.s3_service import s3_service
+from app.services.transcript_words_service import transcript_words_service
+from app.agents.states import VIDEO_ANALYSIS_STAGES, first_incomplete_stage
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,7 +52,7 @@ router = APIRouter()
 async def upload_video(
     project_id: UUID,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload a video file to S3 and create a video record.
@@ -37,7 +67,7 @@ async def upload_video(
     """
     try:
         # Check if project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -64,7 +94,8 @@ async def upload_video(
 
         # Upload to S3
         logger.info(f"Uploading video: {file.filename} for project {project_id}")
-        s3_key, s3_url = s3_service.upload_video(
+        s3_key, s3_url = await run_in_threadpool(
+            s3_service.upload_video,
             file=file.file,
             filename=file.filename,
             project_id=str(project_id)
@@ -81,8 +112,8 @@ async def upload_video(
         )
 
         db.add(video)
-        db.commit()
-        db.refresh(video)
+        await db.commit()
+        await db.refresh(video)
 
         logger.info(f"Video uploaded successfully: {video.id}")
         return video
@@ -91,37 +122,337 @@ async def upload_video(
         raise
     except Exception as e:
         logger.error(f"Error uploading video: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload video: {str(e)}"
         )
 
 
+S3_MAX_PARTS = 10000
+
+
+def _multipart_layout(file_size_bytes: int) -> Tuple[int, int]:
+    """Part size and part count for a file (within S3's 10,000 part limit)."""
+    part_size = max(
+        settings.MULTIPART_PART_SIZE_MB * 1024 * 1024,
+        math.ceil(file_size_bytes / S3_MAX_PARTS),
+    )
+    return part_size, max(1, math.ceil(file_size_bytes / part_size))
+
+
+def _check_file_size(file_size_bytes: int) -> None:
+    """Reject empty files and files over the upload limit (which also bounds the part count)."""
+    if file_size_bytes <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is empty"
+        )
+    if file_size_bytes > settings.MAX_FILE_SIZE_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+        )
+
+
+def _check_upload_key(project_id: UUID, s3_key: str) -> None:
+    """Reject S3 keys outside the project's video prefix."""
+    if not s3_key.startswith(s3_service.video_key_prefix(str(project_id))) or ".." in s3_key:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="S3 key does not belong to this project"
+        )
+
+
+async def _multipart_upload_response(
+    upload_id: str,
+    s3_key: str,
+    file_size_bytes: int,
+) -> MultipartUploadResponse:
+    """Describe an upload: parts already in S3 plus fresh URLs for the rest."""
+    part_size, part_count = _multipart_layout(file_size_bytes)
+    uploaded_parts = await run_in_threadpool(s3_service.list_uploaded_parts, s3_key, upload_id)
+    uploaded_numbers = {part["part_number"] for part in uploaded_parts}
+
+    part_urls = await run_in_threadpool(
+        s3_service.get_presigned_part_urls,
+        s3_key,
+        upload_id,
+        [number for number in range(1, part_count + 1) if number not in uploaded_numbers],
+        settings.MULTIPART_URL_EXPIRATION_SECONDS,
+    )
+
+    return MultipartUploadResponse(
+        upload_id=upload_id,
+        s3_key=s3_key,
+        part_size_bytes=part_size,
+        part_count=part_count,
+        parts=[
+            {"part_number": number, "url": url}
+            for number, url in sorted(part_urls.items())
+        ],
+        uploaded_parts=uploaded_parts,
+    )
+
+
+@router.post("/{project_id}/uploads", response_model=MultipartUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_multipart_upload(
+    project_id: UUID,
+    upload_data: MultipartUploadCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Start a direct-to-S3 multipart upload.
+
+    The client PUTs each part of the file to its presigned URL, keeping the
+    ETag response header of each, then calls the complete endpoint. No video
+    bytes pass through the API.
+
+    Args:
+        project_id: Project UUID to associate video with
+        upload_data: Filename and total size of the file
+        db: Database session
+
+    Returns:
+        Upload ID, S3 key, part size and a presigned URL per part
+    """
+    try:
+        # Check if project exists
+        project = await db.get(Project, project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project {project_id} not found"
+            )
+
+        # Validate file extension
+        file_extension = Path(upload_data.filename).suffix.lower()
+        if file_extension not in settings.ALLOWED_VIDEO_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_VIDEO_EXTENSIONS)}"
+            )
+
+        # Validate file size
+        _check_file_size(upload_data.file_size_bytes)
+
+        upload_id, s3_key = await run_in_threadpool(
+            s3_service.create_multipart_upload,
+            upload_data.filename,
+            str(project_id)
+        )
+
+        logger.info(f"Started multipart upload {upload_id} for {upload_data.filename} in project {project_id}")
+        return await _multipart_upload_response(upload_id, s3_key, upload_data.file_size_bytes)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error starting multipart upload: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start multipart upload: {str(e)}"
+        )
+
+
+@router.get("/{project_id}/uploads/{upload_id}", response_model=MultipartUploadResponse)
+async def resume_multipart_upload(
+    project_id: UUID,
+    upload_id: str,
+    s3_key: str,
+    file_size_bytes: int
+):
+    """
+    Resume a multipart upload.
+
+    Lists the parts S3 already has and issues fresh presigned URLs for the
+    missing ones, so an interrupted upload only re-sends what was lost.
+
+    Args:
+        project_id: Project UUID
+        upload_id: Multipart upload ID
+        s3_key: S3 key returned when the upload was started
+        file_size_bytes: Total size of the file
+
+    Returns:
+        Uploaded parts and presigned URLs for the remaining parts
+    """
+    try:
+        _check_upload_key(project_id, s3_key)
+        _check_file_size(file_size_bytes)
+        return await _multipart_upload_response(upload_id, s3_key, file_size_bytes)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error resuming multipart upload: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to resume multipart upload: {str(e)}"
+        )
+
+
+@router.post("/{project_id}/uploads/{upload_id}/complete", response_model=VideoUploadResponse, status_code=status.HTTP_201_CREATED)
+async def complete_multipart_upload(
+    project_id: UUID,
+    upload_id: str,
+    upload_data: MultipartUploadComplete,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Complete a multipart upload and create the video record.
+
+    Args:
+        project_id: Project UUID to associate video with
+        upload_id: Multipart upload ID
+        upload_data: S3 key, filename, the uploaded parts' ETags
+            (listed from S3 if omitted) and the video's duration, if known
+        db: Database session
+
+    Returns:
+        Created video record with S3 details
+    """
+    try:
+        _check_upload_key(project_id, upload_data.s3_key)
+
+        # Check if project exists
+        project = await db.get(Project, project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project {project_id} not found"
+            )
+
+        if upload_data.parts:
+            parts = [part.model_dump() for part in upload_data.parts]
+        else:
+            parts = await run_in_threadpool(s3_service.list_uploaded_parts, upload_data.s3_key, upload_id)
+        if not parts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No parts have been uploaded"
+            )
+
+        file_size = await run_in_threadpool(
+            s3_service.complete_multipart_upload,
+            upload_data.s3_key,
+            upload_id,
+            parts
+        )
+
+        # Enforce the size limit on what actually arrived
+        if file_size > settings.MAX_FILE_SIZE_MB * 1024 * 1024:
+            await run_in_threadpool(s3_service.delete_video, upload_data.s3_key)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+            )
+
+        # Create video record in database
+        video = Video(
+            project_id=project_id,
+            filename=upload_data.filename,
+            s3_key=upload_data.s3_key,
+            s3_url=s3_service.get_object_url(upload_data.s3_key),
+            file_size_bytes=file_size,
+            # Spaces out transcription status checks for long recordings
+            duration_seconds=upload_data.duration_seconds if (upload_data.duration_seconds or 0) > 0 else None,
+            status="uploaded"
+        )
+
+        db.add(video)
+        await db.commit()
+        await db.refresh(video)
+
+        logger.info(f"Multipart upload {upload_id} completed as video {video.id}")
+        return video
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error completing multipart upload: {e}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to complete multipart upload: {str(e)}"
+        )
+
+
+@router.delete("/{project_id}/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_multipart_upload(
+    project_id: UUID,
+    upload_id: str,
+    s3_key: str
+):
+    """
+    Abort a multipart upload and discard any uploaded parts.
+
+    Args:
+        project_id: Project UUID
+        upload_id: Multipart upload ID
+        s3_key: S3 key returned when the upload was started
+
+    Returns:
+        No content
+    """
+    try:
+        _check_upload_key(project_id, s3_key)
+        await run_in_threadpool(s3_service.abort_multipart_upload, s3_key, upload_id)
+
+        logger.info(f"Aborted multipart upload {upload_id} for project {project_id}")
+        return None
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error aborting multipart upload: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to abort multipart upload: {str(e)}"
+        )
+
+
 @router.get("/{video_id}", response_model=VideoResponse)
 async def get_video(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific video by ID.
 
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag.
+
     Args:
         video_id: Video UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session
 
     Returns:
         Video details
     """
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
+        result = await db.execute(
+            select(Video.status, Video.updated_at)
+            .where(Video.id == video_id)
+        )
+        version = result.first()
 
-        if not video:
+        if not version:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Video {video_id} not found"
             )
 
+        etag = make_etag("video", video_id, version.updated_at, version.status)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        video = await db.get(Video, video_id)
+        set_etag(response, etag)
+
         logger.info(f"Retrieved video: {video_id}")
         return video
 
@@ -138,7 +469,7 @@ async def get_video(
 @router.delete("/{video_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_video(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a video and its S3 file.
@@ -151,7 +482,7 @@ async def delete_video(
         No content
     """
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
 
         if not video:
             raise HTTPException(
@@ -161,14 +492,14 @@ async def delete_video(
 
         # Delete from S3
         try:
-            s3_service.delete_video(video.s3_key)
+            await run_in_threadpool(s3_service.delete_video, video.s3_key)
         except Exception as e:
             logger.warning(f"Failed to delete S3 object: {e}")
             # Continue with database deletion even if S3 deletion fails
 
         # Delete from database (cascade will handle related records)
-        db.delete(video)
-        db.commit()
+        await db.delete(video)
+        await db.commit()
 
         logger.info(f"Deleted video: {video_id}")
         return None
@@ -177,7 +508,7 @@ async def delete_video(
         raise
     except Exception as e:
         logger.error(f"Error deleting video: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete video: {str(e)}"
@@ -187,7 +518,7 @@ async def delete_video(
 @router.get("/{video_id}/playback-url")
 async def get_video_playback_url(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate a fresh presigned URL for video playback.
@@ -200,7 +531,7 @@ async def get_video_playback_url(
         Presigned URL for video playback
     """
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
         if not video:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -229,38 +560,52 @@ async def get_video_playback_url(
 @router.get("/{video_id}/transcript", response_model=TranscriptResponse)
 async def get_video_transcript(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the transcript for a specific video.
 
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag,
+    without loading the transcript JSONB.
+
     Args:
         video_id: Video UUID
+        request: Incoming request (for If-None-Match and Accept-Encoding)
         db: Database session
 
     Returns:
         Transcript details
     """
     try:
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if not video:
+        # Check the version first so unchanged polls skip the JSONB columns
+        result = await db.execute(
+            select(Transcript.id, Transcript.status, Transcript.updated_at)
+            .where(Transcript.video_id == video_id)
+        )
+        version = result.first()
+
+        if not version:
+            video = await db.get(Video, video_id)
+            if not video:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Video {video_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Video {video_id} not found"
+                detail=f"No transcript found for video {video_id}"
             )
 
-        transcript = db.query(Transcript)\
-            .filter(Transcript.video_id == video_id)\
-            .first()
+        etag = make_etag("transcript", version.id, version.updated_at, version.status)
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No transcript found for video {video_id}"
-            )
+        # Stored JSONB is sent as-is: no decode, response_model validation or re-encode
+        body = await load_json_row(db, Transcript, version.id, TranscriptResponse)
 
         logger.info(f"Retrieved transcript for video {video_id}")
-        return transcript
+        return await json_bytes_response(request, body, etag)
 
     except HTTPException:
         raise
@@ -275,7 +620,7 @@ async def get_video_transcript(
 @router.post("/{video_id}/transcribe", status_code=status.HTTP_202_ACCEPTED)
 async def start_transcription(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Start transcription process for a video using AssemblyAI.
@@ -292,7 +637,7 @@ async def start_transcription(
     """
     try:
         # Check if video exists
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
         if not video:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -300,9 +645,11 @@ async def start_transcription(
             )
 
         # Check if transcript already exists
-        existing_transcript = db.query(Transcript)\
-            .filter(Transcript.video_id == video_id)\
-            .first()
+        result = await db.execute(
+            select(Transcript)
+            .where(Transcript.video_id == video_id)
+        )
+        existing_transcript = result.scalars().first()
 
         if existing_transcript and existing_transcript.status == "completed":
             raise HTTPException(
@@ -322,10 +669,13 @@ async def start_transcription(
 
         # Update video status
         video.status = "transcribing"
-        db.commit()
+        await db.commit()
 
         # Trigger Celery task
         from app.tasks.transcription_tasks import transcribe_video_task
+        await progress_service.publish_async(
+            "transcription", "queued", "pending", video_id=video_id, project_id=video.project_id
+        )
         task = transcribe_video_task.delay(str(video_id))
 
         logger.info(f"Transcription task started for video {video_id}, task_id: {task.id}")
@@ -340,7 +690,7 @@ async def start_transcription(
         raise
     except Exception as e:
         logger.error(f"Error starting transcription: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start transcription: {str(e)}"
@@ -350,16 +700,23 @@ async def start_transcription(
 @router.post("/{video_id}/analyze", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_video_analysis(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    use_cache: bool = True,
+    resume: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Trigger the 5-step analysis process for a video.
 
+    With resume=true, stages whose output was saved by a previous (failed)
+    run are kept and analysis restarts from the first incomplete stage.
+
     This endpoint will be fully implemented in Phase 5 with Celery tasks.
     For now, it creates an analysis record and returns a placeholder.
 
     Args:
         video_id: Video UUID
+        use_cache: Set False to force fresh Claude calls instead of cached responses
+        resume: Restart from the first incomplete stage instead of from CHUNK
         db: Database session
 
     Returns:
@@ -367,7 +724,7 @@ async def trigger_video_analysis(
     """
     try:
         # Check if video exists
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
         if not video:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -375,9 +732,11 @@ async def trigger_video_analysis(
             )
 
         # Check if transcript is completed
-        transcript = db.query(Transcript)\
-            .filter(Transcript.video_id == video_id)\
-            .first()
+        result = await db.execute(
+            select(Transcript)
+            .where(Transcript.video_id == video_id)
+        )
+        transcript = result.scalars().first()
 
         if not transcript or transcript.status != "completed":
             raise HTTPException(
@@ -386,9 +745,23 @@ async def trigger_video_analysis(
             )
 
         # Create or get existing video analysis
-        video_analysis = db.query(VideoAnalysis)\
-            .filter(VideoAnalysis.video_id == video_id)\
-            .first()
+        result = await db.execute(
+            select(VideoAnalysis)
+            .where(VideoAnalysis.video_id == video_id)
+        )
+        video_analysis = result.scalars().first()
+
+        resume_from = "chunk"
+        if resume and video_analysis:
+            resume_from = first_incomplete_stage({
+                output_key: getattr(video_analysis, output_key)
+                for output_key in VIDEO_ANALYSIS_STAGES.values()
+            })
+            if resume_from is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Analysis has no incomplete stages to resume; trigger it without resume to re-run"
+                )
 
         if not video_analysis:
             video_analysis = VideoAnalysis(
@@ -402,19 +775,23 @@ async def trigger_video_analysis(
 
         # Update video status
         video.status = "analyzing"
-        db.commit()
-        db.refresh(video_analysis)
+        await db.commit()
+        await db.refresh(video_analysis)
 
         # Trigger Celery task
         from app.tasks.analysis_tasks import analyze_video_task
-        task = analyze_video_task.delay(str(video_id))
+        await progress_service.publish_async(
+            "video_analysis", "queued", "pending", video_id=video_id, project_id=video.project_id
+        )
+        task = analyze_video_task.delay(str(video_id), use_cache=use_cache, resume=resume)
 
-        logger.info(f"Video analysis task started for video {video_id}, task_id: {task.id}")
+        logger.info(f"Video analysis task started for video {video_id} from stage {resume_from}, task_id: {task.id}")
         return {
             "message": "Video analysis task started",
             "video_id": str(video_id),
             "analysis_id": str(video_analysis.id),
             "task_id": task.id,
+            "resume_from": resume_from,
             "status": "processing"
         }
 
@@ -422,7 +799,7 @@ async def trigger_video_analysis(
         raise
     except Exception as e:
         logger.error(f"Error triggering video analysis: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to trigger video analysis: {str(e)}"
@@ -432,55 +809,379 @@ async def trigger_video_analysis(
 @router.get("/{video_id}/analysis", response_model=VideoAnalysisResponse)
 async def get_video_analysis(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get analysis results for a video.
 
+    Supports conditional GET: returns 304 if If-None-Match matches the ETag,
+    without loading the analysis JSONB.
+
     Args:
         video_id: Video UUID
+        request: Incoming request (for If-None-Match and Accept-Encoding)
         db: Database session
 
     Returns:
         Video analysis results
     """
     try:
-        # Check if video exists
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if not video:
+        # Check the version first so unchanged polls skip the JSONB columns
+        result = await db.execute(
+            select(
+                VideoAnalysis.id,
+                VideoAnalysis.status,
+                VideoAnalysis.completed_at,
+                VideoAnalysis.updated_at,
+            )
+            .where(VideoAnalysis.video_id == video_id)
+        )
+        version = result.first()
+
+        if not version:
+            # Check if video exists
+            video = await db.get(Video, video_id)
+            if not video:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Video {video_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Video {video_id} not found"
+                detail=f"No analysis found for video {video_id}"
             )
 
-        # Get video analysis
-        video_analysis = db.query(VideoAnalysis)\
-            .filter(VideoAnalysis.video_id == video_id)\
-            .first()
+        etag = make_etag(
+            "video_analysis", version.id, version.updated_at, version.completed_at, version.status
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-        if not video_analysis:
+        # Stored JSONB is sent as-is: no decode, response_model validation or re-encode
+        body = await load_json_row(db, VideoAnalysis, version.id, VideoAnalysisResponse)
+
+        logger.info(f"Retrieved video analysis for video {video_id}")
+        return await json_bytes_response(request, body, etag)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting video analysis: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get video analysis: {str(e)}"
+        )
+
+
+@router.get("/{video_id}/analysis/{stage}", response_model=AnalysisStageResponse)
+async def get_video_analysis_stage(
+    video_id: UUID,
+    stage: Literal["chunks", "inferences", "patterns", "insights", "design_principles"],
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get one page of a single analysis stage's output.
+
+    Only the requested slice of the stage's JSONB column is read; the other
+    stages are never loaded. Supports conditional GET like /analysis.
+
+    Args:
+        video_id: Video UUID
+        stage: Stage output (chunks, inferences, patterns, insights, design_principles)
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
+        offset: Index of the first item
+        limit: Maximum number of items (up to 500)
+        db: Database session
+
+    Returns:
+        Page of stage items with total and next_offset
+    """
+    try:
+        result = await db.execute(
+            select(
+                VideoAnalysis.id,
+                VideoAnalysis.status,
+                VideoAnalysis.completed_at,
+                VideoAnalysis.updated_at,
+            )
+            .where(VideoAnalysis.video_id == video_id)
+        )
+        version = result.first()
+
+        if not version:
+            video = await db.get(Video, video_id)
+            if not video:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Video {video_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No analysis found for video {video_id}"
             )
 
-        logger.info(f"Retrieved video analysis for video {video_id}")
-        return video_analysis
+        etag = make_etag(
+            "video_analysis", version.id, version.updated_at, version.completed_at, version.status,
+            stage, offset, limit
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        total_column, items_column = jsonb_array_page(getattr(VideoAnalysis, stage), offset, limit)
+        result = await db.execute(
+            select(total_column, items_column).where(VideoAnalysis.id == version.id)
+        )
+        total, items = result.one()
+        items = items or []
+        set_etag(response, etag)
+
+        logger.info(f"Retrieved {len(items)} {stage} from offset {offset} for video {video_id}")
+        return {
+            "analysis_id": version.id,
+            "stage": stage,
+            "status": version.status,
+            "items": items,
+            "offset": offset,
+            "limit": limit,
+            "total": total or 0,
+            "next_offset": next_offset(offset, len(items), total or 0),
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting video analysis: {e}")
+        logger.error(f"Error getting video analysis stage: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get video analysis: {str(e)}"
+            detail=f"Failed to get video analysis stage: {str(e)}"
         )
 
 
+@router.get("/{video_id}/events")
+async def stream_video_progress(
+    video_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream transcription and analysis progress as Server-Sent Events.
+
+    Sends a "snapshot" event with the current state, then a "transcription"
+    or "video_analysis" event on every state change, pushed by the Celery
+    tasks through Redis pub/sub.
+
+    Args:
+        video_id: Video UUID
+        request: Incoming request (to detect disconnects)
+        db: Database session
+
+    Returns:
+        text/event-stream response
+    """
+    events = None
+    try:
+        # Subscribe before reading the snapshot so no change falls in between
+        events = await progress_service.subscribe(progress_service.video_channel(video_id))
+        snapshot_at = time.time()
+
+        result = await db.execute(
+            select(Video.status, Video.project_id, Video.error_message)
+            .where(Video.id == video_id)
+        )
+        video = result.first()
+        if not video:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Video {video_id} not found"
+            )
+
+        result = await db.execute(
+            select(Transcript.status).where(Transcript.video_id == video_id)
+        )
+        transcript_status = result.scalar()
+
+        # IS NOT NULL checks do not read the stage output JSONB
+        result = await db.execute(
+            select(
+                VideoAnalysis.status,
+                VideoAnalysis.failed_stage,
+                *[
+                    getattr(VideoAnalysis, output_key).isnot(None).label(stage)
+                    for stage, output_key in VIDEO_ANALYSIS_STAGES.items()
+                ],
+            )
+            .where(VideoAnalysis.video_id == video_id)
+        )
+        analysis = result.first()
+
+        snapshot = {
+            "video_id": str(video_id),
+            "project_id": str(video.project_id),
+            "status": video.status,
+            "error_message": video.error_message,
+            "transcript_status": transcript_status,
+            "analysis_status": analysis.status if analysis else None,
+            "failed_stage": analysis.failed_stage if analysis else None,
+            "completed_stages": [
+                stage for stage in VIDEO_ANALYSIS_STAGES if analysis and getattr(analysis, stage)
+            ],
+        }
+
+        events.drop_stale(snapshot_at)
+
+        # Release the connection; the stream can stay open for a long time
+        await db.close()
+
+        return sse_response(progress_messages(request, snapshot, events))
+
+    except HTTPException:
+        if events is not None:
+            await events.aclose()
+        raise
+    except Exception as e:
+        if events is not None:
+            await events.aclose()
+        logger.error(f"Error streaming video progress: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to stream video progress: {str(e)}"
+        )
+
+
+async def _speaker_map(db: AsyncSession, transcript_id: UUID) -> Dict[str, str]:
+    """Speaker label -> assigned name (or the label if none is assigned)."""
+    result = await db.execute(
+        select(SpeakerLabel.speaker_label, SpeakerLabel.assigned_name)
+        .where(SpeakerLabel.transcript_id == transcript_id)
+    )
+    return {label: assigned_name or label for label, assigned_name in result.all()}
+
+
+async def _load_word_columns(db: AsyncSession, transcript_id: UUID, packed: bool) -> Any:
+    """
+    Load a transcript's precomputed word columns (JSON or packed).
+
+    Transcripts saved before the encodings existed are encoded from
+    raw_transcript once and stored.
+    """
+    column = Transcript.word_columns_packed if packed else Transcript.word_columns
+    result = await db.execute(select(column).where(Transcript.id == transcript_id))
+    encoded = result.scalar()
+    if encoded is not None:
+        return encoded
+
+    result = await db.execute(
+        select(Transcript.raw_transcript["words"], Transcript.raw_transcript["audio_duration"])
+        .where(Transcript.id == transcript_id)
+    )
+    words, audio_duration = result.one()
+    word_columns = transcript_words_service.build_word_columns(words or [], audio_duration)
+    word_columns_packed = transcript_words_service.pack_word_columns(word_columns)
+
+    await db.execute(
+        update(Transcript)
+        .where(Transcript.id == transcript_id)
+        .values(word_columns=word_columns, word_columns_packed=word_columns_packed)
+    )
+    await db.commit()
+    logger.info(f"Built word columns for transcript {transcript_id}")
+
+    return word_columns_packed if packed else word_columns
+
+
+async def _word_window(
+    db: AsyncSession,
+    video_id: UUID,
+    start_ms: Optional[int],
+    end_ms: Optional[int],
+    cursor: Optional[int],
+    limit: int,
+) -> Dict[str, Any]:
+    """Words in a time window, without loading the full words list."""
+    result = await db.execute(
+        select(Transcript.id, Transcript.word_starts)
+        .where(Transcript.video_id == video_id, Transcript.raw_transcript.isnot(None))
+    )
+    transcript = result.first()
+
+    if not transcript:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No transcript found for video {video_id}"
+        )
+
+    word_starts = transcript.word_starts
+    if word_starts is None:
+        # Transcripts saved before word_starts existed: extract and store once
+        result = await db.execute(
+            select(func.jsonb_path_query_array(
+                Transcript.raw_transcript,
+                literal_column("'$.words[*].start'::jsonpath"),
+                type_=JSONB,
+            ))
+            .where(Transcript.id == transcript.id)
+        )
+        word_starts = transcript_words_service.pack_word_starts(result.scalar() or [])
+        await db.execute(
+            update(Transcript)
+            .where(Transcript.id == transcript.id)
+            .values(word_starts=word_starts)
+        )
+        await db.commit()
+
+    lo, hi, total = transcript_words_service.word_range(word_starts, start_ms, end_ms, cursor, limit)
+
+    # Slice just the window out of raw_transcript in the database
+    columns = [Transcript.raw_transcript["audio_duration"]]
+    if hi > lo:
+        columns.append(func.jsonb_path_query_array(
+            Transcript.raw_transcript,
+            literal_column("'$.words[$lo to $hi]'::jsonpath"),
+            func.jsonb_build_object("lo", lo, "hi", hi - 1),
+            type_=JSONB,
+        ))
+    result = await db.execute(select(*columns).where(Transcript.id == transcript.id))
+    row = result.one()
+    words = row[1] if hi > lo else []
+
+    speaker_map = await _speaker_map(db, transcript.id)
+    words_with_names = []
+    for word in words:
+        speaker = word.get("speaker", "Unknown")
+        words_with_names.append({
+            "text": word.get("text", ""),
+            "start": word.get("start", 0),
+            "end": word.get("end", 0),
+            "speaker": speaker_map.get(speaker, speaker),
+            "confidence": word.get("confidence", 1.0)
+        })
+
+    logger.info(f"Retrieved words {lo}-{hi} of {total} for video {video_id}")
+    return {
+        "words": words_with_names,
+        "duration": row[0] or 0,
+        "start_index": lo,
+        "total_words": total,
+        "next_cursor": hi if hi < total else None,
+    }
+
+
 @router.get("/{video_id}/transcript/words")
 async def get_word_level_transcript(
     video_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    format: Literal["objects", "columnar", "packed"] = "objects",
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None,
+    cursor: Optional[int] = None,
+    limit: int = 1000,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Returns word-level transcript with speaker names mapped.
@@ -488,8 +1189,27 @@ async def get_word_level_transcript(
     This endpoint provides word-level timing data for video-transcript synchronization,
     with speaker labels mapped to their assigned names for display.
 
+    format=columnar returns precomputed parallel arrays instead of one object
+    per word: "text", "start_delta" (start minus the previous word's start,
+    the first being absolute), "end_offset" (end minus start), "confidence"
+    (integers, divide by "confidence_scale"), "speaker" (index into
+    "speakers"), plus "speakers" and "duration". format=packed returns the
+    same data as a binary application/octet-stream payload (layout documented
+    on TranscriptWordsService).
+
+    With start_ms/end_ms (or a cursor from a previous page) only the words in
+    that window are returned, found by binary search over the stored word
+    start times and sliced out of raw_transcript in the database. The
+    response then also has "start_index", "total_words" and "next_cursor".
+
     Args:
         video_id: Video UUID
+        format: "objects" (default), "columnar" or "packed"
+        start_ms: Window start in ms (the word in progress is included)
+        end_ms: Window end in ms (exclusive)
+        cursor: Word index to continue from ("next_cursor" of a previous page)
+        limit: Maximum words per window
+        request: Incoming request (for Accept-Encoding)
         db: Database session
 
     Returns:
@@ -508,16 +1228,58 @@ async def get_word_level_transcript(
     """
     try:
         # Get video and transcript
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
         if not video:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Video {video_id} not found"
             )
 
-        transcript = db.query(Transcript)\
-            .filter(Transcript.video_id == video_id)\
-            .first()
+        windowed = start_ms is not None or end_ms is not None or cursor is not None
+        if windowed:
+            if format != "objects":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Time-window queries are only supported with format=objects"
+                )
+            if limit < 1:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="limit must be at least 1"
+                )
+            return await _word_window(db, video_id, start_ms, end_ms, cursor, limit)
+
+        if format != "objects":
+            result = await db.execute(
+                select(Transcript.id)
+                .where(Transcript.video_id == video_id, Transcript.raw_transcript.isnot(None))
+            )
+            transcript_id = result.scalar()
+
+            if not transcript_id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"No transcript found for video {video_id}"
+                )
+
+            speaker_map = await _speaker_map(db, transcript_id)
+            encoded = await _load_word_columns(db, transcript_id, packed=format == "packed")
+
+            logger.info(f"Retrieved {format} words for video {video_id}")
+            if format == "packed":
+                return Response(
+                    content=transcript_words_service.packed_with_speaker_names(encoded, speaker_map),
+                    media_type="application/octet-stream"
+                )
+            return await json_bytes_response(
+                request, orjson.dumps(transcript_words_service.with_speaker_names(encoded, speaker_map))
+            )
+
+        result = await db.execute(
+            select(Transcript)
+            .where(Transcript.video_id == video_id)
+        )
+        transcript = result.scalars().first()
 
         if not transcript or not transcript.raw_transcript:
             raise HTTPException(
@@ -526,14 +1288,7 @@ async def get_word_level_transcript(
             )
 
         # Get speaker labels mapping
-        from app.models.database_models import SpeakerLabel
-        speaker_labels = db.query(SpeakerLabel)\
-            .filter(SpeakerLabel.transcript_id == transcript.id)\
-            .all()
-
-        speaker_map = {}
-        for label in speaker_labels:
-            speaker_map[label.speaker_label] = label.assigned_name or label.speaker_label
+        speaker_map = await _speaker_map(db, transcript.id)
 
         # Get words from raw_transcript JSONB field
         words = transcript.raw_transcript.get("words", [])
@@ -554,10 +1309,10 @@ async def get_word_level_transcript(
         duration = transcript.raw_transcript.get("audio_duration", 0)
 
         logger.info(f"Retrieved {len(words_with_names)} words for video {video_id}")
-        return {
+        return await json_bytes_response(request, orjson.dumps({
             "words": words_with_names,
             "duration": duration
-        }
+        }))
 
     except HTTPException:
         raise
@@ -573,23 +1328,28 @@ async def get_word_level_transcript(
 async def search_transcript_words(
     video_id: UUID,
     query: str,
-    db: Session = Depends(get_db)
+    prefix: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Search for specific words using AssemblyAI Word Search API.
+    Search for specific words or phrases in a video's transcript.
 
-    This endpoint allows searching the transcript for specific words and returns
-    timestamps where those words appear, enabling quick navigation to relevant sections.
+    Served from the transcript's inverted word index (built when the
+    transcript is saved, or on the first search for older transcripts)
+    with the same response shape as AssemblyAI's Word Search API, enabling
+    quick navigation to relevant sections.
 
-    Example: /api/videos/{id}/transcript/search?query=design,prototype,user
+    Example: /api/videos/{id}/transcript/search?query=design,user research
 
     Args:
         video_id: Video UUID
-        query: Comma-separated words to search for
+        query: Comma-separated words or phrases to search for
+        prefix: Match the last word of each term as a prefix (for search-as-you-type)
         db: Database session
 
     Returns:
         {
+            "id": "assemblyai-transcript-id",
             "total_count": 42,
             "matches": [
                 {
@@ -602,43 +1362,56 @@ async def search_transcript_words(
         }
     """
     try:
-        import httpx
-
-        video = db.query(Video).filter(Video.id == video_id).first()
+        video = await db.get(Video, video_id)
         if not video:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Video {video_id} not found"
             )
 
-        transcript = db.query(Transcript)\
-            .filter(Transcript.video_id == video_id)\
-            .first()
+        result = await db.execute(
+            select(Transcript.id, Transcript.assemblyai_id)
+            .where(Transcript.video_id == video_id, Transcript.status == "completed")
+        )
+        transcript = result.first()
 
-        if not transcript or not transcript.assemblyai_id:
+        if not transcript:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No transcript found for video {video_id}"
             )
 
-        # Call AssemblyAI Word Search API
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://api.assemblyai.com/v2/transcript/{transcript.assemblyai_id}/word-search",
-                params={"words": query},
-                headers={"authorization": settings.ASSEMBLYAI_API_KEY}
-            )
+        # A re-transcription gets a new AssemblyAI ID, so cached indexes don't go stale
+        cache_key = (transcript.id, transcript.assemblyai_id)
+        word_index = transcript_words_service.get_cached(cache_key)
 
-        if response.status_code != 200:
-            logger.error(f"AssemblyAI Word Search API error: {response.text}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to search transcript"
+        if word_index is None:
+            result = await db.execute(
+                select(Transcript.word_index).where(Transcript.id == transcript.id)
             )
+            index_data = result.scalar()
+
+            if index_data is None:
+                # Transcripts saved before indexing existed: build and store once
+                result = await db.execute(
+                    select(Transcript.raw_transcript["words"]).where(Transcript.id == transcript.id)
+                )
+                words = result.scalar() or []
+                index_data = transcript_words_service.build_word_index(words)
+                await db.execute(
+                    update(Transcript)
+                    .where(Transcript.id == transcript.id)
+                    .values(word_index=index_data)
+                )
+                await db.commit()
+                logger.info(f"Built word index for transcript {transcript.id}")
+
+            word_index = transcript_words_service.load(cache_key, index_data)
+
+        search_result = transcript_words_service.search(word_index, query, prefix=prefix)
 
-        result = response.json()
         logger.info(f"Word search completed for video {video_id}, query: {query}")
-        return result
+        return {"id": transcript.assemblyai_id, **search_result}
 
     except HTTPException:
         raise
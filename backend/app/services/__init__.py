@@ -3,6 +3,13 @@
 from app.services.s3_service import s3_service, S3Service
 from app.services.assemblyai_service import assemblyai_service, AssemblyAIService
 from app.services.claude_service import claude_service, ClaudeService
+from app.services.async_claude_service import async_claude_service, AsyncClaudeService
+from app.services.llm_cache_service import llm_cache_service, LLMCacheService
+from app.services.rate_limiter import rate_limiter, RateLimiter
+from app.services.transcript_words_service import transcript_words_service, TranscriptWordsService
+from app.services.progress_service import progress_service, ProgressService
+from app.services.speaker_label_service import speaker_label_service, SpeakerLabelService
+from app.services.synthesis_input_builder import synthesis_input_builder, SynthesisInputBuilder
 
 __all__ = [
     "s3_service",
@@ -11,4 +18,18 @@ __all__ = [
     "AssemblyAIService",
     "claude_service",
     "ClaudeService",
+    "async_claude_service",
+    "AsyncClaudeService",
+    "llm_cache_service",
+    "LLMCacheService",
+    "rate_limiter",
+    "RateLimiter",
+    "transcript_words_service",
+    "TranscriptWordsService",
+    "progress_service",
+    "ProgressService",
+    "speaker_label_service",
+    "SpeakerLabelService",
+    "synthesis_input_builder",
+    "SynthesisInputBuilder",
 ]
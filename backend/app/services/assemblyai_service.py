@@ -1,7 +1,8 @@
 """AssemblyAI service for transcription with speaker diarization."""
 
 import assemblyai as aai
-from typing import Dict, Any, Optional
+import httpx
+from typing import Dict, Any, Optional, Tuple
 import logging
 import time
 
@@ -16,16 +17,28 @@ aai.settings.api_key = settings.ASSEMBLYAI_API_KEY
 class AssemblyAIService:
     """Service for transcribing videos with speaker diarization."""
 
+    WEBHOOK_AUTH_HEADER = "X-Webhook-Secret"
+    API_BASE_URL = "https://api.assemblyai.com/v2"
+
     def __init__(self):
         """Initialize AssemblyAI service."""
         self.transcriber = aai.Transcriber()
+        self.http = httpx.Client(
+            base_url=self.API_BASE_URL,
+            headers={"authorization": settings.ASSEMBLYAI_API_KEY},
+            timeout=60,
+        )
 
-    def start_transcription(self, audio_url: str) -> str:
+    def start_transcription(self, audio_url: str, webhook_url: Optional[str] = None) -> str:
         """
-        Start transcription job with speaker diarization and identification.
+        Submit a transcription job with speaker diarization and identification.
+
+        Returns as soon as the job is queued; completion is reported to
+        webhook_url (if given) or found by polling.
 
         Args:
             audio_url: URL of audio/video file (can be S3 presigned URL)
+            webhook_url: URL AssemblyAI calls when the transcript completes
 
         Returns:
             Transcript ID from AssemblyAI
@@ -45,18 +58,37 @@ class AssemblyAIService:
             except AttributeError:
                 logger.info("SpeechModel not available in this AssemblyAI version, using default")
 
-            transcript = self.transcriber.transcribe(
+            if webhook_url:
+                config.set_webhook(
+                    webhook_url,
+                    auth_header_name=self.WEBHOOK_AUTH_HEADER if settings.ASSEMBLYAI_WEBHOOK_SECRET else None,
+                    auth_header_value=settings.ASSEMBLYAI_WEBHOOK_SECRET or None,
+                )
+
+            transcript = self.transcriber.submit(
                 audio_url,
                 config=config
             )
 
-            logger.info(f"Started transcription with speaker identification: {transcript.id}")
+            logger.info(f"Submitted transcription with speaker identification: {transcript.id}")
             return transcript.id
 
         except Exception as e:
             logger.error(f"Error starting transcription: {e}")
             raise Exception(f"Failed to start transcription: {str(e)}")
 
+    def _fetch_transcript_json(self, transcript_id: str) -> Dict[str, Any]:
+        """
+        GET the raw transcript resource from the REST API.
+
+        AssemblyAI has no status-only endpoint, but until a job completes the
+        resource carries no text, words or utterances, so this stays small
+        while polling. Once completed, the same response is the full result.
+        """
+        response = self.http.get(f"/transcript/{transcript_id}")
+        response.raise_for_status()
+        return response.json()
+
     def get_transcript_status(self, transcript_id: str) -> str:
         """
         Get the status of a transcription job.
@@ -67,12 +99,34 @@ class AssemblyAIService:
         Returns:
             Status string: "queued", "processing", "completed", "error"
 
+        Raises:
+            Exception: If status check fails
+        """
+        status, _ = self.check_transcript(transcript_id)
+        return status
+
+    def check_transcript(self, transcript_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Check a job's status, returning the transcript too once it's completed.
+
+        Callers that need the transcript after a "completed" check use the
+        returned data instead of downloading it a second time.
+
+        Args:
+            transcript_id: AssemblyAI transcript ID
+
+        Returns:
+            Tuple of (status, transcript data or None if not completed)
+
         Raises:
             Exception: If status check fails
         """
         try:
-            transcript = aai.Transcript.get_by_id(transcript_id)
-            return transcript.status.value
+            payload = self._fetch_transcript_json(transcript_id)
+            status = payload.get("status")
+            if status == "completed":
+                return status, self._build_result(payload)
+            return status, None
 
         except Exception as e:
             logger.error(f"Error checking transcript status: {e}")
@@ -92,45 +146,50 @@ class AssemblyAIService:
             Exception: If transcript retrieval fails
         """
         try:
-            transcript = aai.Transcript.get_by_id(transcript_id)
+            payload = self._fetch_transcript_json(transcript_id)
 
-            if transcript.status != aai.TranscriptStatus.completed:
-                raise Exception(f"Transcript not ready. Status: {transcript.status}")
-
-            # Process utterances (speaker-labeled segments)
-            utterances = []
-            if transcript.utterances:
-                for utterance in transcript.utterances:
-                    utterances.append({
-                        "speaker": utterance.speaker,
-                        "text": utterance.text,
-                        "start": utterance.start,
-                        "end": utterance.end,
-                        "confidence": utterance.confidence,
-                    })
-
-            # Build result
-            result = {
-                "id": transcript.id,
-                "text": transcript.text,
-                "utterances": utterances,
-                "audio_duration": transcript.audio_duration,
-                "confidence": transcript.confidence,
-                "words": self._process_words(transcript.words) if transcript.words else [],
-            }
+            if payload.get("status") != "completed":
+                raise Exception(f"Transcript not ready. Status: {payload.get('status')}")
 
             logger.info(f"Retrieved transcript: {transcript_id}")
-            return result
+            return self._build_result(payload)
 
         except Exception as e:
             logger.error(f"Error retrieving transcript: {e}")
             raise Exception(f"Failed to retrieve transcript: {str(e)}")
 
+    @staticmethod
+    def next_poll_delay(
+        attempt: int,
+        audio_duration_seconds: Optional[float] = None,
+        base_interval: float = 5,
+    ) -> float:
+        """
+        Seconds to wait before the next status check.
+
+        Transcription takes a fraction of the audio length, so both the first
+        interval and the cap grow with the recording's duration, and intervals
+        back off exponentially in between.
+
+        Args:
+            attempt: Number of checks already made (0 for the first)
+            audio_duration_seconds: Recording length, if known
+            base_interval: Minimum interval in seconds
+
+        Returns:
+            Delay in seconds
+        """
+        duration = audio_duration_seconds or 0
+        first_interval = max(base_interval, duration * 0.02)
+        max_interval = max(60, duration * 0.1, base_interval)
+        return min(max_interval, first_interval * (1.5 ** attempt))
+
     def poll_until_complete(
         self,
         transcript_id: str,
         max_wait_seconds: int = 3600,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        audio_duration_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Poll transcript until completed or timeout.
@@ -138,7 +197,8 @@ class AssemblyAIService:
         Args:
             transcript_id: AssemblyAI transcript ID
             max_wait_seconds: Maximum wait time in seconds
-            poll_interval: Seconds between status checks
+            poll_interval: Minimum seconds between status checks
+            audio_duration_seconds: Recording length, used to space out checks
 
         Returns:
             Completed transcript data
@@ -147,21 +207,23 @@ class AssemblyAIService:
             Exception: If transcription fails or times out
         """
         start_time = time.time()
+        attempt = 0
 
         while True:
             elapsed = time.time() - start_time
             if elapsed > max_wait_seconds:
                 raise Exception(f"Transcription timed out after {max_wait_seconds}s")
 
-            status = self.get_transcript_status(transcript_id)
+            status, result = self.check_transcript(transcript_id)
             logger.info(f"Transcript {transcript_id} status: {status}")
 
             if status == "completed":
-                return self.get_transcript(transcript_id)
+                return result
             elif status == "error":
                 raise Exception("Transcription failed with error")
 
-            time.sleep(poll_interval)
+            time.sleep(self.next_poll_delay(attempt, audio_duration_seconds, poll_interval))
+            attempt += 1
 
     def delete_transcript(self, transcript_id: str) -> bool:
         """
@@ -186,16 +248,40 @@ class AssemblyAIService:
             logger.error(f"Error deleting transcript: {e}")
             raise Exception(f"Failed to delete transcript: {str(e)}")
 
+    @staticmethod
+    def _build_result(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a completed REST transcript resource into our transcript format."""
+        # Process utterances (speaker-labeled segments)
+        utterances = [
+            {
+                "speaker": utterance.get("speaker"),
+                "text": utterance.get("text"),
+                "start": utterance.get("start"),
+                "end": utterance.get("end"),
+                "confidence": utterance.get("confidence"),
+            }
+            for utterance in payload.get("utterances") or []
+        ]
+
+        return {
+            "id": payload.get("id"),
+            "text": payload.get("text"),
+            "utterances": utterances,
+            "audio_duration": payload.get("audio_duration"),
+            "confidence": payload.get("confidence"),
+            "words": AssemblyAIService._process_words(payload.get("words") or []),
+        }
+
     @staticmethod
     def _process_words(words) -> list:
         """Process word-level timestamps."""
         return [
             {
-                "text": word.text,
-                "start": word.start,
-                "end": word.end,
-                "confidence": word.confidence,
-                "speaker": getattr(word, "speaker", None),
+                "text": word.get("text"),
+                "start": word.get("start"),
+                "end": word.get("end"),
+                "confidence": word.get("confidence"),
+                "speaker": word.get("speaker"),
             }
             for word in words
         ]
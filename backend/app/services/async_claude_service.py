@@ -0,0 +1,290 @@
+"""Asyncio-native Claude API service with a pooled client and bounded concurrency."""
+
+from anthropic import AsyncAnthropic, AnthropicError
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+)
+import asyncio
+import httpx
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Iterable, List, Optional, TypeVar
+
+from app.config import settings
+from app.services.claude_service import claude_service
+from app.services.llm_cache_service import llm_cache_service
+from app.services.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncClaudeService:
+    """
+    Async variant of ClaudeService.
+
+    All requests run on one background event loop per process, which owns a
+    single pooled AsyncAnthropic client and a semaphore capping in-flight
+    requests. Coroutines awaited from another loop are forwarded to it, and
+    synchronous code (LangGraph nodes, Celery tasks) can use run()/run_all().
+    """
+
+    def __init__(self):
+        """Initialize settings (loop, client and semaphore are created lazily)."""
+        self.model = settings.CLAUDE_MODEL
+        self.max_tokens = settings.CLAUDE_MAX_TOKENS
+        self.temperature = settings.CLAUDE_TEMPERATURE
+        self.max_concurrency = settings.CLAUDE_MAX_CONCURRENCY
+        self.max_connections = settings.CLAUDE_MAX_CONNECTIONS
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+        self._client: Optional[AsyncAnthropic] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop (again after a Celery worker fork)."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="claude-async-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._pid = os.getpid()
+                self._client = None
+                self._semaphore = None
+                logger.info("Started async Claude event loop")
+        return self._loop
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """Get or create the pooled client (only used on the background loop)."""
+        if self._client is None:
+            self._client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                ),
+            )
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Get or create the concurrency semaphore (only used on the background loop)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _on_shared_loop(self, coro: Awaitable[T]) -> T:
+        """Await a coroutine on the background loop, whichever loop we're called from."""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the background loop from synchronous code.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def run_all(self, coros: Iterable[Awaitable[T]], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run several coroutines concurrently from synchronous code.
+
+        Args:
+            coros: Coroutines to run
+            return_exceptions: Return exceptions in the result list instead of raising
+
+        Returns:
+            Results in the same order as coros
+        """
+        coros = list(coros)
+
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(_gather())
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type(AnthropicError),
+    )
+    async def _create_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+    ):
+        """Send one request to the Messages API (rate limited, retried on AnthropicError)."""
+        reserved = rate_limiter.reservation(system_prompt, user_message, max_tokens)
+
+        try:
+            # Hold a slot only while the request is in flight, not during backoff
+            async with self.semaphore:
+                await rate_limiter.acquire_async(self.model, reserved["input_tokens"], reserved["output_tokens"])
+                raw_response = await self.client.messages.with_raw_response.create(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system_prompt,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": user_message,
+                        }
+                    ],
+                )
+            response = raw_response.parse()
+            await asyncio.to_thread(
+                rate_limiter.record_response, self.model, raw_response.headers, response.usage, reserved
+            )
+            return response
+
+        except AnthropicError as e:
+            logger.error(f"Claude API error: {e}")
+            await asyncio.to_thread(rate_limiter.record_failure, self.model, e, reserved)
+            raise
+
+    async def _call_claude(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        stage: Optional[str],
+        use_cache: bool,
+    ) -> str:
+        """Cache lookup, API call and cache store (runs on the background loop)."""
+        cache_key = None
+        if use_cache and llm_cache_service.enabled:
+            cache_key = claude_service.build_cache_key(system_prompt, user_message, max_tokens, temperature)
+            cached = await asyncio.to_thread(llm_cache_service.get, cache_key, stage)
+            if cached is not None:
+                logger.info(f"Claude response cache hit ({stage or 'unknown'}). Response length: {len(cached)}")
+                return cached
+
+        response = await self._create_message(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+        )
+
+        # Extract text from response
+        content = response.content[0].text
+        logger.info(f"Claude API call successful. Response length: {len(content)}")
+
+        # Truncated responses are never reused
+        if cache_key and response.stop_reason != "max_tokens":
+            await asyncio.to_thread(llm_cache_service.set, cache_key, content, self.model, stage)
+
+        return content
+
+    async def call_claude(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        stage: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Call Claude API with retry logic and response caching.
+
+        Args:
+            system_prompt: System prompt/instructions
+            user_message: User message content
+            max_tokens: Override default max_tokens
+            temperature: Override default temperature
+            stage: Pipeline stage name (for cache hit/miss counters)
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            Raw response text from Claude
+
+        Raises:
+            AnthropicError: If API call fails after retries
+        """
+        return await self._on_shared_loop(self._call_claude(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stage=stage,
+            use_cache=use_cache,
+        ))
+
+    async def call_with_json_response(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        stage: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """
+        Call Claude and parse JSON response.
+
+        Args:
+            system_prompt: System prompt (should instruct to return JSON)
+            user_message: User message content
+            max_tokens: Override default max_tokens
+            temperature: Override default temperature
+            stage: Pipeline stage name (for cache hit/miss counters)
+            use_cache: Set False to bypass the response cache
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If response is not valid JSON
+            AnthropicError: If API call fails
+        """
+        response = await self.call_claude(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stage=stage,
+            use_cache=use_cache,
+        )
+
+        try:
+            return claude_service.parse_json_response(response)
+        except ValueError:
+            # Don't keep serving an unparseable response from the cache
+            if use_cache and llm_cache_service.enabled:
+                await asyncio.to_thread(
+                    llm_cache_service.delete,
+                    claude_service.build_cache_key(system_prompt, user_message, max_tokens, temperature),
+                )
+            raise
+
+
+# Global service instance
+async_claude_service = AsyncClaudeService()
@@ -13,6 +13,8 @@ import re
 from typing import Dict, Any, List, Optional
 
 from app.config import settings
+from app.services.llm_cache_service import llm_cache_service
+from app.services.rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +29,79 @@ class ClaudeService:
         self.max_tokens = settings.CLAUDE_MAX_TOKENS
         self.temperature = settings.CLAUDE_TEMPERATURE
 
+    def build_cache_key(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+    ) -> str:
+        """Build the response cache key from the resolved request parameters."""
+        return llm_cache_service.make_key(
+            model=self.model,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+        )
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type(AnthropicError),
     )
+    def _create_message(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+    ):
+        """Send one request to the Messages API (rate limited, retried on AnthropicError)."""
+        reserved = rate_limiter.reservation(system_prompt, user_message, max_tokens)
+        rate_limiter.acquire(self.model, reserved["input_tokens"], reserved["output_tokens"])
+
+        try:
+            raw_response = self.client.messages.with_raw_response.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system_prompt,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": user_message,
+                    }
+                ],
+            )
+            response = raw_response.parse()
+            rate_limiter.record_response(self.model, raw_response.headers, response.usage, reserved)
+            return response
+
+        except AnthropicError as e:
+            logger.error(f"Claude API error: {e}")
+            rate_limiter.record_failure(self.model, e, reserved)
+            raise
+
     def call_claude(
         self,
         system_prompt: str,
         user_message: str,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        stage: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """
-        Call Claude API with retry logic.
+        Call Claude API with retry logic and response caching.
 
         Args:
             system_prompt: System prompt/instructions
             user_message: User message content
             max_tokens: Override default max_tokens
             temperature: Override default temperature
+            stage: Pipeline stage name (for cache hit/miss counters)
+            use_cache: Set False to bypass the response cache
 
         Returns:
             Raw response text from Claude
@@ -54,28 +109,30 @@ class ClaudeService:
         Raises:
             AnthropicError: If API call fails after retries
         """
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-                system=system_prompt,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": user_message,
-                    }
-                ],
-            )
+        cache_key = None
+        if use_cache and llm_cache_service.enabled:
+            cache_key = self.build_cache_key(system_prompt, user_message, max_tokens, temperature)
+            cached = llm_cache_service.get(cache_key, stage=stage)
+            if cached is not None:
+                logger.info(f"Claude response cache hit ({stage or 'unknown'}). Response length: {len(cached)}")
+                return cached
+
+        response = self._create_message(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+        )
 
-            # Extract text from response
-            content = response.content[0].text
-            logger.info(f"Claude API call successful. Response length: {len(content)}")
-            return content
+        # Extract text from response
+        content = response.content[0].text
+        logger.info(f"Claude API call successful. Response length: {len(content)}")
 
-        except AnthropicError as e:
-            logger.error(f"Claude API error: {e}")
-            raise
+        # Truncated responses are never reused
+        if cache_key and response.stop_reason != "max_tokens":
+            llm_cache_service.set(cache_key, content, model=self.model, stage=stage)
+
+        return content
 
     def parse_json_response(self, response: str) -> Any:
         """
@@ -137,6 +194,8 @@ class ClaudeService:
         user_message: str,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        stage: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Any:
         """
         Call Claude and parse JSON response.
@@ -146,6 +205,8 @@ class ClaudeService:
             user_message: User message content
             max_tokens: Override default max_tokens
             temperature: Override default temperature
+            stage: Pipeline stage name (for cache hit/miss counters)
+            use_cache: Set False to bypass the response cache
 
         Returns:
             Parsed JSON object
@@ -159,9 +220,19 @@ class ClaudeService:
             user_message=user_message,
             max_tokens=max_tokens,
             temperature=temperature,
+            stage=stage,
+            use_cache=use_cache,
         )
 
-        return self.parse_json_response(response)
+        try:
+            return self.parse_json_response(response)
+        except ValueError:
+            # Don't keep serving an unparseable response from the cache
+            if use_cache and llm_cache_service.enabled:
+                llm_cache_service.delete(
+                    self.build_cache_key(system_prompt, user_message, max_tokens, temperature)
+                )
+            raise
 
     def validate_json_structure(
         self,
@@ -0,0 +1,285 @@
+"""Content-addressed cache for Claude responses (Redis with Postgres fallback)."""
+
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.database_models import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheService:
+    """
+    Cache Claude responses keyed on everything that determines the output.
+
+    Redis is the primary store. Every entry is also written to the
+    llm_cache_entries table so cached work survives a Redis flush and is
+    still served when Redis is unreachable.
+    """
+
+    KEY_PREFIX = "llm_cache:entry:"
+    INDEX_KEY = "llm_cache:index"  # Sorted set: cache key -> last access time
+    STATS_KEY = "llm_cache:stats"  # Hash: "<stage>:hits" / "<stage>:misses" -> count
+
+    def __init__(self):
+        """Initialize cache settings (Redis connection is created lazily)."""
+        self.enabled = settings.LLM_CACHE_ENABLED
+        self.ttl_seconds = settings.LLM_CACHE_TTL_SECONDS
+        self.max_entries = settings.LLM_CACHE_MAX_ENTRIES
+        self.touch_seconds = settings.LLM_CACHE_TOUCH_SECONDS
+        self._redis: Optional[redis.Redis] = None
+        self._local_stats: Counter = Counter()  # Used while Redis is unavailable
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        return self._redis
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """
+        Build a content-addressed cache key for a Claude request.
+
+        Args:
+            model: Claude model name
+            system_prompt: System prompt
+            user_message: User message content
+            max_tokens: Resolved max_tokens
+            temperature: Resolved temperature
+
+        Returns:
+            Hex SHA-256 digest of the request parameters
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "system": system_prompt,
+                "user": user_message,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str, stage: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            cache_key: Key from make_key()
+            stage: Pipeline stage name used for hit/miss counters
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        try:
+            cached = self.redis.get(self.KEY_PREFIX + cache_key)
+            if cached is not None:
+                now = time.time()
+                pipe = self.redis.pipeline()
+                pipe.zscore(self.INDEX_KEY, cache_key)
+                pipe.zadd(self.INDEX_KEY, {cache_key: now})
+                last_access = pipe.execute()[0]
+                # Postgres evicts by last_accessed_at, so keep hot entries fresh there too (throttled per key)
+                if last_access is None or now - last_access >= self.touch_seconds:
+                    self._db_touch(cache_key)
+                self._record(stage, "hits")
+                return cached
+        except RedisError as e:
+            logger.warning(f"LLM cache Redis lookup failed, using Postgres: {e}")
+
+        cached = self._db_get(cache_key)
+        if cached is not None:
+            # Warm Redis again so the next lookup stays in memory
+            self._redis_set(cache_key, cached)
+            self._record(stage, "hits")
+            return cached
+
+        self._record(stage, "misses")
+        return None
+
+    def set(
+        self,
+        cache_key: str,
+        response: str,
+        model: str,
+        stage: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response in Redis and Postgres, evicting old entries.
+
+        Args:
+            cache_key: Key from make_key()
+            response: Response text to cache
+            model: Claude model that produced the response
+            stage: Pipeline stage that produced the response
+        """
+        self._redis_set(cache_key, response)
+        self._db_set(cache_key, response, model, stage)
+
+    def delete(self, cache_key: str) -> None:
+        """Remove an entry from both stores (e.g. when it turned out to be unusable)."""
+        try:
+            self.redis.delete(self.KEY_PREFIX + cache_key)
+            self.redis.zrem(self.INDEX_KEY, cache_key)
+        except RedisError as e:
+            logger.warning(f"LLM cache Redis delete failed: {e}")
+
+        db = SessionLocal()
+        try:
+            db.query(LLMCacheEntry).filter(LLMCacheEntry.cache_key == cache_key).delete()
+            db.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache Postgres delete failed: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get hit/miss counters per pipeline stage.
+
+        Returns:
+            Mapping of stage -> {"hits": n, "misses": m}
+        """
+        counters = Counter(self._local_stats)
+        try:
+            for field, value in self.redis.hgetall(self.STATS_KEY).items():
+                counters[field] += int(value)
+        except RedisError as e:
+            logger.warning(f"LLM cache stats unavailable from Redis: {e}")
+
+        stats: Dict[str, Dict[str, int]] = {}
+        for field, value in counters.items():
+            stage, _, kind = field.rpartition(":")
+            stats.setdefault(stage, {"hits": 0, "misses": 0})[kind] = value
+        return stats
+
+    def _record(self, stage: Optional[str], kind: str) -> None:
+        """Increment the hit or miss counter for a stage."""
+        field = f"{stage or 'unknown'}:{kind}"
+        try:
+            self.redis.hincrby(self.STATS_KEY, field, 1)
+        except RedisError:
+            self._local_stats[field] += 1
+
+    def _redis_set(self, cache_key: str, response: str) -> None:
+        """Write an entry to Redis and trim the index to max_entries."""
+        try:
+            now = time.time()
+            pipe = self.redis.pipeline()
+            pipe.set(self.KEY_PREFIX + cache_key, response, ex=self.ttl_seconds)
+            pipe.zadd(self.INDEX_KEY, {cache_key: now})
+            # Expired keys drop out of Redis on their own; drop them from the index too
+            pipe.zremrangebyscore(self.INDEX_KEY, 0, now - self.ttl_seconds)
+            pipe.zcard(self.INDEX_KEY)
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = self.redis.zpopmin(self.INDEX_KEY, size - self.max_entries)
+                if evicted:
+                    self.redis.delete(*[self.KEY_PREFIX + key for key, _ in evicted])
+                    logger.info(f"LLM cache evicted {len(evicted)} entries from Redis")
+        except RedisError as e:
+            logger.warning(f"LLM cache Redis write failed: {e}")
+
+    def _db_get(self, cache_key: str) -> Optional[str]:
+        """Read a non-expired entry from Postgres."""
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            entry = db.query(LLMCacheEntry).filter(
+                LLMCacheEntry.cache_key == cache_key,
+                LLMCacheEntry.expires_at > now
+            ).first()
+            if not entry:
+                return None
+
+            entry.last_accessed_at = now
+            response = entry.response
+            db.commit()
+            return response
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache Postgres lookup failed: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def _db_touch(self, cache_key: str) -> None:
+        """Mark a Postgres entry as used now (after a Redis hit)."""
+        db = SessionLocal()
+        try:
+            db.query(LLMCacheEntry)\
+                .filter(LLMCacheEntry.cache_key == cache_key)\
+                .update({LLMCacheEntry.last_accessed_at: datetime.now(timezone.utc)}, synchronize_session=False)
+            db.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache Postgres touch failed: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _db_set(self, cache_key: str, response: str, model: str, stage: Optional[str]) -> None:
+        """Upsert an entry in Postgres and evict expired / least recently used rows."""
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            db.merge(LLMCacheEntry(
+                cache_key=cache_key,
+                model=model,
+                stage=stage,
+                response=response,
+                last_accessed_at=now,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+            ))
+            db.query(LLMCacheEntry).filter(LLMCacheEntry.expires_at <= now).delete()
+            db.flush()
+
+            overflow = db.query(LLMCacheEntry).count() - self.max_entries
+            if overflow > 0:
+                oldest = select(LLMCacheEntry.cache_key)\
+                    .order_by(LLMCacheEntry.last_accessed_at.asc())\
+                    .limit(overflow)
+                db.query(LLMCacheEntry)\
+                    .filter(LLMCacheEntry.cache_key.in_(oldest))\
+                    .delete(synchronize_session=False)
+                logger.info(f"LLM cache evicted {overflow} entries from Postgres")
+
+            db.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache Postgres write failed: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+
+# Global service instance
+llm_cache_service = LLMCacheService()
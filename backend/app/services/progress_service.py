@@ -0,0 +1,258 @@
+"""Pipeline progress events over Redis pub/sub (pushed to clients as SSE)."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import redis
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressService:
+    """
+    Publish and subscribe to per-video and per-project progress events.
+
+    Celery tasks publish an event on every state change (transcription
+    queued -> processing -> completed, analysis stage transitions). Each
+    event goes to the video's channel and its project's channel, so a
+    project page gets the progress of all its videos on one stream.
+
+    Each API process holds a single pattern subscription and fans events out
+    to its connected SSE clients through in-memory queues, so the number of
+    Redis connections does not grow with the number of clients.
+
+    Publishing never raises: if Redis is unavailable the event is dropped
+    and clients fall back to the status in the database.
+    """
+
+    CHANNEL_PREFIX = "progress:"
+    QUEUE_SIZE = 100
+    SUBSCRIBE_TIMEOUT_SECONDS = 2  # Wait for the pattern subscription before reading a snapshot
+
+    def __init__(self):
+        """Initialize state (Redis connections are created lazily)."""
+        self.heartbeat_seconds = settings.PROGRESS_HEARTBEAT_SECONDS
+        self._redis: Optional[redis.Redis] = None
+        self._async_redis: Optional[aioredis.Redis] = None
+        self._listeners: Dict[str, Set[asyncio.Queue]] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._subscribed: Optional[asyncio.Event] = None  # Set while the pattern subscription is active
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Get or create the Redis client used for publishing from workers."""
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        return self._redis
+
+    @property
+    def async_redis(self) -> aioredis.Redis:
+        """Get or create the Redis client used by the API process."""
+        if self._async_redis is None:
+            self._async_redis = aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._async_redis
+
+    def video_channel(self, video_id: Any) -> str:
+        return f"{self.CHANNEL_PREFIX}video:{video_id}"
+
+    def project_channel(self, project_id: Any) -> str:
+        return f"{self.CHANNEL_PREFIX}project:{project_id}"
+
+    def build_event(
+        self,
+        kind: str,
+        stage: str,
+        status: str,
+        video_id: Any = None,
+        project_id: Any = None,
+        **data: Any,
+    ) -> Dict[str, Any]:
+        """
+        Build a progress event.
+
+        Args:
+            kind: "transcription", "video_analysis" or "project_analysis"
+            stage: Pipeline stage (e.g. "queued", "infer", "cross_relate")
+            status: "started", "completed" or "error"
+            video_id: Video the event belongs to (if any)
+            project_id: Project the event belongs to
+            data: Extra fields (counts, error message, ...)
+
+        Returns:
+            Event dictionary
+        """
+        return {
+            "type": kind,
+            "stage": stage,
+            "status": status,
+            "video_id": str(video_id) if video_id else None,
+            "project_id": str(project_id) if project_id else None,
+            "timestamp": time.time(),
+            **data,
+        }
+
+    def _channels(self, event: Dict[str, Any]) -> list:
+        channels = []
+        if event.get("video_id"):
+            channels.append(self.video_channel(event["video_id"]))
+        if event.get("project_id"):
+            channels.append(self.project_channel(event["project_id"]))
+        return channels
+
+    def publish(self, kind: str, stage: str, status: str, **kwargs: Any) -> None:
+        """Publish an event from synchronous code (Celery tasks). See build_event."""
+        event = self.build_event(kind, stage, status, **kwargs)
+        message = json.dumps(event, default=str)
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for channel in self._channels(event):
+                pipeline.publish(channel, message)
+            pipeline.execute()
+        except RedisError as e:
+            logger.warning(f"Could not publish progress event ({kind}/{stage}): {e}")
+
+    async def publish_async(self, kind: str, stage: str, status: str, **kwargs: Any) -> None:
+        """Publish an event from the API process. See build_event."""
+        event = self.build_event(kind, stage, status, **kwargs)
+        message = json.dumps(event, default=str)
+        try:
+            for channel in self._channels(event):
+                await self.async_redis.publish(channel, message)
+        except RedisError as e:
+            logger.warning(f"Could not publish progress event ({kind}/{stage}): {e}")
+
+    async def _read(self) -> None:
+        """Forward events from the pattern subscription to local listeners."""
+        while True:
+            pubsub = self.async_redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self.CHANNEL_PREFIX}*")
+                self._subscribed.set()
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    for queue in list(self._listeners.get(message["channel"], ())):
+                        try:
+                            queue.put_nowait(message["data"])
+                        except asyncio.QueueFull:
+                            # A slow client misses intermediate events; its next
+                            # event (or a reconnect snapshot) brings it up to date
+                            pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._subscribed.clear()
+                logger.warning(f"Progress subscription lost, reconnecting: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def subscribe(self, channel: str) -> "ProgressSubscription":
+        """
+        Start receiving a channel's events.
+
+        The client's queue is registered and the process's pattern
+        subscription is confirmed before this returns, so callers can read
+        their snapshot afterwards without missing events published meanwhile.
+        The returned subscription must be closed with aclose().
+
+        Args:
+            channel: video_channel(...) or project_channel(...)
+
+        Returns:
+            Subscription yielding the channel's events
+        """
+        if self._reader is None or self._reader.done():
+            self._subscribed = asyncio.Event()
+            self._reader = asyncio.create_task(self._read())
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._listeners.setdefault(channel, set()).add(queue)
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=self.SUBSCRIBE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Progress subscription not ready; events are delivered once it connects")
+        return ProgressSubscription(self, channel, queue)
+
+    def _unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """Remove a client's queue from a channel."""
+        listeners = self._listeners.get(channel)
+        if listeners is not None:
+            listeners.discard(queue)
+            if not listeners:
+                del self._listeners[channel]
+
+    async def close(self) -> None:
+        """Stop the subscription and close the API process's connection."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader = None
+        if self._async_redis is not None:
+            await self._async_redis.aclose()
+            self._async_redis = None
+
+
+class ProgressSubscription:
+    """
+    One client's events for one channel (see ProgressService.subscribe).
+
+    Iterating yields event dictionaries, or None every heartbeat_seconds
+    without events so the caller can send a keep-alive and notice
+    disconnected clients.
+    """
+
+    def __init__(self, service: ProgressService, channel: str, queue: asyncio.Queue):
+        self.service = service
+        self.channel = channel
+        self.queue = queue
+
+    async def __aiter__(self) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        while True:
+            try:
+                message = await asyncio.wait_for(self.queue.get(), timeout=self.service.heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            yield json.loads(message)
+
+    def drop_stale(self, since: float) -> None:
+        """
+        Drop queued events published before a snapshot started being read.
+
+        Their changes were committed before they were published, so the
+        snapshot already reflects them. Only events received so far are
+        checked; later ones are always delivered.
+
+        Args:
+            since: Unix time the snapshot read started
+        """
+        pending = [self.queue.get_nowait() for _ in range(self.queue.qsize())]
+        for message in pending:
+            if json.loads(message).get("timestamp", 0) >= since:
+                self.queue.put_nowait(message)
+
+    async def aclose(self) -> None:
+        """Stop receiving events."""
+        self.service._unsubscribe(self.channel, self.queue)
+
+
+# Global service instance
+progress_service = ProgressService()
@@ -0,0 +1,355 @@
+"""Redis token-bucket rate limiter for Claude API calls, shared by all workers."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Mapping, Optional
+
+import redis
+from anthropic import APIStatusError, RateLimitError
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Refill every bucket, then take the requested amounts from all of them or
+# from none. Returns "0" on success, otherwise the seconds to wait.
+# KEYS: bucket hashes..., pause key
+# ARGV: default capacity and amount for each bucket, in KEYS order
+ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local paused_until = tonumber(redis.call('GET', KEYS[#KEYS]) or '0')
+if paused_until > now then
+    return tostring(paused_until - now)
+end
+
+local wait = 0
+local buckets = {}
+for i = 1, #KEYS - 1 do
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts', 'capacity')
+    local capacity = tonumber(state[3]) or tonumber(ARGV[2 * i - 1])
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    local rate = capacity / 60
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local amount = math.min(tonumber(ARGV[2 * i]), capacity)
+    if tokens < amount then
+        wait = math.max(wait, (amount - tokens) / rate)
+    end
+    buckets[i] = {tokens, amount}
+end
+
+if wait > 0 then
+    return tostring(wait)
+end
+
+for i = 1, #KEYS - 1 do
+    redis.call('HSET', KEYS[i], 'tokens', tostring(buckets[i][1] - buckets[i][2]), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], 600)
+end
+return '0'
+"""
+
+# Add (or with a negative amount, take) tokens after the fact.
+# KEYS: bucket hash; ARGV: default capacity, amount
+ADJUST_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'capacity')
+local capacity = tonumber(state[3]) or tonumber(ARGV[1])
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * capacity / 60)
+tokens = math.min(capacity, tokens + tonumber(ARGV[2]))
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], 600)
+return tostring(tokens)
+"""
+
+# Sync a bucket with the server's view: adopt its limit and never hold more
+# tokens than it says remain.
+# KEYS: bucket hash; ARGV: limit (or ""), remaining (or "")
+OBSERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'capacity')
+local capacity = tonumber(ARGV[1]) or tonumber(state[3])
+if not capacity then
+    return '0'
+end
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * capacity / 60)
+local remaining = tonumber(ARGV[2])
+if remaining then
+    tokens = math.min(tokens, remaining)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now), 'capacity', tostring(capacity))
+redis.call('EXPIRE', KEYS[1], 600)
+return tostring(tokens)
+"""
+
+# Pause every worker until now + ARGV[1] seconds (only ever extends a pause).
+# KEYS: pause key
+PAUSE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local until_ts = now + tonumber(ARGV[1])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if until_ts > current then
+    redis.call('SET', KEYS[1], tostring(until_ts), 'EX', math.ceil(tonumber(ARGV[1])) + 1)
+end
+return tostring(math.max(until_ts, current))
+"""
+
+
+SCRIPTS = {
+    "acquire": ACQUIRE_SCRIPT,
+    "adjust": ADJUST_SCRIPT,
+    "observe": OBSERVE_SCRIPT,
+    "pause": PAUSE_SCRIPT,
+}
+
+
+class RateLimiter:
+    """
+    Token buckets for requests, input tokens and output tokens per minute.
+
+    State lives in Redis so every Celery worker and API process draws from
+    the same buckets. Callers reserve before each request, settle the
+    estimate against actual usage afterwards, and feed the API's rate-limit
+    headers back in so the buckets track the account's real limits. A 429
+    pauses all callers until its retry-after has passed.
+
+    If Redis is unavailable the limiter lets requests through.
+    """
+
+    KEY_PREFIX = "llm_rate:"
+    BUCKETS = ("requests", "input_tokens", "output_tokens")
+    HEADER_NAMES = {
+        "requests": "requests",
+        "input_tokens": "input-tokens",
+        "output_tokens": "output-tokens",
+    }
+
+    def __init__(self):
+        """Initialize limits (Redis connection is created lazily)."""
+        self.enabled = settings.CLAUDE_RATE_LIMIT_ENABLED
+        self.default_capacity = {
+            "requests": settings.CLAUDE_REQUESTS_PER_MINUTE,
+            "input_tokens": settings.CLAUDE_INPUT_TOKENS_PER_MINUTE,
+            "output_tokens": settings.CLAUDE_OUTPUT_TOKENS_PER_MINUTE,
+        }
+        self._redis: Optional[redis.Redis] = None
+        self._scripts: Dict[str, object] = {}
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        return self._redis
+
+    def _script(self, name: str):
+        """Get a registered Lua script (registered on first use)."""
+        if not self._scripts:
+            self._scripts = {
+                script_name: self.redis.register_script(source)
+                for script_name, source in SCRIPTS.items()
+            }
+        return self._scripts[name]
+
+    def _key(self, model: str, bucket: str) -> str:
+        return f"{self.KEY_PREFIX}{model}:{bucket}"
+
+    def _pause_key(self, model: str) -> str:
+        return f"{self.KEY_PREFIX}{model}:paused_until"
+
+    @staticmethod
+    def estimate_input_tokens(*texts: str) -> int:
+        """Rough input token estimate (~4 characters per token)."""
+        return sum(len(text) for text in texts) // 4 + 1
+
+    def try_acquire(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """
+        Reserve one request plus tokens if all buckets allow it.
+
+        Output tokens are reserved at max_tokens and settled once the
+        response reports what was actually generated.
+
+        Args:
+            model: Model name (limits are per model)
+            input_tokens: Estimated input tokens
+            output_tokens: Output tokens to reserve (the request's max_tokens)
+
+        Returns:
+            0 if reserved, otherwise seconds to wait before trying again
+        """
+        if not self.enabled:
+            return 0
+
+        amounts = {"requests": 1, "input_tokens": input_tokens, "output_tokens": output_tokens}
+        keys = [self._key(model, bucket) for bucket in self.BUCKETS] + [self._pause_key(model)]
+        args = []
+        for bucket in self.BUCKETS:
+            args.extend([self.default_capacity[bucket], amounts[bucket]])
+
+        try:
+            return float(self._script("acquire")(keys=keys, args=args))
+        except RedisError as e:
+            logger.warning(f"Rate limiter unavailable, not throttling: {e}")
+            return 0
+
+    def acquire(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        """
+        Block until a request can be sent (see try_acquire).
+
+        Args:
+            model: Model name
+            input_tokens: Estimated input tokens
+            output_tokens: Output tokens to reserve
+        """
+        while True:
+            wait = self.try_acquire(model, input_tokens, output_tokens)
+            if wait <= 0:
+                return
+            logger.info(f"Claude rate limit reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    async def acquire_async(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        """
+        Wait without blocking the event loop until a request can be sent.
+
+        Args:
+            model: Model name
+            input_tokens: Estimated input tokens
+            output_tokens: Output tokens to reserve
+        """
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire, model, input_tokens, output_tokens)
+            if wait <= 0:
+                return
+            logger.info(f"Claude rate limit reached, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    def settle(self, model: str, reserved: Mapping[str, int], used: Mapping[str, int]) -> None:
+        """
+        Return over-reserved tokens (or take the shortfall) after a request.
+
+        Args:
+            model: Model name
+            reserved: Tokens reserved per bucket ("input_tokens", "output_tokens")
+            used: Tokens actually used per bucket, from the response usage
+        """
+        if not self.enabled:
+            return
+
+        try:
+            for bucket, amount in reserved.items():
+                difference = amount - used.get(bucket, amount)
+                if difference:
+                    self._script("adjust")(
+                        keys=[self._key(model, bucket)],
+                        args=[self.default_capacity[bucket], difference],
+                    )
+        except RedisError as e:
+            logger.warning(f"Could not settle rate limiter usage: {e}")
+
+    def observe_headers(self, model: str, headers: Mapping[str, str]) -> None:
+        """
+        Sync the buckets with the API's anthropic-ratelimit-* response headers.
+
+        Args:
+            model: Model name
+            headers: Response headers
+        """
+        if not self.enabled:
+            return
+
+        try:
+            for bucket, name in self.HEADER_NAMES.items():
+                limit = headers.get(f"anthropic-ratelimit-{name}-limit")
+                remaining = headers.get(f"anthropic-ratelimit-{name}-remaining")
+                if limit is None and remaining is None:
+                    continue
+                self._script("observe")(
+                    keys=[self._key(model, bucket)],
+                    args=[limit or "", remaining or ""],
+                )
+        except RedisError as e:
+            logger.warning(f"Could not apply rate limit headers: {e}")
+
+    def pause(self, model: str, seconds: float) -> None:
+        """
+        Stop all callers for a model from sending requests for a while.
+
+        Args:
+            model: Model name
+            seconds: Pause length (from the 429 retry-after header)
+        """
+        if not self.enabled or seconds <= 0:
+            return
+
+        try:
+            self._script("pause")(keys=[self._pause_key(model)], args=[seconds])
+            logger.warning(f"Claude rate limited, pausing all workers for {seconds:.1f}s")
+        except RedisError as e:
+            logger.warning(f"Could not record rate limit pause: {e}")
+
+    @staticmethod
+    def retry_after_seconds(headers: Mapping[str, str], default: float = 10) -> float:
+        """Read the retry-after header of a 429 response."""
+        try:
+            return float(headers.get("retry-after", default))
+        except (TypeError, ValueError):
+            return default
+
+    def reservation(self, system_prompt: str, user_message: str, max_tokens: int) -> Dict[str, int]:
+        """Tokens to reserve for one Messages API request."""
+        return {
+            "input_tokens": self.estimate_input_tokens(system_prompt, user_message),
+            "output_tokens": max_tokens,
+        }
+
+    def record_response(self, model: str, headers: Mapping[str, str], usage, reserved: Dict[str, int]) -> None:
+        """
+        Apply a successful response: sync with its headers, settle its usage.
+
+        Args:
+            model: Model name
+            headers: Response headers
+            usage: Response usage (input_tokens / output_tokens)
+            reserved: What was reserved for the request
+        """
+        self.observe_headers(model, headers)
+        self.settle(model, reserved, {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+        })
+
+    def record_failure(self, model: str, error: Exception, reserved: Dict[str, int]) -> None:
+        """
+        Apply a failed request: pause on 429 and return its output reservation.
+
+        Args:
+            model: Model name
+            error: Exception raised by the API call
+            reserved: What was reserved for the request
+        """
+        if isinstance(error, APIStatusError):
+            self.observe_headers(model, error.response.headers)
+        if isinstance(error, RateLimitError):
+            self.pause(model, self.retry_after_seconds(error.response.headers))
+        self.settle(model, {"output_tokens": reserved["output_tokens"]}, {"output_tokens": 0})
+
+
+# Global service instance
+rate_limiter = RateLimiter()
@@ -2,7 +2,7 @@
 
 import boto3
 from botocore.exceptions import ClientError
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional
 import logging
 from pathlib import Path
 import uuid
@@ -48,8 +48,7 @@ class S3Service:
         try:
             # Generate unique S3 key
             file_extension = Path(filename).suffix
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            s3_key = f"projects/{project_id}/videos/{unique_filename}"
+            s3_key = self.build_video_key(filename, project_id)
 
             # Upload file
             self.s3_client.upload_fileobj(
@@ -66,7 +65,7 @@ class S3Service:
             )
 
             # Generate URL
-            s3_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+            s3_url = self.get_object_url(s3_key)
 
             logger.info(f"Uploaded video to S3: {s3_key}")
             return s3_key, s3_url
@@ -75,6 +74,193 @@ class S3Service:
             logger.error(f"Error uploading to S3: {e}")
             raise Exception(f"Failed to upload video to S3: {str(e)}")
 
+    @staticmethod
+    def build_video_key(filename: str, project_id: str) -> str:
+        """Generate a unique S3 key for a project's video."""
+        file_extension = Path(filename).suffix
+        return f"{S3Service.video_key_prefix(project_id)}{uuid.uuid4()}{file_extension}"
+
+    @staticmethod
+    def video_key_prefix(project_id: str) -> str:
+        """S3 key prefix under which a project's videos are stored."""
+        return f"projects/{project_id}/videos/"
+
+    def get_object_url(self, s3_key: str) -> str:
+        """Get the (non-presigned) URL of an object."""
+        return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+
+    def create_multipart_upload(self, filename: str, project_id: str) -> tuple[str, str]:
+        """
+        Start a multipart upload that the client sends directly to S3.
+
+        Args:
+            filename: Original filename
+            project_id: Project ID for organizing files
+
+        Returns:
+            Tuple of (upload_id, s3_key)
+
+        Raises:
+            Exception: If the upload cannot be created
+        """
+        try:
+            file_extension = Path(filename).suffix
+            s3_key = self.build_video_key(filename, project_id)
+
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ContentType=self._get_content_type(file_extension),
+                Metadata={
+                    "original_filename": filename,
+                    "project_id": project_id,
+                },
+            )
+
+            logger.info(f"Created multipart upload for: {s3_key}")
+            return response["UploadId"], s3_key
+
+        except ClientError as e:
+            logger.error(f"Error creating multipart upload: {e}")
+            raise Exception(f"Failed to create multipart upload: {str(e)}")
+
+    def get_presigned_part_urls(
+        self,
+        s3_key: str,
+        upload_id: str,
+        part_numbers: Iterable[int],
+        expiration: int = 3600,
+    ) -> Dict[int, str]:
+        """
+        Generate presigned PUT URLs for parts of a multipart upload.
+
+        Presigning is local (no request to S3), so URLs can be issued for
+        every part up front and re-issued for any part that needs a retry.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: Multipart upload ID
+            part_numbers: Part numbers (1-based)
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Dictionary of part number -> presigned URL
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        try:
+            return {
+                part_number: self.s3_client.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": self.bucket_name,
+                        "Key": s3_key,
+                        "UploadId": upload_id,
+                        "PartNumber": part_number,
+                    },
+                    ExpiresIn=expiration,
+                )
+                for part_number in part_numbers
+            }
+
+        except ClientError as e:
+            logger.error(f"Error generating presigned part URLs: {e}")
+            raise Exception(f"Failed to generate presigned part URLs: {str(e)}")
+
+    def list_uploaded_parts(self, s3_key: str, upload_id: str) -> List[Dict]:
+        """
+        List the parts S3 has received for a multipart upload.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: Multipart upload ID
+
+        Returns:
+            List of {"part_number", "etag", "size"} in part order
+
+        Raises:
+            Exception: If the upload cannot be listed (e.g. it was aborted)
+        """
+        try:
+            parts = []
+            paginator = self.s3_client.get_paginator("list_parts")
+            for page in paginator.paginate(Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id):
+                for part in page.get("Parts", []):
+                    parts.append({
+                        "part_number": part["PartNumber"],
+                        "etag": part["ETag"],
+                        "size": part["Size"],
+                    })
+            return parts
+
+        except ClientError as e:
+            logger.error(f"Error listing uploaded parts: {e}")
+            raise Exception(f"Failed to list uploaded parts: {str(e)}")
+
+    def complete_multipart_upload(self, s3_key: str, upload_id: str, parts: List[Dict]) -> int:
+        """
+        Assemble uploaded parts into the final object.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: Multipart upload ID
+            parts: List of {"part_number", "etag"}
+
+        Returns:
+            Size of the assembled object in bytes
+
+        Raises:
+            Exception: If completion fails
+        """
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part["part_number"], "ETag": part["etag"]}
+                        for part in sorted(parts, key=lambda part: part["part_number"])
+                    ]
+                },
+            )
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+
+            logger.info(f"Completed multipart upload for: {s3_key}")
+            return response["ContentLength"]
+
+        except ClientError as e:
+            logger.error(f"Error completing multipart upload: {e}")
+            raise Exception(f"Failed to complete multipart upload: {str(e)}")
+
+    def abort_multipart_upload(self, s3_key: str, upload_id: str) -> bool:
+        """
+        Abort a multipart upload and discard its parts.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: Multipart upload ID
+
+        Returns:
+            True if successful
+
+        Raises:
+            Exception: If the abort fails
+        """
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+            )
+            logger.info(f"Aborted multipart upload for: {s3_key}")
+            return True
+
+        except ClientError as e:
+            logger.error(f"Error aborting multipart upload: {e}")
+            raise Exception(f"Failed to abort multipart upload: {str(e)}")
+
     def get_presigned_url(
         self,
         s3_key: str,
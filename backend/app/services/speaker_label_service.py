@@ -0,0 +1,92 @@
+"""Bulk writes for transcript speaker labels."""
+
+import uuid
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.dml import Insert
+
+from app.models.database_models import SpeakerLabel
+
+
+class SpeakerLabelService:
+    """
+    Build single-statement upserts for speaker labels.
+
+    Labels are unique per (transcript_id, speaker_label), so saving any
+    number of them is one INSERT ... ON CONFLICT statement instead of a
+    SELECT per label. The statements are executed by the caller, with the
+    API's async session or a worker's sync session.
+    """
+
+    CONSTRAINT = "uq_speaker_labels_transcript_id_speaker_label"
+
+    @staticmethod
+    def _merge(transcript_id: Any, labels: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """One row per speaker (later non-null values win), as ON CONFLICT can touch a row only once."""
+        rows: Dict[str, Dict[str, Any]] = {}
+        for label in labels:
+            row = rows.setdefault(label["speaker_label"], {
+                "id": uuid.uuid4(),
+                "transcript_id": transcript_id,
+                "speaker_label": label["speaker_label"],
+                "assigned_name": None,
+                "role": None,
+            })
+            for field in ("assigned_name", "role"):
+                if label.get(field) is not None:
+                    row[field] = label[field]
+        return list(rows.values())
+
+    def upsert_statement(self, transcript_id: Any, labels: Iterable[Mapping[str, Any]]) -> Optional[Insert]:
+        """
+        Insert labels, or update names/roles of existing ones.
+
+        Fields left as None keep their stored value.
+
+        Args:
+            transcript_id: Transcript UUID
+            labels: Mappings with speaker_label and optional assigned_name, role
+
+        Returns:
+            INSERT ... ON CONFLICT DO UPDATE ... RETURNING the saved SpeakerLabel
+            rows (None if there are no labels)
+        """
+        rows = self._merge(transcript_id, labels)
+        if not rows:
+            return None
+
+        statement = insert(SpeakerLabel).values(rows)
+        return (
+            statement
+            .on_conflict_do_update(
+                constraint=self.CONSTRAINT,
+                set_={
+                    "assigned_name": func.coalesce(statement.excluded.assigned_name, SpeakerLabel.assigned_name),
+                    "role": func.coalesce(statement.excluded.role, SpeakerLabel.role),
+                },
+            )
+            .returning(SpeakerLabel)
+            .execution_options(populate_existing=True)
+        )
+
+    def insert_detected_statement(self, transcript_id: Any, speakers: Iterable[str]) -> Optional[Insert]:
+        """
+        Insert unnamed labels for detected speakers, leaving existing ones untouched.
+
+        Args:
+            transcript_id: Transcript UUID
+            speakers: Speaker labels from the transcript (e.g. "A", "B")
+
+        Returns:
+            INSERT ... ON CONFLICT DO NOTHING (None if there are no speakers)
+        """
+        rows = self._merge(transcript_id, ({"speaker_label": speaker} for speaker in speakers))
+        if not rows:
+            return None
+        return insert(SpeakerLabel).values(rows).on_conflict_do_nothing(constraint=self.CONSTRAINT)
+
+
+# Global service instance
+speaker_label_service = SpeakerLabelService()
@@ -0,0 +1,103 @@
+"""Build cross-video synthesis input from completed video analyses."""
+
+import logging
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.database_models import Video, VideoAnalysis
+
+logger = logging.getLogger(__name__)
+
+
+class SynthesisInputBuilder:
+    """
+    Stream the per-video results project synthesis needs.
+
+    Only patterns, insights and design_principles are selected (never the
+    much larger chunks and inferences), and rows are read through a
+    server-side cursor a few at a time, so worker memory holds one batch of
+    video results rather than every analysis of the project at once.
+
+    Every item is tagged with the video_id it came from, so cross-video
+    steps can attribute meta-patterns (appears_in_videos) to real videos.
+    """
+
+    BATCH_SIZE = 10  # Rows fetched per round-trip from the server-side cursor
+
+    @staticmethod
+    def _tag(items: Any, video_id: str) -> List[Dict[str, Any]]:
+        """Copy items with their source video_id (missing output -> [])."""
+        if not isinstance(items, list):
+            return []
+        return [{**item, "video_id": video_id} for item in items if isinstance(item, dict)]
+
+    def iter_video_digests(self, db: Session, project_id: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one digest per completed video analysis of a project.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+
+        Yields:
+            {"video_id", "filename", "patterns", "insights", "principles"}
+        """
+        statement = (
+            select(
+                VideoAnalysis.video_id,
+                Video.filename,
+                VideoAnalysis.patterns,
+                VideoAnalysis.insights,
+                VideoAnalysis.design_principles,
+            )
+            .join(Video, Video.id == VideoAnalysis.video_id)
+            .where(Video.project_id == project_id, VideoAnalysis.status == "completed")
+            .order_by(Video.uploaded_at, Video.id)
+            .execution_options(yield_per=self.BATCH_SIZE)
+        )
+
+        for row in db.execute(statement):
+            video_id = str(row.video_id)
+            yield {
+                "video_id": video_id,
+                "filename": row.filename,
+                "patterns": self._tag(row.patterns, video_id),
+                "insights": self._tag(row.insights, video_id),
+                "principles": self._tag(row.design_principles, video_id),
+            }
+
+    def build(self, db: Session, project_id: Any) -> Dict[str, Any]:
+        """
+        Collect ProjectAnalysisState inputs for a project.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+
+        Returns:
+            {"video_ids", "video_patterns", "video_insights", "video_principles"}
+        """
+        inputs: Dict[str, List[Any]] = {
+            "video_ids": [],
+            "video_patterns": [],
+            "video_insights": [],
+            "video_principles": [],
+        }
+        for digest in self.iter_video_digests(db, project_id):
+            inputs["video_ids"].append(digest["video_id"])
+            inputs["video_patterns"].extend(digest["patterns"])
+            inputs["video_insights"].extend(digest["insights"])
+            inputs["video_principles"].extend(digest["principles"])
+
+        logger.info(
+            f"Built synthesis input for project {project_id}: {len(inputs['video_ids'])} videos, "
+            f"{len(inputs['video_patterns'])} patterns, {len(inputs['video_insights'])} insights, "
+            f"{len(inputs['video_principles'])} principles"
+        )
+        return inputs
+
+
+# Global service instance
+synthesis_input_builder = SynthesisInputBuilder()
@@ -0,0 +1,344 @@
+"""Word-level transcript indexing and search (served locally, no AssemblyAI call)."""
+
+import bisect
+import json
+import logging
+import re
+import struct
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Set, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class WordIndex:
+    """Loaded inverted index for one transcript, ready to search."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Wrap a stored index.
+
+        Args:
+            data: Index as built by TranscriptWordsService.build_word_index
+        """
+        self.tokens: Dict[str, List[int]] = data.get("tokens", {})
+        self.starts: List[int] = data.get("starts", [])
+        self.ends: List[int] = data.get("ends", [])
+        # JSONB does not keep key order, so sort once for prefix lookups
+        self.vocabulary: List[str] = sorted(self.tokens)
+        self._position_sets: Dict[str, Set[int]] = {}
+
+    def positions(self, token: str) -> Set[int]:
+        """Word indexes of an exact token."""
+        if token not in self._position_sets:
+            self._position_sets[token] = set(self.tokens.get(token, ()))
+        return self._position_sets[token]
+
+    def prefix_positions(self, prefix: str) -> Set[int]:
+        """Word indexes of every token starting with prefix."""
+        positions: Set[int] = set()
+        i = bisect.bisect_left(self.vocabulary, prefix)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            positions.update(self.tokens[self.vocabulary[i]])
+            i += 1
+        return positions
+
+
+class TranscriptWordsService:
+    """
+    Build and query per-transcript word indexes and compact word encodings.
+
+    The inverted index maps each normalized token to the indexes of the words
+    it occurs at, plus word start/end arrays, and is stored on the transcript
+    (Transcript.word_index) when it is saved. Loaded indexes are kept in a
+    small in-process LRU cache.
+
+    Word-level timing is also stored column-wise (Transcript.word_columns)
+    and as a packed binary payload (Transcript.word_columns_packed), so the
+    words endpoint never builds a dict per word. Word start times are stored
+    on their own (Transcript.word_starts) for time-window lookups.
+
+    Packed layout (little-endian, sections in this order):
+        header: magic b"QRW1", word count (uint32), text bytes (uint32),
+            speaker label bytes (uint32), speaker name bytes (uint32),
+            audio duration (float64)
+        start deltas: int32[count] (first is the absolute start in ms)
+        durations: uint16[count] (end - start in ms, capped at 65535)
+        confidences: uint8[count] (confidence * 255)
+        speakers: uint8[count] (index into the speaker table)
+        text: UTF-8 words joined by "\x1f"
+        speaker labels: UTF-8 JSON list (AssemblyAI labels)
+        speaker names: UTF-8 JSON list (display names, added per request)
+    """
+
+    INDEX_VERSION = 1
+    PACKED_MAGIC = b"QRW1"
+    PACKED_HEADER = struct.Struct("<4sIIIId")
+    CONFIDENCE_SCALE = 255
+    TEXT_SEPARATOR = "\x1f"
+
+    def __init__(self):
+        """Initialize the loaded-index cache."""
+        self.cache_size = settings.WORD_INDEX_CACHE_SIZE
+        self._cache: "OrderedDict[Hashable, WordIndex]" = OrderedDict()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and strip punctuation (inner apostrophes are kept)."""
+        return re.sub(r"[^\w']+", "", (text or "").lower()).strip("'")
+
+    def build_word_index(self, words: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the inverted index for a transcript's words.
+
+        Args:
+            words: raw_transcript["words"]
+
+        Returns:
+            JSON-serializable index
+        """
+        tokens: Dict[str, List[int]] = {}
+        for index, word in enumerate(words):
+            token = self.normalize(word.get("text"))
+            if token:
+                tokens.setdefault(token, []).append(index)
+
+        return {
+            "version": self.INDEX_VERSION,
+            "tokens": tokens,
+            "starts": [word.get("start", 0) for word in words],
+            "ends": [word.get("end", 0) for word in words],
+        }
+
+    def build_word_columns(self, words: List[Dict[str, Any]], audio_duration: Any = 0) -> Dict[str, Any]:
+        """
+        Encode word-level timing column-wise.
+
+        Args:
+            words: raw_transcript["words"]
+            audio_duration: raw_transcript["audio_duration"]
+
+        Returns:
+            {"text", "start_delta", "end_offset", "confidence", "speaker",
+             "speakers", "confidence_scale", "duration"}
+        """
+        speakers: List[str] = []
+        speaker_positions: Dict[str, int] = {}
+        columns: Dict[str, Any] = {
+            "text": [],
+            "start_delta": [],
+            "end_offset": [],
+            "confidence": [],
+            "speaker": [],
+        }
+
+        previous_start = 0
+        for word in words:
+            start = int(word.get("start") or 0)
+            end = int(word.get("end") or start)
+            speaker = word.get("speaker") or "Unknown"
+            if speaker not in speaker_positions:
+                speaker_positions[speaker] = len(speakers)
+                speakers.append(speaker)
+
+            columns["text"].append(word.get("text", ""))
+            columns["start_delta"].append(start - previous_start)
+            columns["end_offset"].append(max(0, end - start))
+            columns["confidence"].append(round((word.get("confidence", 1.0) or 0) * self.CONFIDENCE_SCALE))
+            columns["speaker"].append(speaker_positions[speaker])
+            previous_start = start
+
+        columns["speakers"] = speakers
+        columns["confidence_scale"] = self.CONFIDENCE_SCALE
+        columns["duration"] = audio_duration or 0
+        return columns
+
+    def pack_word_columns(self, columns: Dict[str, Any]) -> bytes:
+        """
+        Pack word columns into the binary layout (without speaker names).
+
+        Args:
+            columns: Output of build_word_columns
+
+        Returns:
+            Packed payload
+        """
+        count = len(columns["text"])
+        text = self.TEXT_SEPARATOR.join(word.replace(self.TEXT_SEPARATOR, " ") for word in columns["text"])
+        text_bytes = text.encode("utf-8")
+        label_bytes = json.dumps(columns["speakers"]).encode("utf-8")
+
+        return b"".join([
+            self.PACKED_HEADER.pack(
+                self.PACKED_MAGIC,
+                count,
+                len(text_bytes),
+                len(label_bytes),
+                0,
+                float(columns["duration"] or 0),
+            ),
+            struct.pack(f"<{count}i", *columns["start_delta"]),
+            struct.pack(f"<{count}H", *(min(offset, 0xFFFF) for offset in columns["end_offset"])),
+            bytes(min(max(value, 0), 255) for value in columns["confidence"]),
+            bytes(min(speaker, 255) for speaker in columns["speaker"]),
+            text_bytes,
+            label_bytes,
+        ])
+
+    @staticmethod
+    def pack_word_starts(starts: List[int]) -> bytes:
+        """Pack word start times (ms, in transcript order) as little-endian int32."""
+        return struct.pack(f"<{len(starts)}i", *(int(start or 0) for start in starts))
+
+    @staticmethod
+    def word_range(
+        packed_starts: bytes,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[int, int, int]:
+        """
+        Find the words in a time window by binary search over start times.
+
+        The window includes the word in progress at start_ms. A cursor (word
+        index from a previous page) overrides start_ms.
+
+        Args:
+            packed_starts: Output of pack_word_starts
+            start_ms: Window start
+            end_ms: Window end (exclusive)
+            cursor: Word index to continue from
+            limit: Maximum number of words
+
+        Returns:
+            Tuple of (first index, end index (exclusive), total word count)
+        """
+        starts = struct.unpack(f"<{len(packed_starts) // 4}i", packed_starts)
+        total = len(starts)
+
+        if cursor is not None:
+            lo = min(max(cursor, 0), total)
+        elif start_ms is not None:
+            lo = max(0, bisect.bisect_right(starts, start_ms) - 1)
+        else:
+            lo = 0
+
+        hi = bisect.bisect_left(starts, end_ms, lo) if end_ms is not None else total
+        if limit is not None:
+            hi = min(hi, lo + limit)
+
+        return lo, max(lo, hi), total
+
+    @staticmethod
+    def with_speaker_names(columns: Dict[str, Any], speaker_map: Mapping[str, str]) -> Dict[str, Any]:
+        """Columns with the speaker table mapped to display names."""
+        return {
+            **columns,
+            "speakers": [speaker_map.get(label, label) for label in columns["speakers"]],
+        }
+
+    def packed_with_speaker_names(self, packed: bytes, speaker_map: Mapping[str, str]) -> bytes:
+        """
+        Append display names for the speaker table to a packed payload.
+
+        Args:
+            packed: Stored payload from pack_word_columns
+            speaker_map: Speaker label -> display name
+
+        Returns:
+            Payload ready to send
+        """
+        magic, count, text_length, label_length, _, duration = self.PACKED_HEADER.unpack_from(packed)
+        body = packed[self.PACKED_HEADER.size:]
+
+        labels_start = len(body) - label_length
+        labels = json.loads(body[labels_start:].decode("utf-8"))
+        name_bytes = json.dumps([speaker_map.get(label, label) for label in labels]).encode("utf-8")
+
+        header = self.PACKED_HEADER.pack(magic, count, text_length, label_length, len(name_bytes), duration)
+        return header + body + name_bytes
+
+    def get_cached(self, key: Hashable) -> Optional[WordIndex]:
+        """Get a loaded index from the cache."""
+        index = self._cache.get(key)
+        if index is not None:
+            self._cache.move_to_end(key)
+        return index
+
+    def load(self, key: Hashable, data: Dict[str, Any]) -> WordIndex:
+        """
+        Load a stored index and cache it.
+
+        Args:
+            key: Cache key (should change whenever the transcript does)
+            data: Stored index
+
+        Returns:
+            Loaded index
+        """
+        index = WordIndex(data)
+        self._cache[key] = index
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return index
+
+    def search(self, index: WordIndex, query: str, prefix: bool = False) -> Dict[str, Any]:
+        """
+        Search a transcript for words and phrases.
+
+        Returns the same shape as AssemblyAI's word search API.
+
+        Args:
+            index: Loaded word index
+            query: Comma-separated words or phrases
+            prefix: Match the last word of each term as a prefix (typeahead)
+
+        Returns:
+            {"total_count": int, "matches": [{"text", "count", "timestamps", "indexes"}]}
+        """
+        matches = []
+        for term in query.split(","):
+            words = [self.normalize(word) for word in term.split()]
+            words = [word for word in words if word]
+            if not words:
+                continue
+
+            positions = self._phrase_positions(index, words, prefix)
+            matches.append({
+                "text": term.strip(),
+                "count": len(positions),
+                "timestamps": [
+                    [index.starts[position], index.ends[position + len(words) - 1]]
+                    for position in positions
+                ],
+                "indexes": positions,
+            })
+
+        return {
+            "total_count": sum(match["count"] for match in matches),
+            "matches": matches,
+        }
+
+    @staticmethod
+    def _phrase_positions(index: WordIndex, words: List[str], prefix: bool) -> List[int]:
+        """Sorted word indexes where the phrase starts."""
+        def word_positions(i: int) -> Set[int]:
+            if prefix and i == len(words) - 1:
+                return index.prefix_positions(words[i])
+            return index.positions(words[i])
+
+        candidates = word_positions(0)
+        for offset in range(1, len(words)):
+            following = word_positions(offset)
+            candidates = {position for position in candidates if position + offset in following}
+            if not candidates:
+                break
+        return sorted(candidates)
+
+
+# Global service instance
+transcript_words_service = TranscriptWordsService()
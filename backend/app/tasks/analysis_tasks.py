@@ -10,7 +10,15 @@ from app.tasks.celery_app import celery_app
 from app.database import SessionLocal
 from app.models.database_models import Video, Transcript, SpeakerLabel, VideoAnalysis, ProjectAnalysis, Project
 from app.agents.graph import video_analysis_graph, project_analysis_graph
-from app.agents.states import VideoAnalysisState, ProjectAnalysisState
+from app.agents.states import (
+    VideoAnalysisState,
+    ProjectAnalysisState,
+    VIDEO_ANALYSIS_STAGES,
+    PROJECT_ANALYSIS_STAGES,
+    first_incomplete_stage,
+)
+from app.services.progress_service import progress_service
+from app.services.synthesis_input_builder import synthesis_input_builder
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +42,25 @@ class DatabaseTask(Task):
             self._db = None
 
 
+def _publish_stage_completed(kind: str, stage: str, node_state: dict, stages: dict, **ids) -> None:
+    """Publish a finished pipeline stage (with its output size) and the stage that starts next."""
+    output = node_state.get(stages[stage])
+    progress_service.publish(kind, stage, "completed", count=len(output) if output else 0, **ids)
+
+    next_stage = node_state.get("current_step")
+    if next_stage in stages and next_stage != stage:
+        progress_service.publish(kind, next_stage, "started", **ids)
+
+
 @celery_app.task(base=DatabaseTask, bind=True, name="analyze_video")
-def analyze_video_task(self, video_id: str):
+def analyze_video_task(self, video_id: str, use_cache: bool = True, resume: bool = False):
     """
     Analyze a video using the 5-step LangGraph pipeline.
 
+    Each stage's output is saved to VideoAnalysis as soon as the stage
+    completes. With resume=True, stages that already have saved output are
+    skipped and the graph starts at the first incomplete stage.
+
     Steps:
     1. CHUNK - Break transcript into discrete pieces
     2. INFER - Interpret meaning from each chunk
@@ -48,6 +70,8 @@ def analyze_video_task(self, video_id: str):
 
     Args:
         video_id: UUID of the video to analyze
+        use_cache: Set False to bypass the Claude response cache
+        resume: Reuse checkpointed stage outputs from a previous run
 
     Returns:
         Dictionary with analysis results
@@ -92,39 +116,72 @@ def analyze_video_task(self, video_id: str):
         else:
             video_analysis.status = "processing"
             video_analysis.started_at = datetime.utcnow()
+        video_analysis.failed_stage = None
+        video_analysis.error_message = None
+
+        # Seed stage outputs: checkpoints up to the first incomplete stage when
+        # resuming, nothing otherwise (so a new run never mixes in stale output)
+        resume_from = first_incomplete_stage({
+            output_key: getattr(video_analysis, output_key)
+            for output_key in VIDEO_ANALYSIS_STAGES.values()
+        }) if resume else "chunk"
+
+        stage_outputs = {}
+        reached_resume_point = False
+        for stage, output_key in VIDEO_ANALYSIS_STAGES.items():
+            reached_resume_point = reached_resume_point or stage == resume_from
+            if reached_resume_point:
+                setattr(video_analysis, output_key, None)
+            stage_outputs[output_key] = getattr(video_analysis, output_key)
 
         video.status = "analyzing"
+        video.error_message = None
         self.db.commit()
+        if resume_from:
+            progress_service.publish(
+                "video_analysis", resume_from, "started", video_id=video_id, project_id=video.project_id
+            )
 
         # Prepare initial state for LangGraph
         initial_state: VideoAnalysisState = {
             "video_id": video_id,
             "transcript": transcript.processed_transcript,
             "speaker_labels": speaker_mapping,
-            "chunks": None,
-            "inferences": None,
-            "patterns": None,
-            "insights": None,
-            "design_principles": None,
-            "current_step": "chunk",
-            "error": None
+            **stage_outputs,
+            "current_step": resume_from or "completed",
+            "error": None,
+            "use_cache": use_cache
         }
 
-        logger.info(f"Running LangGraph video analysis for video {video_id}")
-
-        # Run the LangGraph workflow
-        final_state = video_analysis_graph.invoke(initial_state)
-
-        # Check for errors
+        if resume:
+            logger.info(f"Resuming LangGraph video analysis for video {video_id} from stage: {resume_from}")
+        else:
+            logger.info(f"Running LangGraph video analysis for video {video_id}")
+
+        # Run the LangGraph workflow, checkpointing each stage as it completes
+        final_state = dict(initial_state)
+        for update in video_analysis_graph.stream(initial_state, stream_mode="updates"):
+            for stage, node_state in update.items():
+                final_state.update(node_state)
+                if node_state.get("error"):
+                    continue
+
+                output_key = VIDEO_ANALYSIS_STAGES[stage]
+                setattr(video_analysis, output_key, node_state.get(output_key))
+                self.db.commit()
+                logger.info(f"Checkpointed {stage} output for video {video_id}")
+
+                _publish_stage_completed(
+                    "video_analysis", stage, node_state, VIDEO_ANALYSIS_STAGES,
+                    video_id=video_id, project_id=video.project_id
+                )
+
+        # Check for errors (the graph stops at the failing step)
         if final_state.get("error"):
-            raise Exception(f"Analysis failed: {final_state['error']}")
+            video_analysis.failed_stage = final_state.get("current_step")
+            raise Exception(f"Analysis failed at {final_state.get('current_step')}: {final_state['error']}")
 
-        # Save results to database
-        video_analysis.chunks = final_state.get("chunks")
-        video_analysis.inferences = final_state.get("inferences")
-        video_analysis.patterns = final_state.get("patterns")
-        video_analysis.insights = final_state.get("insights")
-        video_analysis.design_principles = final_state.get("design_principles")
+        # Stage outputs are already saved; mark the analysis complete
         video_analysis.status = "completed"
         video_analysis.completed_at = datetime.utcnow()
 
@@ -139,6 +196,9 @@ def analyze_video_task(self, video_id: str):
         # Refresh again to verify the commit
         self.db.refresh(video)
         logger.info(f"Video analysis completed for video {video_id}, status: {video.status}")
+        progress_service.publish(
+            "video_analysis", "completed", "completed", video_id=video_id, project_id=video.project_id
+        )
 
         return {
             "video_id": video_id,
@@ -163,14 +223,25 @@ def analyze_video_task(self, video_id: str):
 
             if video:
                 video.status = "error"
+                video.error_message = str(e)
             if video_analysis:
                 video_analysis.status = "error"
+                video_analysis.error_message = str(e)
                 video_analysis.completed_at = datetime.utcnow()
 
             # Explicitly flush and commit
             self.db.flush()
             self.db.commit()
             logger.info(f"Video {video_id} status updated to error")
+
+            progress_service.publish(
+                "video_analysis",
+                (video_analysis.failed_stage if video_analysis else None) or "error",
+                "error",
+                video_id=video_id,
+                project_id=video.project_id if video else None,
+                error=str(e)
+            )
         except Exception as commit_error:
             logger.error(f"Failed to update error status: {commit_error}")
 
@@ -178,7 +249,7 @@ def analyze_video_task(self, video_id: str):
 
 
 @celery_app.task(base=DatabaseTask, bind=True, name="analyze_project")
-def analyze_project_task(self, project_id: str):
+def analyze_project_task(self, project_id: str, use_cache: bool = True):
     """
     Analyze a project using cross-video synthesis (3-step pipeline).
 
@@ -189,6 +260,7 @@ def analyze_project_task(self, project_id: str):
 
     Args:
         project_id: UUID of the project to analyze
+        use_cache: Set False to bypass the Claude response cache
 
     Returns:
         Dictionary with cross-video analysis results
@@ -204,30 +276,13 @@ def analyze_project_task(self, project_id: str):
         if not project:
             raise Exception(f"Project {project_id} not found")
 
-        # Get all completed video analyses for this project
-        video_analyses = self.db.query(VideoAnalysis).join(Video).filter(
-            Video.project_id == project.id,
-            VideoAnalysis.status == "completed"
-        ).all()
+        # Stream only the stage outputs synthesis needs, tagged with their video_id
+        synthesis_input = synthesis_input_builder.build(self.db, project.id)
+        video_ids = synthesis_input["video_ids"]
 
-        if len(video_analyses) < 1:
+        if len(video_ids) < 1:
             raise Exception("At least one completed video analysis is required")
 
-        # Collect all patterns, insights, and principles from videos
-        all_patterns = []
-        all_insights = []
-        all_principles = []
-        video_ids = []
-
-        for analysis in video_analyses:
-            video_ids.append(str(analysis.video_id))
-            if analysis.patterns:
-                all_patterns.extend(analysis.patterns)
-            if analysis.insights:
-                all_insights.extend(analysis.insights)
-            if analysis.design_principles:
-                all_principles.extend(analysis.design_principles)
-
         # Get or create project analysis record
         project_analysis = self.db.query(ProjectAnalysis).filter(
             ProjectAnalysis.project_id == project.id
@@ -245,31 +300,43 @@ def analyze_project_task(self, project_id: str):
             project_analysis.status = "processing"
             project_analysis.video_ids = [UUID(vid) for vid in video_ids]
             project_analysis.started_at = datetime.utcnow()
+        project_analysis.failed_stage = None
+        project_analysis.error_message = None
 
         self.db.commit()
+        progress_service.publish("project_analysis", "cross_relate", "started", project_id=project_id)
 
         # Prepare initial state for LangGraph
         initial_state: ProjectAnalysisState = {
             "project_id": project_id,
             "video_ids": video_ids,
-            "video_patterns": all_patterns,
-            "video_insights": all_insights,
-            "video_principles": all_principles,
+            "video_patterns": synthesis_input["video_patterns"],
+            "video_insights": synthesis_input["video_insights"],
+            "video_principles": synthesis_input["video_principles"],
             "cross_video_patterns": None,
             "cross_video_insights": None,
             "cross_video_principles": None,
             "current_step": "cross_relate",
-            "error": None
+            "error": None,
+            "use_cache": use_cache
         }
 
         logger.info(f"Running LangGraph project analysis for project {project_id}")
 
-        # Run the LangGraph workflow
-        final_state = project_analysis_graph.invoke(initial_state)
-
-        # Check for errors
+        # Run the LangGraph workflow, publishing each stage as it completes
+        final_state = dict(initial_state)
+        for update in project_analysis_graph.stream(initial_state, stream_mode="updates"):
+            for stage, node_state in update.items():
+                final_state.update(node_state)
+                if not node_state.get("error"):
+                    _publish_stage_completed(
+                        "project_analysis", stage, node_state, PROJECT_ANALYSIS_STAGES, project_id=project_id
+                    )
+
+        # Check for errors (the graph stops at the failing step)
         if final_state.get("error"):
-            raise Exception(f"Analysis failed: {final_state['error']}")
+            project_analysis.failed_stage = final_state.get("current_step")
+            raise Exception(f"Analysis failed at {final_state.get('current_step')}: {final_state['error']}")
 
         # Save results to database
         project_analysis.cross_video_patterns = final_state.get("cross_video_patterns")
@@ -281,6 +348,7 @@ def analyze_project_task(self, project_id: str):
         self.db.commit()
 
         logger.info(f"Project analysis completed for project {project_id}")
+        progress_service.publish("project_analysis", "completed", "completed", project_id=project_id)
 
         return {
             "project_id": project_id,
@@ -303,9 +371,17 @@ def analyze_project_task(self, project_id: str):
 
             if project_analysis:
                 project_analysis.status = "error"
+                project_analysis.error_message = str(e)
                 project_analysis.completed_at = datetime.utcnow()
 
             self.db.commit()
+            progress_service.publish(
+                "project_analysis",
+                (project_analysis.failed_stage if project_analysis else None) or "error",
+                "error",
+                project_id=project_id,
+                error=str(e)
+            )
         except:
             pass
 
@@ -1,6 +1,7 @@
 """Celery application configuration."""
 
 from celery import Celery
+from kombu import Queue
 import logging
 
 from app.config import settings
@@ -18,8 +19,38 @@ celery_app = Celery(
     ]
 )
 
+# Queues, so short interactive work never waits behind hour-long analyses.
+# Run one worker pool per queue (scripts/startup.sh worker <queue>) to scale
+# each to its own bottleneck.
+QUEUE_CONCURRENCY = {
+    "transcription": settings.CELERY_TRANSCRIPTION_CONCURRENCY,
+    "video_analysis": settings.CELERY_VIDEO_ANALYSIS_CONCURRENCY,
+    "project_analysis": settings.CELERY_PROJECT_ANALYSIS_CONCURRENCY,
+    "default": settings.CELERY_DEFAULT_CONCURRENCY,
+}
+
+# Priorities within a queue (0 is highest with the Redis broker)
+TASK_ROUTES = {
+    "transcribe_video": {"queue": "transcription", "priority": 3},
+    "complete_transcription": {"queue": "transcription", "priority": 1},
+    "check_transcription": {"queue": "transcription", "priority": 5},
+    "analyze_video": {"queue": "video_analysis", "priority": 5},
+    "analyze_project": {"queue": "project_analysis", "priority": 5},
+}
+
 # Configure Celery
 celery_app.conf.update(
+    # Routing
+    task_queues=[Queue(name) for name in QUEUE_CONCURRENCY],
+    task_default_queue="default",
+    task_routes=TASK_ROUTES,
+    task_default_priority=5,
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
+
     # Task settings
     task_serializer="json",
     accept_content=["json"],
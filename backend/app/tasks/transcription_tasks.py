@@ -3,13 +3,19 @@
 from celery import Task
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Any, Dict, Optional
 import logging
+import time
 
 from app.tasks.celery_app import celery_app
+from app.config import settings
 from app.database import SessionLocal
-from app.models.database_models import Video, Transcript, SpeakerLabel
+from app.models.database_models import Video, Transcript
 from app.services.assemblyai_service import assemblyai_service
+from app.services.progress_service import progress_service
 from app.services.s3_service import s3_service
+from app.services.speaker_label_service import speaker_label_service
+from app.services.transcript_words_service import transcript_words_service
 
 logger = logging.getLogger(__name__)
 
@@ -33,26 +39,139 @@ class DatabaseTask(Task):
             self._db = None
 
 
+def _mark_transcription_failed(db: Session, video_id: str, error: str) -> None:
+    """Set video and transcript status to error (best effort)."""
+    try:
+        db.rollback()
+        video = db.query(Video).filter(Video.id == UUID(video_id)).first()
+        transcript = db.query(Transcript).filter(Transcript.video_id == UUID(video_id)).first()
+
+        if video:
+            video.status = "error"
+            video.error_message = error
+        if transcript:
+            transcript.status = "error"
+
+        db.commit()
+        progress_service.publish(
+            "transcription", "error", "error",
+            video_id=video_id, project_id=video.project_id if video else None, error=error
+        )
+    except:
+        pass
+
+
+def _save_completed_transcript(
+    db: Session,
+    video_id: str,
+    raw_transcript: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch a completed transcript from AssemblyAI and save it.
+
+    Safe to call more than once for the same video (webhook and fallback
+    re-check may both fire): the transcript row is locked and a transcript
+    that is already completed is left untouched.
+
+    Args:
+        db: Database session
+        video_id: UUID of the video
+        raw_transcript: Transcript data already fetched by a status check
+            (skips downloading it again)
+
+    Returns:
+        Dictionary with transcription results
+    """
+    video = db.query(Video).filter(Video.id == UUID(video_id)).first()
+    if not video:
+        raise Exception(f"Video {video_id} not found")
+
+    transcript = db.query(Transcript)\
+        .filter(Transcript.video_id == video.id)\
+        .with_for_update()\
+        .first()
+    if not transcript or not transcript.assemblyai_id:
+        raise Exception(f"No submitted transcript found for video {video_id}")
+
+    if transcript.status == "completed":
+        db.rollback()
+        logger.info(f"Transcript for video {video_id} already saved, skipping")
+        return {
+            "video_id": video_id,
+            "transcript_id": str(transcript.id),
+            "status": "completed",
+        }
+
+    if raw_transcript is None:
+        raw_transcript = assemblyai_service.get_transcript(transcript.assemblyai_id)
+
+    # Process transcript for analysis
+    processed_transcript = assemblyai_service.process_transcript_for_analysis(raw_transcript)
+
+    # Save transcripts to database
+    transcript.raw_transcript = raw_transcript
+    transcript.processed_transcript = processed_transcript
+    transcript.word_index = transcript_words_service.build_word_index(raw_transcript.get("words", []))
+    word_columns = transcript_words_service.build_word_columns(
+        raw_transcript.get("words", []),
+        raw_transcript.get("audio_duration", 0)
+    )
+    transcript.word_columns = word_columns
+    transcript.word_columns_packed = transcript_words_service.pack_word_columns(word_columns)
+    transcript.word_starts = transcript_words_service.pack_word_starts(
+        [word.get("start", 0) for word in raw_transcript.get("words", [])]
+    )
+    transcript.status = "completed"
+
+    # Extract unique speakers and create speaker label records
+    speakers = set()
+    for utterance in raw_transcript.get("utterances", []):
+        speakers.add(utterance["speaker"])
+
+    # Names and roles are filled in by the user later; existing labels are kept
+    statement = speaker_label_service.insert_detected_statement(transcript.id, sorted(speakers))
+    if statement is not None:
+        db.execute(statement)
+
+    video.status = "transcribed"
+    video.error_message = None
+    db.commit()
+    progress_service.publish(
+        "transcription", "completed", "completed",
+        video_id=video_id, project_id=video.project_id, speakers_detected=len(speakers)
+    )
+
+    logger.info(f"Transcription completed for video {video_id}")
+
+    return {
+        "video_id": video_id,
+        "transcript_id": str(transcript.id),
+        "assemblyai_id": transcript.assemblyai_id,
+        "status": "completed",
+        "speakers_detected": len(speakers),
+        "duration_seconds": processed_transcript.get("duration_seconds", 0)
+    }
+
+
 @celery_app.task(base=DatabaseTask, bind=True, name="transcribe_video")
 def transcribe_video_task(self, video_id: str):
     """
-    Transcribe a video using AssemblyAI with speaker diarization.
+    Submit a video to AssemblyAI for transcription with speaker diarization.
 
     This task:
     1. Generates a presigned S3 URL for the video
-    2. Submits video to AssemblyAI for transcription
-    3. Polls until transcription completes
-    4. Saves raw transcript and creates speaker label records
-    5. Updates video and transcript status
+    2. Submits video to AssemblyAI with a completion webhook (if configured)
+    3. Schedules a fallback status re-check
+    4. Returns immediately; complete_transcription_task saves the result
 
     Args:
         video_id: UUID of the video to transcribe
 
     Returns:
-        Dictionary with transcription results
+        Dictionary with submission details
 
     Raises:
-        Exception: If transcription fails
+        Exception: If submission fails
     """
     try:
         logger.info(f"Starting transcription task for video {video_id}")
@@ -75,6 +194,9 @@ def transcribe_video_task(self, video_id: str):
 
         video.status = "transcribing"
         self.db.commit()
+        progress_service.publish(
+            "transcription", "processing", "processing", video_id=video_id, project_id=video.project_id
+        )
 
         # Generate presigned URL for AssemblyAI to access the video
         logger.info(f"Generating presigned URL for S3 key: {video.s3_key}")
@@ -83,79 +205,112 @@ def transcribe_video_task(self, video_id: str):
             expiration=7200  # 2 hours
         )
 
-        # Start transcription
-        logger.info(f"Starting AssemblyAI transcription for video {video_id}")
-        assemblyai_id = assemblyai_service.start_transcription(presigned_url)
+        # Submit transcription (returns as soon as the job is queued)
+        logger.info(f"Submitting AssemblyAI transcription for video {video_id}")
+        assemblyai_id = assemblyai_service.start_transcription(
+            presigned_url,
+            webhook_url=settings.ASSEMBLYAI_WEBHOOK_URL or None
+        )
 
         transcript.assemblyai_id = assemblyai_id
         self.db.commit()
 
-        # Poll until complete (this will block, but that's fine for Celery)
-        logger.info(f"Polling for transcript {assemblyai_id}")
-        raw_transcript = assemblyai_service.poll_until_complete(
-            transcript_id=assemblyai_id,
-            max_wait_seconds=3600,  # 1 hour max
-            poll_interval=5
+        # Fallback in case the webhook is never delivered
+        check_transcription_task.apply_async(
+            args=[video_id, time.time()],
+            countdown=assemblyai_service.next_poll_delay(
+                0, video.duration_seconds, settings.TRANSCRIPTION_RECHECK_SECONDS
+            )
         )
 
-        # Process transcript for analysis
-        processed_transcript = assemblyai_service.process_transcript_for_analysis(raw_transcript)
-
-        # Save transcripts to database
-        transcript.raw_transcript = raw_transcript
-        transcript.processed_transcript = processed_transcript
-        transcript.status = "completed"
-
-        # Extract unique speakers and create speaker label records
-        speakers = set()
-        for utterance in raw_transcript.get("utterances", []):
-            speakers.add(utterance["speaker"])
-
-        for speaker in speakers:
-            # Check if speaker label already exists
-            existing = self.db.query(SpeakerLabel).filter(
-                SpeakerLabel.transcript_id == transcript.id,
-                SpeakerLabel.speaker_label == speaker
-            ).first()
-
-            if not existing:
-                speaker_label = SpeakerLabel(
-                    transcript_id=transcript.id,
-                    speaker_label=speaker,
-                    assigned_name=None,  # Will be filled by user later
-                    role=None
-                )
-                self.db.add(speaker_label)
-
-        video.status = "transcribed"
-        self.db.commit()
-
-        logger.info(f"Transcription completed for video {video_id}")
-
         return {
             "video_id": video_id,
             "transcript_id": str(transcript.id),
             "assemblyai_id": assemblyai_id,
-            "status": "completed",
-            "speakers_detected": len(speakers),
-            "duration_seconds": processed_transcript.get("duration_seconds", 0)
+            "status": "processing",
+            "webhook": bool(settings.ASSEMBLYAI_WEBHOOK_URL),
         }
 
     except Exception as e:
         logger.error(f"Transcription failed for video {video_id}: {e}")
+        _mark_transcription_failed(self.db, video_id, str(e))
+        raise
 
-        # Update status to error
-        try:
-            video = self.db.query(Video).filter(Video.id == UUID(video_id)).first()
-            transcript = self.db.query(Transcript).filter(Transcript.video_id == UUID(video_id)).first()
 
-            if video:
-                video.status = "error"
-            if transcript:
-                transcript.status = "error"
+@celery_app.task(base=DatabaseTask, bind=True, name="complete_transcription")
+def complete_transcription_task(self, video_id: str):
+    """
+    Fetch and save a finished AssemblyAI transcript.
 
-            self.db.commit()
-        except:
-            pass
+    Triggered by the AssemblyAI webhook route or by the fallback re-check.
 
+    Args:
+        video_id: UUID of the video
+
+    Returns:
+        Dictionary with transcription results
+
+    Raises:
+        Exception: If the transcript cannot be retrieved or saved
+    """
+    try:
+        return _save_completed_transcript(self.db, video_id)
+
+    except Exception as e:
+        logger.error(f"Saving transcript failed for video {video_id}: {e}")
+        _mark_transcription_failed(self.db, video_id, str(e))
+        raise
+
+
+@celery_app.task(base=DatabaseTask, bind=True, name="check_transcription")
+def check_transcription_task(self, video_id: str, submitted_at: float, attempt: int = 0):
+    """
+    Fallback status check for a submitted transcription.
+
+    Re-schedules itself with a countdown while the job is still running, so
+    no worker slot is held between checks. Intervals back off and scale with
+    the video's duration; a completed check's response is saved directly.
+
+    Args:
+        video_id: UUID of the video
+        submitted_at: Unix time the job was submitted (for the max wait limit)
+        attempt: Number of checks already made
+
+    Returns:
+        Dictionary with the current transcription status
+    """
+    try:
+        transcript = self.db.query(Transcript).filter(Transcript.video_id == UUID(video_id)).first()
+        if not transcript or not transcript.assemblyai_id:
+            raise Exception(f"No submitted transcript found for video {video_id}")
+
+        # Webhook already handled it (or the job failed elsewhere)
+        if transcript.status in ("completed", "error"):
+            return {"video_id": video_id, "status": transcript.status}
+
+        status, raw_transcript = assemblyai_service.check_transcript(transcript.assemblyai_id)
+        logger.info(f"Transcript {transcript.assemblyai_id} status: {status}")
+
+        if status == "completed":
+            return _save_completed_transcript(self.db, video_id, raw_transcript)
+        elif status == "error":
+            raise Exception("Transcription failed with error")
+
+        if time.time() - submitted_at > settings.TRANSCRIPTION_MAX_WAIT_SECONDS:
+            raise Exception(f"Transcription timed out after {settings.TRANSCRIPTION_MAX_WAIT_SECONDS}s")
+
+        video = self.db.query(Video).filter(Video.id == UUID(video_id)).first()
+        check_transcription_task.apply_async(
+            args=[video_id, submitted_at, attempt + 1],
+            countdown=assemblyai_service.next_poll_delay(
+                attempt + 1,
+                video.duration_seconds if video else None,
+                settings.TRANSCRIPTION_RECHECK_SECONDS
+            )
+        )
+        return {"video_id": video_id, "status": status}
+
+    except Exception as e:
+        logger.error(f"Transcription check failed for video {video_id}: {e}")
+        _mark_transcription_failed(self.db, video_id, str(e))
         raise
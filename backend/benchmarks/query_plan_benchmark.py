@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Show query plans for the hot foreign key lookups on a seeded database.
+
+Creates the schema in a scratch Postgres schema (default "qrt_benchmark",
+so application tables are never touched), seeds it with generate_series,
+then runs EXPLAIN ANALYZE for each lookup the API and tasks issue: first
+with the indexes and unique constraints from migrations f3c9a1d7e846 and
+a5d2e8c4f917, then again with them dropped (inside a transaction that is
+rolled back).
+
+Run from backend/ with the app's environment (.env) available:
+
+    python benchmarks/query_plan_benchmark.py --projects 200 --videos-per-project 50
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from app.database import Base
+import app.models.database_models  # noqa: F401  (registers the tables on Base)
+
+# Indexes/constraints added by the migrations: (table, name, is_constraint)
+INDEXES = [
+    ("transcripts", "uq_transcripts_video_id", True),
+    ("video_analyses", "uq_video_analyses_video_id", True),
+    ("speaker_labels", "uq_speaker_labels_transcript_id_speaker_label", True),
+    ("videos", "ix_videos_project_id_uploaded_at_id", False),
+    ("project_analyses", "ix_project_analyses_project_id_started_at", False),
+    ("projects", "ix_projects_created_at_id", False),
+]
+
+QUERIES = {
+    "transcript by video": (
+        "SELECT * FROM transcripts WHERE video_id = :video_id"
+    ),
+    "video analysis by video": (
+        "SELECT * FROM video_analyses WHERE video_id = :video_id"
+    ),
+    "project videos": (
+        "SELECT * FROM videos WHERE project_id = :project_id ORDER BY uploaded_at DESC"
+    ),
+    "speaker label lookup": (
+        "SELECT * FROM speaker_labels WHERE transcript_id = :transcript_id AND speaker_label = 'B'"
+    ),
+    "latest project analysis": (
+        "SELECT * FROM project_analyses WHERE project_id = :project_id ORDER BY started_at DESC LIMIT 1"
+    ),
+    "deep keyset page of projects": (
+        "SELECT * FROM projects WHERE (created_at, id) < (:project_created_at, :project_id) "
+        "ORDER BY created_at DESC, id DESC LIMIT 100"
+    ),
+}
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO projects (id, name, status, created_at)
+    SELECT gen_random_uuid(), 'Project ' || g, 'ready', now() - g * interval '1 minute'
+    FROM generate_series(1, :projects) g
+    """,
+    """
+    INSERT INTO videos (id, project_id, filename, s3_key, s3_url, uploaded_at, status)
+    SELECT gen_random_uuid(), p.id, 'interview.mp4', 'videos/' || p.id || '/' || g, 'https://example.com',
+           now() - random() * interval '365 days', 'analyzed'
+    FROM projects p, generate_series(1, :videos_per_project) g
+    """,
+    """
+    INSERT INTO transcripts (id, video_id, assemblyai_id, processed_transcript, status)
+    SELECT gen_random_uuid(), v.id, md5(v.id::text), '{"utterances": [], "duration_seconds": 1800}', 'completed'
+    FROM videos v
+    """,
+    """
+    INSERT INTO speaker_labels (id, transcript_id, speaker_label, assigned_name)
+    SELECT gen_random_uuid(), t.id, label, 'Participant ' || label
+    FROM transcripts t, unnest(ARRAY['A', 'B', 'C']) label
+    """,
+    """
+    INSERT INTO video_analyses (id, video_id, status, started_at, completed_at)
+    SELECT gen_random_uuid(), v.id, 'completed', now() - interval '1 hour', now() FROM videos v
+    """,
+    """
+    INSERT INTO project_analyses (id, project_id, video_ids, status, started_at)
+    SELECT gen_random_uuid(), p.id, ARRAY[]::uuid[], 'completed', now() - g * interval '1 day'
+    FROM projects p, generate_series(1, :analyses_per_project) g
+    """,
+]
+
+
+def explain(connection, params: dict) -> None:
+    """Print the plan and timing of each hot query."""
+    for name, sql in QUERIES.items():
+        plan = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params).scalars().all()
+        execution = next((line for line in plan if line.startswith("Execution Time")), "")
+        print(f"\n-- {name}: {execution.replace('Execution Time: ', '')}")
+        for line in plan:
+            if not line.startswith(("Planning", "Execution")):
+                print(f"   {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--videos-per-project", type=int, default=50)
+    parser.add_argument("--analyses-per-project", type=int, default=5)
+    parser.add_argument("--schema", default="qrt_benchmark", help="Scratch schema (dropped and recreated)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+            connection.execute(text(f'CREATE SCHEMA "{args.schema}"'))
+            connection.execute(text(f'SET LOCAL search_path TO "{args.schema}"'))
+            Base.metadata.create_all(bind=connection)
+
+            counts = {
+                "projects": args.projects,
+                "videos_per_project": args.videos_per_project,
+                "analyses_per_project": args.analyses_per_project,
+            }
+            for statement in SEED_STATEMENTS:
+                connection.execute(text(statement), counts)
+            connection.execute(text("ANALYZE"))
+
+        with engine.connect() as connection:
+            connection.execute(text(f'SET search_path TO "{args.schema}"'))
+            params = dict(connection.execute(text("""
+                SELECT v.id AS video_id, v.project_id, p.created_at AS project_created_at, t.id AS transcript_id
+                FROM videos v
+                JOIN projects p ON p.id = v.project_id
+                JOIN transcripts t ON t.video_id = v.id
+                ORDER BY v.id OFFSET (SELECT count(*) / 2 FROM videos) LIMIT 1
+            """)).one()._mapping)
+            connection.commit()
+
+            videos = args.projects * args.videos_per_project
+            print(f"Seeded {args.projects} projects, {videos} videos/transcripts/analyses, "
+                  f"{videos * 3} speaker labels, {args.projects * args.analyses_per_project} project analyses")
+
+            print("\n==== With indexes ====")
+            explain(connection, params)
+            connection.rollback()
+
+            for table, name, is_constraint in INDEXES:
+                if is_constraint:
+                    connection.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {name}"))
+                else:
+                    connection.execute(text(f"DROP INDEX {name}"))
+            print("\n==== Without indexes (previous schema) ====")
+            explain(connection, params)
+            connection.rollback()
+    finally:
+        if not args.keep:
+            with engine.begin() as connection:
+                connection.execute(text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE'))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization for a large video analysis.
+
+Compares, per request, the CPU spent turning a stored VideoAnalysis into
+response bytes:
+
+- stdlib: decode JSONB (as asyncpg does), validate with the response_model,
+  jsonable_encoder + json.dumps (FastAPI's default JSONResponse path)
+- orjson: the same, encoded with orjson (ORJSONResponse)
+- raw: JSONB text spliced into the response (load_json_row fast path)
+
+and the cost and size of gzip/Brotli compression of the result.
+
+Run from backend/ with the app's environment (.env) available:
+
+    python benchmarks/serialization_benchmark.py --chunks 2000
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+from app.models.schemas import VideoAnalysisResponse
+from app.responses import brotli, raw_json_object
+
+JSONB_FIELDS = ("chunks", "inferences", "patterns", "insights", "design_principles")
+
+
+def build_analysis(chunk_count: int) -> dict:
+    """Synthetic stage outputs shaped like the pipeline's."""
+    chunks = [
+        {
+            "chunk_id": f"C{i:04d}",
+            "speaker": f"Speaker {'AB'[i % 2]}",
+            "timestamp": f"00:{i // 60 % 60:02d}:{i % 60:02d}",
+            "text": f"Participant describes step {i} of their workflow and where it breaks down. " * 2,
+            "type": "quote",
+        }
+        for i in range(chunk_count)
+    ]
+    inferences = [
+        {
+            "chunk_id": chunk["chunk_id"],
+            "inferences": [
+                {
+                    "inference_id": f"I{i:04d}{j}",
+                    "meaning": "The participant works around the tool instead of with it.",
+                    "importance": "Workarounds hide friction from usage metrics.",
+                    "context": "Appears whenever the export step is involved.",
+                }
+                for j in range(2)
+            ],
+        }
+        for i, chunk in enumerate(chunks)
+    ]
+    patterns = [
+        {
+            "pattern_id": f"P{i:03d}",
+            "pattern_name": f"Pattern {i}",
+            "description": "Recurring workaround around exports.",
+            "related_inferences": [f"I{k:04d}0" for k in range(i, i + 10)],
+            "frequency": "high",
+            "significance": "Signals unmet needs in the export flow.",
+        }
+        for i in range(max(chunk_count // 20, 1))
+    ]
+    insights = [
+        {
+            "insight_id": f"IN{i:03d}",
+            "headline": "Exports are the real product",
+            "explanation": "Users value the exported artifact over in-app views. " * 3,
+            "supporting_patterns": [f"P{i:03d}"],
+            "evidence": ["Key quote 1", "Key quote 2"],
+            "type": "non-consensus",
+            "implications": "Invest in export fidelity.",
+            "confidence": "high",
+        }
+        for i in range(max(chunk_count // 50, 1))
+    ]
+    principles = [
+        {
+            "principle_id": f"DP{i:03d}",
+            "insight_id": f"IN{i:03d}",
+            "principle": "The system should make exports first-class to keep work portable.",
+            "rationale": "Follows from how participants share results.",
+            "how_might_we": ["How might we ...?", "How might we ...?"],
+            "priority": "high",
+        }
+        for i in range(max(chunk_count // 50, 1))
+    ]
+    return {
+        "chunks": chunks,
+        "inferences": inferences,
+        "patterns": patterns,
+        "insights": insights,
+        "design_principles": principles,
+    }
+
+
+def time_call(function, repeat: int) -> float:
+    """Median wall time of a call in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chunks", type=int, default=2000, help="Chunks in the synthetic analysis")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+
+    outputs = build_analysis(args.chunks)
+    scalars = {
+        "id": uuid.uuid4(),
+        "video_id": uuid.uuid4(),
+        "status": "completed",
+        "failed_stage": None,
+        "error_message": None,
+        "started_at": datetime.now(timezone.utc),
+        "completed_at": datetime.now(timezone.utc),
+    }
+    # What Postgres returns for JSONB::text (not timed: produced by the database)
+    stored_text = {field: json.dumps(outputs[field]) for field in JSONB_FIELDS}
+
+    def stdlib_path() -> bytes:
+        row = SimpleNamespace(**scalars, **{field: json.loads(text) for field, text in stored_text.items()})
+        model = VideoAnalysisResponse.model_validate(row)
+        return json.dumps(
+            jsonable_encoder(model), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def orjson_path() -> bytes:
+        row = SimpleNamespace(**scalars, **{field: json.loads(text) for field, text in stored_text.items()})
+        model = VideoAnalysisResponse.model_validate(row)
+        return orjson.dumps(jsonable_encoder(model))
+
+    def raw_path() -> bytes:
+        values = {name: scalars.get(name, stored_text.get(name)) for name in VideoAnalysisResponse.model_fields}
+        return raw_json_object(values, JSONB_FIELDS)
+
+    body = raw_path()
+    print(f"Payload: {args.chunks} chunks, {len(body) / 1024 / 1024:.2f} MB of JSON\n")
+
+    print("Serialization (median ms per response)")
+    baseline = time_call(stdlib_path, args.repeat)
+    for name, function in (("stdlib", stdlib_path), ("orjson", orjson_path), ("raw", raw_path)):
+        elapsed = baseline if name == "stdlib" else time_call(function, args.repeat)
+        print(f"  {name:<8} {elapsed:9.1f} ms  ({baseline / elapsed:5.1f}x)")
+
+    print("\nCompression")
+    codings = [("gzip", lambda: gzip.compress(body, compresslevel=settings.GZIP_COMPRESSION_LEVEL))]
+    if brotli is not None:
+        codings.append(("br", lambda: brotli.compress(body, quality=settings.BROTLI_QUALITY)))
+    else:
+        print("  (brotli not installed, skipping br)")
+    for name, function in codings:
+        elapsed = time_call(function, args.repeat)
+        size = len(function())
+        print(f"  {name:<8} {elapsed:9.1f} ms  {size / 1024:9.1f} KB  ({len(body) / size:4.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,8 +63,18 @@ alembic upgrade head
 
 # Start the application based on the command passed
 if [ "$1" = "worker" ]; then
-    echo "🔨 Starting Celery worker..."
-    exec celery -A app.tasks.celery_app worker --loglevel=info
+    QUEUE="$2"
+    if [ -z "$QUEUE" ]; then
+        # Single worker consuming every queue (local development)
+        echo "🔨 Starting Celery worker (all queues)..."
+        exec celery -A app.tasks.celery_app worker --loglevel=info \
+            -Q transcription,video_analysis,project_analysis,default
+    fi
+
+    CONCURRENCY=$(python -c "from app.tasks.celery_app import QUEUE_CONCURRENCY; print(QUEUE_CONCURRENCY['$QUEUE'])")
+    echo "🔨 Starting Celery worker for queue '$QUEUE' (concurrency $CONCURRENCY)..."
+    exec celery -A app.tasks.celery_app worker --loglevel=info \
+        -Q "$QUEUE" -c "$CONCURRENCY" -n "$QUEUE@%h"
 else
     echo "🌐 Starting API server..."
     if [ "$IS_ECS" = true ]; then
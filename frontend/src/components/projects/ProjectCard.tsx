@@ -24,7 +24,7 @@ interface ProjectCardProps {
 export default function ProjectCard({ project }: ProjectCardProps) {
   const navigate = useNavigate();
   const { mutate: updateProject } = useUpdateProject();
-  const videoCount = project.videos?.length || 0;
+  const videoCount = project.video_count ?? project.videos?.length ?? 0;
   const [showDeleteDialog, setShowDeleteDialog] = useState(false);
   const [showEditDialog, setShowEditDialog] = useState(false);
 
@@ -0,0 +1,47 @@
+import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+
+const EVENT_TYPES = ["transcription", "video_analysis", "project_analysis"];
+
+/**
+ * Hook to subscribe to a server-sent progress stream.
+ *
+ * Every pushed event invalidates the given queries (exact keys only), so they
+ * refetch once per state change instead of polling on an interval.
+ *
+ * @param path - Stream path (e.g. `/api/videos/${id}/events`), or null to skip
+ * @param queryKeys - Queries to invalidate when progress is pushed
+ * @returns Whether the stream is connected
+ */
+export function useProgressStream(path: string | null, queryKeys: unknown[][]) {
+  const queryClient = useQueryClient();
+  const [connected, setConnected] = useState(false);
+  const keys = JSON.stringify(queryKeys);
+
+  useEffect(() => {
+    if (!path) return;
+
+    const apiUrl = import.meta.env.VITE_API_URL || "http://localhost:8000";
+    const source = new EventSource(`${apiUrl}${path}`);
+
+    const invalidate = () => {
+      for (const queryKey of JSON.parse(keys) as unknown[][]) {
+        queryClient.invalidateQueries({ queryKey, exact: true });
+      }
+    };
+
+    source.onopen = () => setConnected(true);
+    // EventSource reconnects by itself; fall back to polling meanwhile
+    source.onerror = () => setConnected(false);
+    for (const type of EVENT_TYPES) {
+      source.addEventListener(type, invalidate);
+    }
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [path, keys, queryClient]);
+
+  return connected;
+}
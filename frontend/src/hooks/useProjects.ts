@@ -5,7 +5,8 @@ import type { CreateProjectDto, UpdateProjectDto } from "../types";
 export function useProjects() {
   return useQuery({
     queryKey: ["projects"],
-    queryFn: projectsService.getAll,
+    // Summary pages carry the projects with their video counts
+    queryFn: () => projectsService.getAllSummaries(),
   });
 }
 
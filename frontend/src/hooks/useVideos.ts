@@ -1,7 +1,13 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { videosService } from "../services/videos";
+import { useProgressStream } from "./useProgressStream";
 
 export function useProjectVideos(projectId: string | null) {
+  useProgressStream(projectId ? `/api/projects/${projectId}/events` : null, [
+    ["projects", projectId, "videos"],
+    ["projects", projectId, "analysis"],
+  ]);
+
   return useQuery({
     queryKey: ["projects", projectId, "videos"],
     queryFn: () => videosService.getByProject(projectId!),
@@ -10,6 +16,12 @@ export function useProjectVideos(projectId: string | null) {
 }
 
 export function useVideo(id: string | null) {
+  // Progress is pushed; polling is only a fallback while the stream is down
+  const streaming = useProgressStream(id ? `/api/videos/${id}/events` : null, [
+    ["videos", id],
+    ["videos", id, "analysis"],
+  ]);
+
   return useQuery({
     queryKey: ["videos", id],
     queryFn: () => videosService.getById(id!),
@@ -18,6 +30,7 @@ export function useVideo(id: string | null) {
       const video = query.state.data;
       // Poll while transcribing or analyzing
       if (
+        !streaming &&
         video &&
         (video.status === "transcribing" || video.status === "analyzing")
       ) {
@@ -1,6 +1,22 @@
 import api from "./api";
 import type { VideoAnalysis, ProjectAnalysis, AnalysisTask } from "../types";
 
+const STAGE_PAGE_SIZE = 500;
+
+// Fetch every item of one analysis stage, a page at a time
+const getStageItems = async (path: string) => {
+  const items: unknown[] = [];
+  let offset: number | null = 0;
+  while (offset !== null) {
+    const response = await api.get(path, {
+      params: { offset, limit: STAGE_PAGE_SIZE },
+    });
+    items.push(...response.data.items);
+    offset = response.data.next_offset;
+  }
+  return items;
+};
+
 export const analysisService = {
   // Video Analysis
   startVideoAnalysis: async (videoId: string): Promise<{ task_id: string }> => {
@@ -13,30 +29,20 @@ export const analysisService = {
     return response.data;
   },
 
-  getVideoChunks: async (videoId: string) => {
-    const response = await api.get(`/api/videos/${videoId}/analysis`);
-    return response.data?.chunks || [];
-  },
+  getVideoChunks: async (videoId: string) =>
+    getStageItems(`/api/videos/${videoId}/analysis/chunks`),
 
-  getVideoInferences: async (videoId: string) => {
-    const response = await api.get(`/api/videos/${videoId}/analysis`);
-    return response.data?.inferences || [];
-  },
+  getVideoInferences: async (videoId: string) =>
+    getStageItems(`/api/videos/${videoId}/analysis/inferences`),
 
-  getVideoPatterns: async (videoId: string) => {
-    const response = await api.get(`/api/videos/${videoId}/analysis`);
-    return response.data?.patterns || [];
-  },
+  getVideoPatterns: async (videoId: string) =>
+    getStageItems(`/api/videos/${videoId}/analysis/patterns`),
 
-  getVideoInsights: async (videoId: string) => {
-    const response = await api.get(`/api/videos/${videoId}/analysis`);
-    return response.data?.insights || [];
-  },
+  getVideoInsights: async (videoId: string) =>
+    getStageItems(`/api/videos/${videoId}/analysis/insights`),
 
-  getVideoPrinciples: async (videoId: string) => {
-    const response = await api.get(`/api/videos/${videoId}/analysis`);
-    return response.data?.design_principles || [];
-  },
+  getVideoPrinciples: async (videoId: string) =>
+    getStageItems(`/api/videos/${videoId}/analysis/design_principles`),
 
   // Project Analysis (Cross-Video)
   startProjectAnalysis: async (
@@ -51,20 +57,14 @@ export const analysisService = {
     return response.data;
   },
 
-  getMetaPatterns: async (projectId: string) => {
-    const response = await api.get(`/api/projects/${projectId}/analysis`);
-    return response.data?.cross_video_patterns || [];
-  },
+  getMetaPatterns: async (projectId: string) =>
+    getStageItems(`/api/projects/${projectId}/analysis/cross_video_patterns`),
 
-  getCrossInsights: async (projectId: string) => {
-    const response = await api.get(`/api/projects/${projectId}/analysis`);
-    return response.data?.cross_video_insights || [];
-  },
+  getCrossInsights: async (projectId: string) =>
+    getStageItems(`/api/projects/${projectId}/analysis/cross_video_insights`),
 
-  getSystemPrinciples: async (projectId: string) => {
-    const response = await api.get(`/api/projects/${projectId}/analysis`);
-    return response.data?.cross_video_principles || [];
-  },
+  getSystemPrinciples: async (projectId: string) =>
+    getStageItems(`/api/projects/${projectId}/analysis/cross_video_principles`),
 
   // Task monitoring
   getTaskStatus: async (taskId: string): Promise<AnalysisTask> => {
@@ -1,5 +1,10 @@
 import api from "./api";
-import type { Project, CreateProjectDto, UpdateProjectDto } from "../types";
+import type {
+  Project,
+  ProjectSummaryPage,
+  CreateProjectDto,
+  UpdateProjectDto,
+} from "../types";
 
 export const projectsService = {
   // Get all projects
@@ -8,6 +13,26 @@ export const projectsService = {
     return response.data;
   },
 
+  // Get one page of projects with dashboard counts
+  getSummary: async (cursor?: string): Promise<ProjectSummaryPage> => {
+    const response = await api.get("/api/projects/summary", {
+      params: { cursor, limit: 100 },
+    });
+    return response.data;
+  },
+
+  // Get all projects with dashboard counts, following next_cursor until the last page
+  getAllSummaries: async (): Promise<Project[]> => {
+    const projects: Project[] = [];
+    let cursor: string | undefined;
+    do {
+      const page = await projectsService.getSummary(cursor);
+      projects.push(...page.items);
+      cursor = page.next_cursor ?? undefined;
+    } while (cursor);
+    return projects;
+  },
+
   // Get single project
   getById: async (id: string): Promise<Project> => {
     const response = await api.get(`/api/projects/${id}/`);
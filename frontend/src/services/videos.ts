@@ -1,11 +1,106 @@
+import axios from "axios";
 import api from "./api";
 import type { Video } from "../types";
 
+const UPLOAD_CONCURRENCY = 4;
+const PART_MAX_ATTEMPTS = 3;
+
+interface UploadedPart {
+  part_number: number;
+  etag: string;
+  size?: number;
+}
+
+interface MultipartUpload {
+  upload_id: string;
+  s3_key: string;
+  part_size_bytes: number;
+  part_count: number;
+  parts: { part_number: number; url: string }[];
+  uploaded_parts: UploadedPart[];
+}
+
+// PUT each part to its presigned URL, a few at a time, retrying failed parts.
+// The S3 bucket's CORS rules must expose the ETag header.
+async function uploadParts(
+  upload: MultipartUpload,
+  file: File,
+  onProgress?: (progress: number) => void
+): Promise<UploadedPart[]> {
+  const completed: UploadedPart[] = [...upload.uploaded_parts];
+  const loaded = new Map<number, number>(
+    upload.uploaded_parts.map((part) => [part.part_number, part.size ?? 0])
+  );
+  const reportProgress = () => {
+    if (!onProgress) return;
+    let total = 0;
+    loaded.forEach((bytes) => (total += bytes));
+    onProgress(Math.round((total * 100) / file.size));
+  };
+
+  const queue = [...upload.parts];
+  const worker = async () => {
+    for (let part = queue.shift(); part; part = queue.shift()) {
+      const start = (part.part_number - 1) * upload.part_size_bytes;
+      const blob = file.slice(start, start + upload.part_size_bytes);
+
+      for (let attempt = 1; ; attempt++) {
+        try {
+          const partNumber = part.part_number;
+          const response = await axios.put(part.url, blob, {
+            onUploadProgress: (progressEvent) => {
+              loaded.set(partNumber, progressEvent.loaded);
+              reportProgress();
+            },
+          });
+          completed.push({ part_number: partNumber, etag: response.headers.etag });
+          loaded.set(partNumber, blob.size);
+          reportProgress();
+          break;
+        } catch (error) {
+          loaded.set(part.part_number, 0);
+          if (attempt >= PART_MAX_ATTEMPTS) throw error;
+        }
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(UPLOAD_CONCURRENCY, queue.length) }, worker)
+  );
+  return completed;
+}
+
+// Duration in whole seconds from the file's metadata (undefined if the browser can't read it)
+function readDuration(file: File): Promise<number | undefined> {
+  return new Promise((resolve) => {
+    const video = document.createElement("video");
+    const url = URL.createObjectURL(file);
+    const done = (duration?: number) => {
+      URL.revokeObjectURL(url);
+      resolve(duration && Number.isFinite(duration) ? Math.round(duration) : undefined);
+    };
+    video.preload = "metadata";
+    video.onloadedmetadata = () => done(video.duration);
+    video.onerror = () => done();
+    video.src = url;
+  });
+}
+
 export const videosService = {
   // Get videos for a project
   getByProject: async (projectId: string): Promise<Video[]> => {
-    const response = await api.get(`/api/projects/${projectId}/videos/`);
-    return response.data;
+    // Follow X-Next-Cursor until the last page
+    const videos: Video[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await api.get(`/api/projects/${projectId}/videos/`, {
+        params: { cursor, limit: 500 },
+      });
+      videos.push(...response.data);
+      cursor = response.headers["x-next-cursor"];
+    } while (cursor);
+    return videos;
   },
 
   // Get single video
@@ -14,33 +109,35 @@ export const videosService = {
     return response.data;
   },
 
-  // Upload video (multipart form data)
+  // Upload video directly to S3 in parts (no video bytes go through the API)
   upload: async (
     projectId: string,
     file: File,
     onProgress?: (progress: number) => void
   ): Promise<Video> => {
-    const formData = new FormData();
-    formData.append("file", file);
-
-    const response = await api.post(
-      `/api/videos/${projectId}/upload/`,
-      formData,
-      {
-        headers: {
-          "Content-Type": "multipart/form-data",
-        },
-        onUploadProgress: (progressEvent) => {
-          if (progressEvent.total && onProgress) {
-            const percentCompleted = Math.round(
-              (progressEvent.loaded * 100) / progressEvent.total
-            );
-            onProgress(percentCompleted);
-          }
-        },
-      }
+    const { data: upload } = await api.post<MultipartUpload>(
+      `/api/videos/${projectId}/uploads`,
+      { filename: file.name, file_size_bytes: file.size }
     );
-    return response.data;
+    const uploadPath = `/api/videos/${projectId}/uploads/${encodeURIComponent(upload.upload_id)}`;
+
+    try {
+      const [parts, duration_seconds] = await Promise.all([
+        uploadParts(upload, file, onProgress),
+        readDuration(file),
+      ]);
+      const response = await api.post(
+        `${uploadPath}/complete`,
+        { s3_key: upload.s3_key, filename: file.name, parts, duration_seconds },
+        { timeout: 120000 }
+      );
+      return response.data;
+    } catch (error) {
+      await api
+        .delete(uploadPath, { params: { s3_key: upload.s3_key } })
+        .catch(() => undefined);
+      throw error;
+    }
   },
 
   // Delete video
@@ -17,6 +17,18 @@ export interface Project {
   status: ProjectStatus;
   error_message?: string | null;  // For error state details
   videos?: Video[];
+  // Dashboard counts (present when loaded from /api/projects/summary)
+  video_count?: number;
+  videos_by_status?: Record<string, number>;
+  transcripts_completed?: number;
+  analyses_completed?: number;
+  analysis_status?: string | null;
+  last_activity_at?: string | null;
+}
+
+export interface ProjectSummaryPage {
+  items: Project[];
+  next_cursor: string | null;
 }
 
 export interface CreateProjectDto {